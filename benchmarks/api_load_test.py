@@ -0,0 +1,150 @@
+"""
+Load test for the SafeHome HTTP/JSON API
+
+Starts a System on a temporary database behind the threaded API server
+(or targets an already running server with --url), then hammers the read
+endpoints from several client threads and reports requests per second and
+latency percentiles.
+
+Usage:
+    python benchmarks/api_load_test.py [--threads 8] [--duration 5]
+    python benchmarks/api_load_test.py --url http://127.0.0.1:8350 --token <token>
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+DEFAULT_PATHS = (
+    "/api/status",
+    "/api/sensors",
+    "/api/zones",
+    "/api/cameras",
+    "/api/logs?page=1&per_page=50",
+)
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
+
+
+def run_load(
+    base_url: str, paths, threads: int, duration: float, token: str = ""
+) -> dict:
+    """
+    Issue GET requests round-robin over paths from many threads
+
+    Args:
+        token: Session token from POST /api/session, sent as a Bearer header
+
+    Returns:
+        Dictionary with request count, errors, rps and latency percentiles (ms)
+    """
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def worker(offset):
+        local = []
+        local_errors = 0
+        i = offset
+        while time.perf_counter() < deadline:
+            url = base_url + paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                req = urllib.request.Request(url, headers=headers)
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    response.read()
+            except Exception:
+                local_errors += 1
+                continue
+            local.append((time.perf_counter() - start) * 1000.0)
+        with lock:
+            latencies.extend(local)
+            errors[0] += local_errors
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "threads": threads,
+        "duration_s": round(elapsed, 3),
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p99_ms": round(_percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SafeHome API load test")
+    parser.add_argument("--url", help="target a running server instead")
+    parser.add_argument("--token", default="", help="session token for --url")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--cache-ttl", type=float, default=0.5)
+    parser.add_argument("--sensors", type=int, default=10, help="sensors to provision")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        result = run_load(
+            args.url.rstrip("/"), DEFAULT_PATHS, args.threads, args.duration, args.token
+        )
+        print(json.dumps(result, indent=2))
+        return 0
+
+    os.environ.setdefault("SAFEHOME_HEADLESS", "1")
+    from safehome.core.system import System
+    from safehome.interface.web import make_api_server
+
+    with tempfile.TemporaryDirectory() as tmp:
+        system = System(db_path=os.path.join(tmp, "safehome.db"), lazy=True)
+        for n in range(args.sensors):
+            kind = "MOTION" if n % 5 == 4 else "WINDOOR"
+            system.sensor_controller.add_sensor(kind, f"Load Sensor {n + 1}")
+        server = make_api_server(system, port=0, cache_ttl=args.cache_ttl, quiet=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            token = system.create_session("admin", "webpass1:webpass2", "WEB")
+            result = run_load(
+                base_url, DEFAULT_PATHS, args.threads, args.duration, token
+            )
+            result["cache_ttl"] = args.cache_ttl
+            print(json.dumps(result, indent=2))
+        finally:
+            server.shutdown()
+            server.server_close()
+            system.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
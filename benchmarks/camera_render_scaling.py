@@ -0,0 +1,115 @@
+"""
+Multi-camera render scaling benchmark
+
+Renders N camera views (cycling through the bundled camera images with
+varied pan/tilt/zoom) once in-process and then with CameraRenderPool at
+1..max worker processes, reporting frames per second and speedup over
+the single-worker pool. Source images are shared with the workers
+through shared memory, exactly as CameraController.render_all() does.
+
+Usage:
+    python benchmarks/camera_render_scaling.py [--cameras 24] [--rounds 5]
+        [--max-workers 8] [--format JPEG]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from safehome.device.camera.camera_render import (  # noqa: E402
+    CameraRenderPool,
+    compose_view,
+    encode_image,
+)
+
+SOURCES = [str(ROOT_DIR / "assets" / "images" / f"camera{n}.jpg") for n in (1, 2, 3)]
+
+
+def make_states(cameras: int):
+    return [
+        {
+            "camera_id": camera_id,
+            "source_path": SOURCES[camera_id % len(SOURCES)],
+            "time": camera_id % 100,
+            "pan": camera_id % 11 - 5,
+            "tilt": camera_id % 7 - 3,
+            "zoom": camera_id % 9 + 1,
+        }
+        for camera_id in range(1, cameras + 1)
+    ]
+
+
+def run_serial(states, rounds: int, image_format: str) -> float:
+    """Frames per second rendering in this process only"""
+    from PIL import Image, ImageFont
+
+    font = ImageFont.load_default()
+    sources = {path: Image.open(path).convert("RGB") for path in SOURCES}
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for s in states:
+            image = compose_view(
+                sources[s["source_path"]],
+                s["time"],
+                s["pan"],
+                s["tilt"],
+                s["zoom"],
+                font,
+            )
+            encode_image(image, None, image_format)
+    return len(states) * rounds / (time.perf_counter() - started)
+
+
+def run_pool(states, rounds: int, workers: int, image_format: str) -> float:
+    """Frames per second through a CameraRenderPool with N workers"""
+    pool = CameraRenderPool(max_workers=workers)
+    try:
+        pool.render(states, image_format=image_format)  # start workers, map sources
+        started = time.perf_counter()
+        for _ in range(rounds):
+            pool.render(states, image_format=image_format)
+        return len(states) * rounds / (time.perf_counter() - started)
+    finally:
+        pool.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Camera render scaling benchmark")
+    parser.add_argument("--cameras", type=int, default=24)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--format", default="JPEG")
+    args = parser.parse_args(argv)
+
+    states = make_states(args.cameras)
+    result = {
+        "cameras": args.cameras,
+        "rounds": args.rounds,
+        "cpu_count": os.cpu_count(),
+        "serial_fps": round(run_serial(states, args.rounds, args.format), 1),
+        "pool": [],
+    }
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        fps = run_pool(states, args.rounds, workers, args.format)
+        baseline = baseline or fps
+        result["pool"].append(
+            {
+                "workers": workers,
+                "fps": round(fps, 1),
+                "speedup": round(fps / baseline, 2),
+            }
+        )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+"""
+SafeHome hot-path benchmark suite
+
+Times the paths that run on every poll, frame or request with a stdlib
+timeit harness and writes the results as JSON so runs can be compared:
+
+    poll_sensors[N]       SensorController.poll_sensors() over N sensors
+    get_view[pan,tilt,zoom]
+                          DeviceCamera.get_view() per PTZ setting
+    add_log               LogManager.add_log() (file + SQLite), plain and
+                          inside db.batch()
+    get_event_logs[...]   DatabaseManager.get_event_logs() on a table of
+                          --log-rows rows (first page, type filter, keyset
+                          page, deep offset page, one-day window)
+    arm_system            System.arm_system(AWAY) with --arm-sensors sensors
+    system_startup[...]   System() on a fresh and on an existing database
+    dashboard_frame       one MainDashboard update tick plus Tk redraw
+                          (skipped without a display; use Xvfb)
+
+Every timing is reported per call in milliseconds (mean, p50, p99, min,
+max over the repeats). --compare adds the p50 ratio against an earlier
+result file (> 1.0 means slower now).
+
+Usage:
+    python benchmarks/hot_paths.py [--output results.json]
+    python benchmarks/hot_paths.py --quick --only poll_sensors,get_view
+    python benchmarks/hot_paths.py --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("SAFEHOME_HEADLESS", "1")
+
+from safehome.configuration.log_manager import LogManager  # noqa: E402
+from safehome.configuration.safehome_mode import SafeHomeMode  # noqa: E402
+from safehome.configuration.storage_manager import StorageManager  # noqa: E402
+from safehome.database.db_manager import DatabaseManager  # noqa: E402
+from safehome.device.camera.device_camera import DeviceCamera  # noqa: E402
+from safehome.device.sensor.motion_sensor import MotionSensor  # noqa: E402
+from safehome.device.sensor.sensor_controller import SensorController  # noqa: E402
+from safehome.device.sensor.windoor_sensor import WindowDoorSensor  # noqa: E402
+
+CASES = {}  # name -> function(args, workdir) -> {result name: result}
+
+PTZ_SETTINGS = ((0, 0, 1), (0, 0, 2), (-5, 0, 5), (5, 5, 9))
+
+
+def case(name: str):
+    """Register a benchmark case"""
+
+    def register(fn):
+        CASES[name] = fn
+        return fn
+
+    return register
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
+
+
+def _stats(samples) -> dict:
+    """Summarize per-call durations (seconds) in milliseconds"""
+    values = sorted(samples)
+    return {
+        "runs": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 4),
+        "p50_ms": round(_percentile(values, 50) * 1000, 4),
+        "p99_ms": round(_percentile(values, 99) * 1000, 4),
+        "min_ms": round(values[0] * 1000, 4),
+        "max_ms": round(values[-1] * 1000, 4),
+    }
+
+
+def _timeit(fn, repeat: int, number: int = 0) -> dict:
+    """
+    Time fn() with timeit: `repeat` runs of `number` calls each
+    number=0 picks the count timeit's autorange() settles on (>= 0.2 s).
+    """
+    timer = timeit.Timer(fn)
+    if number <= 0:
+        number, _ = timer.autorange()
+    runs = timer.repeat(repeat=repeat, number=number)
+    result = _stats([total / number for total in runs])
+    result["calls_per_run"] = number
+    return result
+
+
+def _sample(fn, runs: int, setup=None) -> dict:
+    """Time single calls of fn(), running the untimed setup() before each"""
+    samples = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return _stats(samples)
+
+
+def _open_db(path: Path) -> DatabaseManager:
+    db = DatabaseManager(str(path))
+    db.connect()
+    db.initialize_schema()
+    return db
+
+
+def _make_system(workdir: Path, lazy: bool = True):
+    from safehome.core.system import System
+
+    system = System(db_path=str(workdir / "safehome.db"), lazy=lazy)
+    system.config.logger.log_file = str(workdir / "events.log")
+    return system
+
+
+@case("poll_sensors")
+def bench_poll_sensors(args, workdir):
+    results = {}
+    for count in args.sensor_counts:
+        controller = SensorController()
+        for sensor_id in range(1, count + 1):
+            if sensor_id % 4:
+                sensor = WindowDoorSensor(sensor_id, f"Door {sensor_id}")
+            else:
+                sensor = MotionSensor(sensor_id, f"Room {sensor_id}")
+            if sensor_id % 2:
+                sensor.arm()  # half the house armed, nothing tripped
+            controller.sensors[sensor_id] = sensor
+        result = _timeit(controller.poll_sensors, args.repeat)
+        result["sensors_per_second"] = round(count / (result["p50_ms"] / 1000))
+        results[f"poll_sensors[{count}]"] = result
+    return results
+
+
+@case("get_view")
+def bench_get_view(args, workdir):
+    previous = os.getcwd()
+    os.chdir(ROOT_DIR)  # camera images are looked up relative to the repo
+    try:
+        camera = DeviceCamera()
+        camera.set_id(1)
+        camera._running = False  # keep the overlay clock still
+        camera.get_view()  # decode the source image and load the font
+        results = {}
+        for pan, tilt, zoom in PTZ_SETTINGS:
+            camera.pan, camera.tilt, camera.zoom = pan, tilt, zoom
+            results[f"get_view[{pan},{tilt},{zoom}]"] = _timeit(
+                camera.get_view, args.repeat
+            )
+    finally:
+        os.chdir(previous)
+    return results
+
+
+@case("add_log")
+def bench_add_log(args, workdir):
+    db = _open_db(workdir / "add_log.db")
+    logger = LogManager(storage_manager=StorageManager(db))
+    logger.log_file = str(workdir / "add_log.log")
+    results = {}
+    try:
+        samples = []
+        for n in range(args.log_writes):
+            started = time.perf_counter()
+            logger.add_log(f"benchmark entry {n}", source="Bench")
+            samples.append(time.perf_counter() - started)
+        result = _stats(samples)
+        result["logs_per_second"] = round(len(samples) / sum(samples))
+        results["add_log"] = result
+
+        started = time.perf_counter()
+        with db.batch():
+            for n in range(args.log_writes):
+                logger.add_log(f"batched entry {n}", source="Bench")
+        elapsed = time.perf_counter() - started
+        results["add_log[batch]"] = {
+            "runs": args.log_writes,
+            "mean_ms": round(elapsed / args.log_writes * 1000, 4),
+            "logs_per_second": round(args.log_writes / elapsed),
+        }
+    finally:
+        db.disconnect()
+    return results
+
+
+def _fill_event_logs(db: DatabaseManager, rows: int):
+    """Insert rows spread over a year, newest last (1 in 20 ALARM)"""
+    start = datetime.now() - timedelta(days=365)
+    step = timedelta(days=365) / max(1, rows)
+    chunk = 50_000
+    with db.batch():
+        for first in range(0, rows, chunk):
+            db.execute_many(
+                """
+                INSERT INTO event_logs
+                (event_type, event_message, sensor_id, camera_id, zone_id,
+                 source, event_timestamp)
+                VALUES (?, ?, NULL, NULL, NULL, ?, ?)
+                """,
+                [
+                    (
+                        "ALARM" if n % 20 == 0 else "INFO",
+                        f"Event {n}",
+                        "Bench",
+                        (start + step * n).strftime("%Y-%m-%d %H:%M:%S"),
+                    )
+                    for n in range(first, min(rows, first + chunk))
+                ],
+            )
+
+
+@case("get_event_logs")
+def bench_get_event_logs(args, workdir):
+    db = _open_db(workdir / "event_logs.db")
+    try:
+        started = time.perf_counter()
+        _fill_event_logs(db, args.log_rows)
+        fill_seconds = time.perf_counter() - started
+        middle = args.log_rows // 2
+        day = (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d")
+        queries = {
+            "first_page": lambda: db.get_event_logs(limit=100),
+            "type_alarm": lambda: db.get_event_logs(event_type="ALARM", limit=100),
+            "keyset_middle": lambda: db.get_event_logs(limit=100, before_log_id=middle),
+            "offset_middle": lambda: db.get_event_logs(limit=100, offset=middle),
+            "one_day": lambda: db.get_event_logs(
+                start_date=f"{day} 00:00:00", end_date=f"{day} 23:59:59", limit=1000
+            ),
+        }
+        results = {}
+        for label, query in queries.items():
+            result = _timeit(query, args.repeat)
+            result["rows"] = args.log_rows
+            results[f"get_event_logs[{label}]"] = result
+        results["get_event_logs[fill]"] = {
+            "rows": args.log_rows,
+            "seconds": round(fill_seconds, 2),
+        }
+    finally:
+        db.disconnect()
+    return results
+
+
+@case("arm_system")
+def bench_arm_system(args, workdir):
+    system = _make_system(workdir / "arm")
+    try:
+        sensor_ids = []
+        for n in range(args.arm_sensors):
+            kind = "MOTION" if n % 4 == 3 else "WINDOOR"
+            sensor = system.sensor_controller.add_sensor(kind, f"Arm Sensor {n + 1}")
+            sensor_ids.append(sensor.sensor_id)
+        system.config.storage.save_mode_sensor_mapping("AWAY", sensor_ids)
+        result = _sample(
+            lambda: system.arm_system(SafeHomeMode.AWAY),
+            args.runs,
+            setup=system.disarm_system,
+        )
+        result["sensors"] = args.arm_sensors
+    finally:
+        system.shutdown()
+    return {"arm_system": result}
+
+
+@case("system_startup")
+def bench_system_startup(args, workdir):
+    results = {}
+    fresh = iter(range(args.runs * 2))
+
+    def start(directory: Path, lazy: bool):
+        directory.mkdir(parents=True, exist_ok=True)
+        _make_system(directory, lazy=lazy).shutdown()
+
+    results["system_startup[fresh_db]"] = _sample(
+        lambda: start(workdir / f"fresh{next(fresh)}", lazy=True), args.runs
+    )
+    for lazy in (True, False):
+        existing = workdir / f"existing_{lazy}"
+        start(existing, lazy)  # migrations and defaults done once
+        label = "lazy" if lazy else "eager"
+        results[f"system_startup[{label}]"] = _sample(
+            lambda: start(existing, lazy), args.runs
+        )
+    return results
+
+
+@case("dashboard_frame")
+def bench_dashboard_frame(args, workdir):
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+    except Exception as e:  # no display, or Tk not installed
+        return {"dashboard_frame": {"skipped": f"Tk unavailable: {e}"}}
+
+    from safehome.interface.dashboard.main_dashboard import MainDashboard
+
+    class BenchDashboard(MainDashboard):
+        def _update_loop(self):
+            pass  # ticks are driven by the benchmark
+
+    root.withdraw()
+    system = _make_system(workdir / "dashboard")
+    try:
+        dashboard = BenchDashboard(system, root, "admin")
+
+        def frame():
+            dashboard._update_cameras()
+            dashboard._update_sensors()
+            dashboard._update_header()
+            root.update()
+
+        frame()  # first frame builds the camera images
+        result = _sample(frame, args.frames)
+        result["cameras"] = len(system.camera_controller.cameras)
+        result["sensors"] = len(system.sensor_controller.sensors)
+        dashboard.destroy()
+    finally:
+        system.shutdown()
+        root.destroy()
+    return {"dashboard_frame": result}
+
+
+def compare(results: dict, baseline: dict) -> dict:
+    """p50 ratio (now / baseline) of every result present in both runs"""
+    ratios = {}
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("p50_ms")
+        now = result.get("p50_ms")
+        if before and now is not None:
+            ratios[name] = round(now / before, 3)
+    return ratios
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SafeHome hot-path benchmarks")
+    parser.add_argument("--only", help="comma-separated cases: " + ", ".join(CASES))
+    parser.add_argument("--quick", action="store_true", help="smaller data sets")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit repeats")
+    parser.add_argument("--runs", type=int, default=10, help="single-call samples")
+    parser.add_argument("--sensor-counts", default="10,1000,100000")
+    parser.add_argument("--log-writes", type=int, default=2000)
+    parser.add_argument("--log-rows", type=int, default=1_000_000)
+    parser.add_argument("--arm-sensors", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="earlier JSON results to compare with")
+    args = parser.parse_args(argv)
+    args.sensor_counts = [int(n) for n in args.sensor_counts.split(",")]
+    if args.quick:
+        args.sensor_counts = [n for n in args.sensor_counts if n <= 10_000] or [10]
+        args.log_rows = min(args.log_rows, 100_000)
+        args.log_writes = min(args.log_writes, 500)
+        args.repeat = min(args.repeat, 3)
+        args.runs = min(args.runs, 5)
+        args.frames = min(args.frames, 10)
+
+    selected = list(CASES)
+    if args.only:
+        selected = [name.strip() for name in args.only.split(",")]
+        unknown = [name for name in selected if name not in CASES]
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    results = {}
+    original_config = StorageManager.CONFIG_FILE
+    with tempfile.TemporaryDirectory() as tmp:
+        StorageManager.CONFIG_FILE = os.path.join(tmp, "safehome_config.json")
+        try:
+            for name in selected:
+                workdir = Path(tmp) / name
+                workdir.mkdir()
+                print(f"running {name} ...", file=sys.stderr)
+                # Alarm, camera and log messages would drown the results
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results.update(CASES[name](args, workdir))
+        finally:
+            StorageManager.CONFIG_FILE = original_config
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": results,
+    }
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["p50_ratio"] = compare(results, json.load(f)["results"])
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Intrusion critical-path latency report
+
+Starts a System on a temporary database with its real polling thread,
+then trips sensors one at a time through the hardware intrude() call and
+waits for each intrusion to reach the monitoring service. Every intrusion
+leaves a trace (intrude -> detected -> handled -> log_persisted ->
+entry_delay_elapsed -> alarm_ring -> monitoring_called); the report breaks
+the end-to-end latency down per hop across all of them.
+
+The poll interval and entry delay default to near zero so the report
+shows the processing cost of each hop; pass the production values
+(--poll-interval 1 --entry-delay 300) to see the wall-clock path instead.
+
+Usage:
+    python benchmarks/intrusion_latency_report.py [--intrusions 200]
+    python benchmarks/intrusion_latency_report.py --table --export traces.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def _wait_for_trace(tracer, sensor_id: int, after_id: int, timeout: float):
+    """
+    Wait for the first trace of sensor_id newer than after_id to reach the
+    monitoring call (or be cancelled)
+    """
+    from safehome.core.tracing import STAGE_MONITORING
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for trace in tracer.get_traces():
+            if trace.incident_id <= after_id or trace.sensor_id != sensor_id:
+                continue
+            if trace.get_span(STAGE_MONITORING) or trace.outcome == "cancelled":
+                return trace
+            break  # first detection still in flight
+        time.sleep(0.0005)
+    return None
+
+
+def run(system, intrusions: int, timeout: float) -> dict:
+    """
+    Trip sensors round-robin and summarize one trace per intrusion
+    A sensor left open is detected again on every poll; only the trace
+    of the first detection counts.
+    """
+    sensors = list(system.sensor_controller.sensors.values())
+    traces = []
+    started = time.perf_counter()
+    for n in range(intrusions):
+        sensor = sensors[n % len(sensors)]
+        buffered = system.tracer.get_traces()
+        last_id = buffered[-1].incident_id if buffered else 0
+        sensor.hardware.intrude()
+        trace = _wait_for_trace(system.tracer, sensor.sensor_id, last_id, timeout)
+        sensor.hardware.release()
+        system.alarm.stop()
+        if trace is not None:
+            traces.append(trace)
+    elapsed = time.perf_counter() - started
+    return {
+        "intrusions": intrusions,
+        "completed": len(traces),
+        "timed_out": intrusions - len(traces),
+        "elapsed_s": round(elapsed, 3),
+        "breakdown": system.tracer.stage_breakdown(traces),
+        "report": system.tracer.report(traces),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Intrusion latency report")
+    parser.add_argument("--intrusions", type=int, default=200)
+    parser.add_argument("--sensors", type=int, default=10)
+    parser.add_argument("--poll-interval", type=float, default=0.001)
+    parser.add_argument("--entry-delay", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=10.0, help="per intrusion")
+    parser.add_argument("--table", action="store_true", help="print a table")
+    parser.add_argument("--export", help="write all traces as JSON to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SAFEHOME_HEADLESS", "1")
+    from safehome.core.system import System
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Alarm and monitoring messages would drown the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = System(db_path=os.path.join(tmp, "safehome.db"), lazy=True)
+            system.tracer.clear()
+            for n in range(args.sensors):
+                kind = "MOTION" if n % 2 else "WINDOOR"
+                sensor = system.sensor_controller.add_sensor(
+                    kind, f"Trace Sensor {n + 1}"
+                )
+                sensor.arm()
+            system.config.settings.entry_delay = args.entry_delay
+            system.poll_interval = args.poll_interval
+            system.turn_on()
+            try:
+                result = run(system, args.intrusions, args.timeout)
+                if args.export:
+                    system.tracer.export_json(args.export)
+            finally:
+                system.shutdown()
+    report = result.pop("report")
+    if args.table:
+        print(report)
+    else:
+        result["poll_interval_s"] = args.poll_interval
+        result["entry_delay_s"] = args.entry_delay
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Login audit latency benchmark
+
+Runs validate_credentials() from several threads against a LoginManager
+backed by a temporary SQLite database, once per audit guarantee ("sync"
+commits every login_sessions row on the caller's thread, "async" hands it
+to the batch writer), and reports per-call latency percentiles plus the
+time the async writer needs to flush what is left. Rate limits are lifted
+so every attempt reaches the password check and the audit log.
+
+Usage:
+    python benchmarks/login_audit_latency.py [--threads 8] [--attempts 500]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from safehome.configuration.login_manager import LoginManager  # noqa: E402
+from safehome.configuration.storage_manager import StorageManager  # noqa: E402
+from safehome.configuration.system_settings import SystemSettings  # noqa: E402
+from safehome.database.db_manager import DatabaseManager  # noqa: E402
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
+
+
+def run(guarantee: str, threads: int, attempts: int, workdir: Path) -> dict:
+    """Latency of validate_credentials under concurrent load (ms)"""
+    db = DatabaseManager(str(workdir / f"audit_{guarantee}.db"))
+    db.connect()
+    db.initialize_schema()
+    storage = StorageManager(db)
+    lm = LoginManager(
+        SystemSettings(max_login_attempts=10**9),
+        storage_manager=storage,
+        audit_guarantee=guarantee,
+    )
+    lm.user_limiter.capacity = lm.interface_limiter.capacity = 10**9
+
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(offset):
+        local = []
+        for n in range(attempts):
+            password = "webpass1:webpass2" if (n + offset) % 4 else "wrong:pass"
+            started = time.perf_counter()
+            lm.validate_credentials(f"user{offset}", password, "WEB")
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+    flush_started = time.perf_counter()
+    lm.close_audit()
+    flush_ms = (time.perf_counter() - flush_started) * 1000
+    rows = db.execute_query("SELECT COUNT(*) AS n FROM login_sessions", fetch_one=True)[
+        "n"
+    ]
+    db.disconnect()
+
+    latencies.sort()
+    return {
+        "guarantee": guarantee,
+        "calls": len(latencies),
+        "rows_written": rows,
+        "calls_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p99_ms": round(_percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3),
+        "final_flush_ms": round(flush_ms, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Login audit latency benchmark")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [
+            run(guarantee, args.threads, args.attempts, Path(tmp))
+            for guarantee in ("sync", "async")
+        ]
+    print(json.dumps({"threads": args.threads, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Camera motion analytics CPU benchmark
+
+Renders a sequence of camera views (panning across a bundled camera image)
+and measures the CPU time per frame of the analytics stage alone: the
+grayscale/downsample step and the frame-difference score. Each available
+backend (numpy when installed, pillow always) is measured at several
+downsample factors; the view rendering itself is excluded.
+
+Usage:
+    python benchmarks/motion_analytics_bench.py [--frames 200]
+        [--downsample 1 4 8 16]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from safehome.device.camera.camera_render import compose_view  # noqa: E402
+from safehome.device.camera.motion_analytics import (  # noqa: E402
+    get_numpy,
+    motion_score,
+    prepare_frame,
+)
+
+SOURCE = ROOT_DIR / "assets" / "images" / "camera1.jpg"
+
+
+def make_views(count: int):
+    """Pre-render views so only the analytics cost is measured"""
+    from PIL import Image, ImageFont
+
+    font = ImageFont.load_default()
+    source = Image.open(SOURCE).convert("RGB")
+    pans = list(range(-5, 6)) + list(range(4, -5, -1))
+    return [
+        compose_view(source, n % 100, pans[n % len(pans)], 0, 2, font)
+        for n in range(count)
+    ]
+
+
+def measure(views, backend: str, downsample: int) -> dict:
+    """CPU milliseconds per frame for prepare_frame + motion_score"""
+    previous = prepare_frame(views[0], downsample, backend)
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    for view in views[1:]:
+        frame = prepare_frame(view, downsample, backend)
+        motion_score(previous, frame)
+        previous = frame
+    frames = len(views) - 1
+    return {
+        "backend": backend,
+        "downsample": downsample,
+        "cpu_ms_per_frame": round(
+            (time.process_time() - cpu_started) * 1000 / frames, 3
+        ),
+        "wall_ms_per_frame": round(
+            (time.perf_counter() - wall_started) * 1000 / frames, 3
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Motion analytics CPU benchmark")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--downsample", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args(argv)
+
+    backends = ["numpy", "pillow"] if get_numpy() is not None else ["pillow"]
+    views = make_views(max(2, args.frames))
+    result = {
+        "frames": len(views),
+        "frame_size": list(views[0].size),
+        "numpy_available": get_numpy() is not None,
+        "results": [
+            measure(views, backend, factor)
+            for backend in backends
+            for factor in args.downsample
+        ],
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
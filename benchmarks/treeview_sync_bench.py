@@ -0,0 +1,120 @@
+"""
+Tk frame-time benchmark for the sensor Treeview refresh
+
+Fills a ttk.Treeview with N sensors (default 5,000) and times one refresh
+tick three ways: the old delete-everything-and-reinsert rebuild, a
+ReconcilingTable sync where 1% of sensors changed, and a sync with an
+unchanged state version. Times include an update_idletasks() redraw.
+
+Requires a display (or Xvfb).
+
+Usage:
+    python benchmarks/treeview_sync_bench.py [--sensors 5000] [--ticks 20]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from tkinter import ttk
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from safehome.interface.table_model import ReconcilingTable  # noqa: E402
+
+COLUMNS = ("Type", "Location", "Zone", "Status")
+
+
+def _make_rows(count: int, changed_every: int = 0, tick: int = 0):
+    rows = []
+    for sensor_id in range(1, count + 1):
+        armed = sensor_id % 2 == 0
+        if changed_every and sensor_id % changed_every == 0 and tick % 2:
+            armed = not armed
+        rows.append(
+            (
+                sensor_id,
+                (
+                    "WINDOOR" if sensor_id % 3 else "MOTION",
+                    f"Room {sensor_id}",
+                    f"Zone {sensor_id % 8 + 1}",
+                    "● Armed" if armed else "○ Disarmed",
+                ),
+            )
+        )
+    return rows
+
+
+def _time_ticks(root, ticks: int, step) -> dict:
+    samples = []
+    for tick in range(ticks):
+        started = time.perf_counter()
+        step(tick)
+        root.update_idletasks()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "max_ms": round(samples[-1], 2),
+    }
+
+
+def run(sensors: int, ticks: int) -> dict:
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        tree = ttk.Treeview(root, columns=COLUMNS, show="headings")
+
+        def rebuild(tick):
+            tree.delete(*tree.get_children())
+            for _, values in _make_rows(sensors, 100, tick):
+                tree.insert("", "end", values=values)
+
+        rebuild_result = _time_ticks(root, ticks, rebuild)
+        tree.delete(*tree.get_children())
+
+        table = ReconcilingTable(tree)
+        table.sync(_make_rows(sensors), version=0)
+
+        def diff(tick):
+            table.sync(_make_rows(sensors, 100, tick), version=tick + 1)
+
+        diff_result = _time_ticks(root, ticks, diff)
+
+        def unchanged(_tick):
+            table.sync(_make_rows(sensors), version=ticks)
+
+        unchanged_result = _time_ticks(root, ticks, unchanged)
+    finally:
+        root.destroy()
+
+    return {
+        "sensors": sensors,
+        "ticks": ticks,
+        "full_rebuild": rebuild_result,
+        "diff_1pct_changed": diff_result,
+        "unchanged_version": unchanged_result,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sensor Treeview refresh benchmark")
+    parser.add_argument("--sensors", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=20)
+    args = parser.parse_args(argv)
+    try:
+        result = run(args.sensors, args.ticks)
+    except tk.TclError as e:
+        print(f"Tk unavailable: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -95,7 +95,8 @@ def main():
         print("=" * 60)
         print("[System] Initializing Core System...")
         system = System()
-        print("✓ System initialized\n")
+        print("✓ System initialized")
+        print(system.get_startup_report() + "\n")
 
         # 2. Setup virtual hardware
         setup_hardware(system)
@@ -167,4 +168,11 @@ def main():
 
 
 if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        # Subcommands (e.g. `python main.py serve`) run headless
+        from safehome.__main__ import main as cli_main
+
+        sys.exit(cli_main(sys.argv[1:]))
     main()
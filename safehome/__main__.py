@@ -0,0 +1,42 @@
+"""
+SafeHome command line
+Usage: python -m safehome serve [--host HOST] [--port PORT] [--db PATH]
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the safehome command"""
+    parser = argparse.ArgumentParser(
+        prog="safehome", description="SafeHome command line"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run headless with the HTTP/JSON API")
+    serve.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    serve.add_argument("--port", type=int, default=8350, help="TCP port")
+    serve.add_argument("--db", default="data/safehome.db", help="SQLite database")
+    serve.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0.5,
+        help="seconds read responses are cached (0 disables)",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `python -m safehome`"""
+    args = build_parser().parse_args(argv)
+    if args.command == "serve":
+        from safehome.interface.web.server import serve
+
+        serve(db_path=args.db, host=args.host, port=args.port, cache_ttl=args.cache_ttl)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
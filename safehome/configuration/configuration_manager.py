@@ -1,9 +1,10 @@
-import smtplib
-from email.message import EmailMessage
+from contextlib import nullcontext
 from typing import List, Optional
 
+from ..device.clock import REAL_CLOCK, Clock
 from .log_manager import LogManager
 from .login_manager import LoginManager
+from .notification_dispatcher import NotificationDispatcher
 from .safehome_mode import SafeHomeMode
 from .safety_zone import SafetyZone
 from .storage_manager import StorageManager
@@ -17,39 +18,113 @@ class ConfigurationManager:
     Integrates with database for persistent storage
     """
 
-    def __init__(self, db_path: str = "data/safehome.db"):
+    def __init__(
+        self,
+        db_path: str = "data/safehome.db",
+        lazy: bool = False,
+        profiler=None,
+        event_bus=None,
+        metrics=None,
+        clock=None,
+    ):
         """
         Initialize Configuration Manager
 
         Args:
             db_path: Path to SQLite database file
+            lazy: Defer log preload, default-zone setup and mode loading
+                until first use
+            profiler: Optional StartupProfiler recording per-phase timings
+            event_bus: Optional EventBus receiving log, mode and zone events
+            metrics: Optional MetricsRegistry for database, log and login
+                instrumentation
+            clock: Time source for login lockouts, rate limits, sessions
+                and alert e-mail retries (default: REAL_CLOCK)
         """
+        self.event_bus = event_bus
+        self.metrics = metrics
+        if clock is None:
+            clock = REAL_CLOCK
+        phase = profiler.phase if profiler else lambda name: nullcontext()
+
         # 1. Initialize Database Manager
         from safehome.database.db_manager import DatabaseManager
 
-        self.db_manager = DatabaseManager(db_path)
-        self.db_manager.connect()
-        self.db_manager.initialize_schema()
+        with phase("config.db_connect"):
+            self.db_manager = DatabaseManager(db_path, metrics=metrics)
+            self.db_manager.connect()
+        with phase("config.schema"):
+            self.db_manager.initialize_schema()
 
         # 2. Initialize Storage Manager with DB
         self.storage = StorageManager(self.db_manager)
 
-        # 3. Initialize System Settings (load from DB or use defaults)
-        self.settings = SystemSettings()
-        loaded_data = self.storage.load_settings()
-        if loaded_data:
-            self.settings.update_settings(**loaded_data)
+        # Startup writes share one transaction
+        with self.db_manager.batch():
+            # 3. Initialize System Settings (load from DB or use defaults)
+            with phase("config.settings"):
+                self.settings = SystemSettings()
+                loaded_data = self.storage.load_settings()
+                if loaded_data:
+                    self.settings.update_settings(**loaded_data)
+
+            # 4. Initialize Log Manager
+            with phase("config.log_manager"):
+                self.logger = LogManager(
+                    self.storage, lazy=lazy, event_bus=event_bus, metrics=metrics
+                )
+                self.logger.add_log(
+                    "System configuration loaded", source="ConfigManager"
+                )
+            # Backward-compatible alias
+            self.log_manager = self.logger
+
+            # 5. Initialize Login Manager
+            self.login_manager = LoginManager(
+                self.settings,
+                self.storage,
+                clock=clock,
+                metrics=metrics,
+                event_bus=event_bus,
+            )
 
-        # 4. Initialize Log Manager
-        self.logger = LogManager(self.storage)
-        self.logger.add_log("System configuration loaded", source="ConfigManager")
-        # Backward-compatible alias
-        self.log_manager = self.logger
+            # 6./7. Safety Zones and SafeHome Modes (deferred in lazy mode)
+            self._zones_initialized = False
+            self._modes = None
+            if not lazy:
+                with phase("config.zones"):
+                    self._ensure_default_zones()
+                with phase("config.modes"):
+                    self._modes = self._load_safehome_modes()
+
+        # 8. Alert e-mail queue (worker thread starts on first use)
+        self.notifier = NotificationDispatcher(
+            self.settings,
+            self.storage,
+            self.logger,
+            clock=clock if isinstance(clock, Clock) else REAL_CLOCK,
+        )
 
-        # 5. Initialize Login Manager
-        self.login_manager = LoginManager(self.settings, self.storage)
+        # 9. Current state
+        self.current_mode = SafeHomeMode.DISARMED
 
-        # 6. Initialize Safety Zones in DB if they don't exist
+        # 10. UI Callbacks
+        self.zone_update_callbacks = []
+
+    @property
+    def modes(self) -> dict:
+        """SafeHome modes loaded from the database (loaded on first access)"""
+        if self._modes is None:
+            self._modes = self._load_safehome_modes()
+        return self._modes
+
+    @modes.setter
+    def modes(self, value: dict):
+        self._modes = value
+
+    def _ensure_default_zones(self):
+        """Create the default safety zones if the database has none"""
+        self._zones_initialized = True
         if not self.storage.load_all_safety_zones():
             self.logger.add_log(
                 "No safety zones found in DB, creating defaults.",
@@ -60,30 +135,34 @@ class ConfigurationManager:
             self.storage.save_safety_zone(zone1)
             self.storage.save_safety_zone(zone2)
 
-        # 7. Load SafeHome Modes from database
-        self.modes = self._load_safehome_modes()
-
-        # 8. Current state
-        self.current_mode = SafeHomeMode.DISARMED
-
-        # 9. UI Callbacks
-        self.zone_update_callbacks = []
-
     def register_zone_update_callback(self, callback):
         """Register a callback function to be called when zones are updated."""
         self.zone_update_callbacks.append(callback)
 
     def _notify_zone_update(self):
         """Notify all registered callbacks about a zone update."""
+        if self.event_bus is not None:
+            self.event_bus.publish("zone", None)
         for callback in self.zone_update_callbacks:
             try:
                 callback()
             except Exception as e:
                 print(f"Error in zone update callback: {e}")
 
+    def queue_email_alert(self, subject: str, body: str) -> Optional[int]:
+        """
+        Queue an email alert for background delivery (non-blocking)
+        Alerts raised close together are sent as one digest, and failed
+        deliveries are retried from the database, also after a restart.
+
+        Returns:
+            Notification ID, or None if no alert_email is configured
+        """
+        return self.notifier.notify(subject, body)
+
     def send_email_alert(self, subject: str, body: str) -> bool:
         """
-        Send an email alert using SMTP settings
+        Send an email alert using SMTP settings (blocks until sent)
 
         Returns:
             True if sent, False otherwise
@@ -96,6 +175,10 @@ class ConfigurationManager:
                 source="ConfigManager",
             )
             return False
+        # Imported here: smtplib/email are only needed when an alert is sent
+        import smtplib
+        from email.message import EmailMessage
+
         try:
             port = int(settings.smtp_port) if settings.smtp_port else 587
             msg = EmailMessage()
@@ -141,8 +224,10 @@ class ConfigurationManager:
         """Reset all system settings to their default values"""
         # 1. Reset settings to default by creating a new SystemSettings instance
         self.settings = SystemSettings()
+        self.notifier.settings = self.settings
 
         # 2. Delete all existing safety zones from the database
+        self._zones_initialized = True
         self.storage.delete_all_safety_zones()
 
         # 3. Re-create the default safety zones in the database
@@ -204,6 +289,8 @@ class ConfigurationManager:
         self.logger.add_log(
             f"System mode changed to {mode.name}", source="ConfigManager"
         )
+        if self.event_bus is not None:
+            self.event_bus.publish("mode", {"mode": mode.name})
 
     def get_mode(self) -> SafeHomeMode:
         """Get current system mode"""
@@ -238,10 +325,14 @@ class ConfigurationManager:
 
     def get_all_safety_zones(self) -> List[SafetyZone]:
         """Get all safety zones directly from the database."""
+        if not self._zones_initialized:
+            self._ensure_default_zones()
         return self.storage.load_all_safety_zones()
 
     def add_safety_zone(self, zone_name: str) -> Optional[SafetyZone]:
         """Adds a new safety zone to the database."""
+        if not self._zones_initialized:
+            self._ensure_default_zones()
         zone = SafetyZone(None, zone_name)
         new_id = self.storage.save_safety_zone(zone)
 
@@ -297,6 +388,9 @@ class ConfigurationManager:
     def shutdown(self):
         """Gracefully shutdown configuration manager"""
         self.save_configuration()
+        self.login_manager.end_all_sessions()
+        self.login_manager.close_audit()  # pending login_sessions rows
+        self.notifier.stop()  # undelivered alerts stay queued for next start
         if self.db_manager:
             self.db_manager.disconnect()
         self.logger.add_log("Configuration Manager shutdown", source="ConfigManager")
@@ -1,4 +1,5 @@
-from typing import List
+import time
+from typing import List, Optional
 
 from .log import Log
 
@@ -9,39 +10,112 @@ class LogManager:
     manages in-memory logs, file logging, and optional DB storage
     """
 
-    def __init__(self, storage_manager=None):
-        self.logs = []  # 内存日志缓存
-        self.log_file = "data/safehome_events.log"
+    LOG_FILE = "data/safehome_events.log"
+
+    def __init__(
+        self, storage_manager=None, lazy: bool = False, event_bus=None, metrics=None
+    ):
+        """
+        Args:
+            storage_manager: Optional storage for persistence and preload
+            lazy: Defer the stored-log preload until logs are first read
+            event_bus: Optional EventBus receiving "log" events for new rows
+            metrics: Optional MetricsRegistry receiving log rate and latency
+        """
+        self._logs = []  # 内存日志缓存
+        self._preloaded = False
+        self._first_session_log_id = None
+        self.log_file = self.LOG_FILE
         self.storage = storage_manager
-        # Preload logs from storage if available
-        if self.storage:
-            try:
+        self.event_bus = event_bus
+        self.metrics = metrics
+        if not lazy:
+            self._preload()
+
+    @property
+    def logs(self) -> List[Log]:
+        """In-memory logs (triggers the deferred preload on first access)"""
+        if not self._preloaded:
+            self._preload()
+        return self._logs
+
+    @logs.setter
+    def logs(self, value: List[Log]):
+        self._logs = value
+        self._preloaded = True
+
+    def _preload(self):
+        """Preload recent logs from storage, ahead of this session's logs"""
+        self._preloaded = True
+        if not self.storage:
+            return
+        try:
+            if self._first_session_log_id is None:
                 stored_logs = self.storage.get_logs(limit=500)
-                for row in stored_logs:
-                    log = Log(
-                        message=row.get("event_message", ""),
-                        level=row.get("event_type", "INFO"),
-                        source=row.get("source", "System"),
-                        timestamp=row.get("event_timestamp"),
-                    )
-                    self.logs.append(log)
-            except Exception as e:
-                print(f"Error preloading logs: {e}")
+            else:
+                # Rows written this session are already in memory
+                stored_logs = self.storage.get_logs(
+                    limit=500, before_log_id=self._first_session_log_id
+                )
+            history = []
+            for row in stored_logs:
+                log = Log(
+                    message=row.get("event_message", ""),
+                    level=row.get("event_type", "INFO"),
+                    source=row.get("source", "System"),
+                    timestamp=row.get("event_timestamp"),
+                )
+                history.append(log)
+            self._logs[:0] = history
+        except Exception as e:
+            print(f"Error preloading logs: {e}")
 
     def add_log(
         self, message: str, level: str = "INFO", source: str = "System", **kwargs
-    ):
-        """添加一条新日志"""
+    ) -> Optional[int]:
+        """添加一条新日志, returns the database log_id (None if not stored)"""
+        start = time.perf_counter() if self.metrics is not None else None
         new_log = Log(message, level=level, source=source)
-        self.logs.append(new_log)
+        self._logs.append(new_log)
         self._write_to_file(new_log)
+        log_id = None
         if self.storage and self.storage.db:
             try:
                 # Pass sensor_id, camera_id, etc. if they exist
-                self.storage.save_log(new_log, **kwargs)
+                log_id = self.storage.save_log(new_log, **kwargs)
+                if (
+                    not self._preloaded
+                    and self._first_session_log_id is None
+                    and isinstance(log_id, int)
+                ):
+                    self._first_session_log_id = log_id
             except Exception as e:
                 print(f"Error saving log to storage: {e}")
+        if self.event_bus is not None:
+            self.event_bus.publish(
+                "log",
+                {
+                    "log_id": log_id if isinstance(log_id, int) else None,
+                    "message": message,
+                    "level": level,
+                    "source": source,
+                    "timestamp": new_log.timestamp.isoformat(),
+                    **kwargs,
+                },
+            )
         # print(new_log)  # 可选：控制台输出
+        if start is not None:
+            self._observe(level, start)
+        return log_id if isinstance(log_id, int) else None
+
+    def _observe(self, level: str, start: float):
+        """Record one add_log call in the metrics registry"""
+        self.metrics.counter(
+            "safehome_log_entries_total", "Log entries added", level=level
+        ).inc()
+        self.metrics.histogram(
+            "safehome_log_write_seconds", "add_log latency (file, database, events)"
+        ).observe(time.perf_counter() - start)
 
     def _write_to_file(self, log: Log):
         """追加写入文件"""
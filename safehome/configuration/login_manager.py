@@ -1,7 +1,14 @@
+import secrets
 import threading
 import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
 
+from ..device.clock import REAL_CLOCK, Clock
 from .login_interface import LoginInterface
+from .rate_limiter import TokenBucketLimiter
+from .session_audit import GUARANTEE_ASYNC, GUARANTEES, SessionAuditWriter
+from .session_cache import Session, SessionCache
 from .system_settings import SystemSettings
 
 
@@ -11,19 +18,68 @@ class LoginManager(LoginInterface):
     Implements password validation, lockout mechanism, and session tracking
     """
 
-    def __init__(self, settings: SystemSettings, storage_manager=None):
+    # Login attempt rate limits (burst size, tokens refilled per second)
+    INTERFACE_BURST = 30
+    INTERFACE_RATE = 5.0
+    USER_BURST = 10
+    USER_RATE = 1.0
+
+    # Login sessions (create_session): idle timeout and cache bound
+    SESSION_TTL = 900.0
+    MAX_SESSIONS = 1000
+
+    def __init__(
+        self,
+        settings: SystemSettings,
+        storage_manager=None,
+        clock: Callable[[], float] = time.monotonic,
+        audit_guarantee: str = GUARANTEE_ASYNC,
+        metrics=None,
+        event_bus=None,
+    ):
         """
         Initialize Login Manager
 
         Args:
             settings: System settings containing passwords
             storage_manager: Optional storage manager for session tracking
+            clock: Monotonic time source for lockout expiry and rate limits
+            audit_guarantee: "sync" commits each login_sessions row before
+                returning; "async" batches rows on a writer thread (rows
+                not yet flushed are lost on a crash)
+            metrics: Optional MetricsRegistry counting attempts and lockouts
+            event_bus: Optional EventBus receiving a "login" event per attempt
+                (user, interface and outcome; never the password)
+
+        Raises:
+            ValueError: If audit_guarantee is unknown
         """
+        if audit_guarantee not in GUARANTEES:
+            raise ValueError(
+                f"Invalid audit guarantee: {audit_guarantee}. "
+                f"Must be one of {GUARANTEES}"
+            )
         self.settings = settings
         self.storage = storage_manager
+        self.clock = clock
+        self.audit_guarantee = audit_guarantee
+        self.metrics = metrics
+        self.event_bus = event_bus
+        self._audit_writer: Optional[SessionAuditWriter] = None
         self.failed_attempts = {}  # Track attempts per interface type
         self.is_locked = {}  # Track lock status per interface type
-        self.lock_timers = {}  # Track unlock timers per interface type
+        self.locked_until = {}  # Lock expiry time per interface type
+        self._state_lock = threading.RLock()
+        # Token buckets per interface and per (interface, user_id)
+        self.interface_limiter = TokenBucketLimiter(
+            self.INTERFACE_BURST, self.INTERFACE_RATE, clock=clock
+        )
+        self.user_limiter = TokenBucketLimiter(
+            self.USER_BURST, self.USER_RATE, clock=clock
+        )
+        self.sessions = SessionCache(
+            ttl=self.SESSION_TTL, max_sessions=self.MAX_SESSIONS, clock=clock
+        )
 
     def validate_credentials(
         self, user_id: str, password: str, interface_type: str = "CONTROL_PANEL"
@@ -37,40 +93,120 @@ class LoginManager(LoginInterface):
             interface_type: "CONTROL_PANEL" or "WEB"
 
         Returns:
-            True if credentials are valid and system not locked
+            True if credentials are valid, the interface is not locked and
+            the attempt is within the rate limits
         """
-        # Initialize tracking for this interface if needed
-        if interface_type not in self.failed_attempts:
-            self.failed_attempts[interface_type] = 0
-            self.is_locked[interface_type] = False
+        is_valid, attempts = self._authenticate(user_id, password, interface_type)
+        self._log_session(interface_type, user_id, is_valid, attempts)
+        return is_valid
 
-        # Check if locked
-        if self.is_locked.get(interface_type, False):
-            self._log_session(interface_type, user_id, False)
-            return False
+    def check_credentials(
+        self, user_id: str, password: str, interface_type: str = "WEB"
+    ) -> bool:
+        """
+        Check credentials sent with every request (e.g. HTTP Basic auth)
+        Correct credentials on an unlocked interface pass without spending
+        rate-limit tokens or writing a login_sessions row; anything else is
+        handled by validate_credentials(), so guesses still count toward
+        the lockout.
 
-        # Validate based on interface type
-        is_valid = False
+        Args:
+            user_id: User identifier
+            password: Password to validate
+            interface_type: "CONTROL_PANEL" or "WEB"
 
-        if interface_type == "CONTROL_PANEL":
-            is_valid = self._validate_control_panel(user_id, password)
-        elif interface_type == "WEB":
-            is_valid = self._validate_web(user_id, password)
+        Returns:
+            True if credentials are valid and the interface is not locked
+        """
+        with self._state_lock:
+            if not self._check_locked(interface_type) and self._check_password(
+                user_id, password, interface_type
+            ):
+                return True
+        return self.validate_credentials(user_id, password, interface_type)
 
-        # Handle result
-        if is_valid:
-            self.failed_attempts[interface_type] = 0
-            self._log_session(interface_type, user_id, True)
-            return True
-        else:
-            self.failed_attempts[interface_type] += 1
-            self._log_session(interface_type, user_id, False)
+    def _check_password(self, user_id: str, password: str, interface_type: str) -> bool:
+        """Validate a password for the interface type (no side effects)"""
+        if interface_type == "CONTROL_PANEL":
+            return self._validate_control_panel(user_id, password)
+        if interface_type == "WEB":
+            return self._validate_web(user_id, password)
+        return False
 
-            # Check if should lock
-            if self.failed_attempts[interface_type] >= self.settings.max_login_attempts:
-                self._lock_interface(interface_type)
+    def _authenticate(
+        self, user_id: str, password: str, interface_type: str
+    ) -> Tuple[bool, int]:
+        """
+        Check credentials and update attempt counters and lockout
 
+        Returns:
+            (is_valid, failed attempts after this one)
+        """
+        with self._state_lock:
+            # Initialize tracking for this interface if needed
+            if interface_type not in self.failed_attempts:
+                self.failed_attempts[interface_type] = 0
+                self.is_locked[interface_type] = False
+
+            # Check if locked (an expired lock is lifted here)
+            if self._check_locked(interface_type):
+                self._count_attempt(interface_type, "locked", user_id)
+                return False, self.failed_attempts[interface_type]
+            # Throttle bursts before looking at the password
+            if not self._within_rate_limit(user_id, interface_type):
+                self._count_attempt(interface_type, "throttled", user_id)
+                return False, self.failed_attempts[interface_type]
+
+            is_valid = self._check_password(user_id, password, interface_type)
+
+            # Handle result
+            self._count_attempt(
+                interface_type, "success" if is_valid else "failure", user_id
+            )
+            if is_valid:
+                self.failed_attempts[interface_type] = 0
+            else:
+                self.failed_attempts[interface_type] += 1
+                # Check if should lock
+                if (
+                    self.failed_attempts[interface_type]
+                    >= self.settings.max_login_attempts
+                ):
+                    self._lock_interface(interface_type)
+            return is_valid, self.failed_attempts[interface_type]
+
+    def _count_attempt(
+        self, interface_type: str, result: str, user_id: Optional[str] = None
+    ):
+        if getattr(self, "event_bus", None) is not None:
+            self.event_bus.publish(
+                "login",
+                {"user_id": user_id, "interface": interface_type, "result": result},
+            )
+        if self.metrics is not None:
+            self.metrics.counter(
+                "safehome_login_attempts_total",
+                "Login attempts by outcome",
+                interface=interface_type,
+                result=result,
+            ).inc()
+
+    def _within_rate_limit(self, user_id: str, interface_type: str) -> bool:
+        """Spend a token from the interface and the user's bucket"""
+        if not self.user_limiter.try_acquire((interface_type, user_id)):
             return False
+        return self.interface_limiter.try_acquire(interface_type)
+
+    def _check_locked(self, interface_type: str) -> bool:
+        """Whether an interface is locked, lifting the lock once it expires"""
+        with self._state_lock:
+            if not self.is_locked.get(interface_type, False):
+                return False
+            until = self.locked_until.get(interface_type)
+            if until is not None and self.clock() >= until:
+                self.unlock_system(interface_type)
+                return False
+            return True
 
     def _validate_control_panel(self, user_id: str, password: str) -> bool:
         """
@@ -122,25 +258,40 @@ class LoginManager(LoginInterface):
         )
 
     def _lock_interface(self, interface_type: str):
-        """Lock interface and start unlock timer"""
-        self.is_locked[interface_type] = True
+        """Lock interface until system_lock_time has elapsed"""
+        with self._state_lock:
+            self.is_locked[interface_type] = True
+            self.locked_until[interface_type] = (
+                self.clock() + self.settings.system_lock_time
+            )
+        if self.metrics is not None:
+            self.metrics.counter(
+                "safehome_login_lockouts_total",
+                "Interface lockouts after failed logins",
+                interface=interface_type,
+            ).inc()
         print(f"{interface_type} locked due to failed login attempts")
 
-        # Start timer to auto-unlock
-        lock_duration = self.settings.system_lock_time
-
-        def unlock_after_delay():
-            time.sleep(lock_duration)
-            self.unlock_system(interface_type)
-
-        timer = threading.Thread(target=unlock_after_delay, daemon=True)
-        timer.start()
-        self.lock_timers[interface_type] = timer
-
-    def _log_session(self, interface_type: str, username: str, success: bool):
+    def _log_session(
+        self,
+        interface_type: str,
+        username: str,
+        success: bool,
+        failed_attempts: Optional[int] = None,
+    ):
         """Log login session to database"""
         if not self.storage or not self.storage.db:
             return
+        if failed_attempts is None:
+            failed_attempts = self.failed_attempts.get(interface_type, 0)
+
+        if self.audit_guarantee == GUARANTEE_ASYNC:
+            # Timestamp now; the row itself is committed by the writer thread
+            login_time = self._format_time(self.clock())
+            self._get_audit_writer().submit(
+                (interface_type, username, success, failed_attempts, login_time)
+            )
+            return
 
         query = """
             INSERT INTO login_sessions
@@ -153,11 +304,153 @@ class LoginManager(LoginInterface):
                 interface_type,
                 username,
                 success,
-                self.failed_attempts.get(interface_type, 0),
+                failed_attempts,
             ),
         )
         self.storage.db.commit()
 
+    # ===== Sessions =====
+    def create_session(
+        self, user_id: str, password: str, interface_type: str = "WEB"
+    ) -> Optional[str]:
+        """
+        Log in and open a session
+        Later requests present the token instead of the credentials.
+
+        Args:
+            user_id: User identifier
+            password: Password (for WEB: "password1:password2")
+            interface_type: "CONTROL_PANEL" or "WEB"
+
+        Returns:
+            Opaque session token, or None if the login failed
+        """
+        is_valid, attempts = self._authenticate(user_id, password, interface_type)
+        if not is_valid:
+            self._log_session(interface_type, user_id, False, attempts)
+            return None
+
+        # The session's audit row is written now so logout can update it
+        session_id = None
+        if self.storage and self.storage.db:
+            session_id = self.storage.open_login_session(
+                interface_type, user_id, attempts
+            )
+        now = self.clock()
+        session = Session(
+            token=secrets.token_urlsafe(32),
+            user_id=user_id,
+            interface_type=interface_type,
+            session_id=session_id,
+            created_at=now,
+            last_seen=now,
+        )
+        self._close_sessions(self.sessions.add(session))
+        return session.token
+
+    def validate_session(
+        self, token: Optional[str], interface_type: Optional[str] = None
+    ) -> Optional[Session]:
+        """
+        Check a session token and extend its expiry
+
+        Args:
+            token: Token from create_session
+            interface_type: Required interface, or None for any
+
+        Returns:
+            The session, or None if unknown, expired or for another interface
+        """
+        if not token:
+            return None
+        session = self.sessions.touch(token)
+        if session is None:
+            self._close_sessions(self.sessions.evict_expired())
+            return None
+        if interface_type is not None and session.interface_type != interface_type:
+            return None
+        return session
+
+    def end_session(self, token: str) -> bool:
+        """
+        Log out a session
+
+        Returns:
+            True if the session was active
+        """
+        session = self.sessions.remove(token)
+        if session is None:
+            return False
+        self._close_sessions([session], logout=True)
+        return True
+
+    def end_all_sessions(self):
+        """Log out every session (e.g. on shutdown)"""
+        self._close_sessions(self.sessions.clear(), logout=True)
+
+    def _close_sessions(self, sessions: List[Session], logout: bool = False):
+        """
+        Record logout_timestamp for ended sessions in one write
+
+        Args:
+            sessions: Sessions that ended
+            logout: True for an explicit logout (now); False for sessions
+                that expired (their expiry time)
+        """
+        if not sessions or not self.storage or not self.storage.db:
+            return
+        now_clock = self.clock()
+        rows = []
+        for session in sessions:
+            if session.session_id is None:
+                continue
+            ended = now_clock
+            if not logout:
+                ended = min(now_clock, self.sessions.expires_at(session))
+            rows.append((self._format_time(ended), session.session_id))
+        if rows:
+            self.storage.close_login_sessions(rows)
+
+    def _format_time(self, when: float) -> str:
+        """Format clock time `when` as a UTC database timestamp"""
+        if isinstance(self.clock, Clock):
+            wall = self.clock.to_wall(when)
+        else:
+            wall = time.time() - (self.clock() - when)
+        moment = datetime.fromtimestamp(wall, timezone.utc)
+        return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _get_audit_writer(self) -> SessionAuditWriter:
+        if self._audit_writer is None:
+            with self._state_lock:
+                if self._audit_writer is None:
+                    clock = self.clock if isinstance(self.clock, Clock) else REAL_CLOCK
+                    self._audit_writer = SessionAuditWriter(
+                        self._write_sessions, clock=clock
+                    )
+        return self._audit_writer
+
+    def _write_sessions(self, rows: List[tuple]):
+        """Persist a batch of audit rows (runs on the writer thread)"""
+        if self.storage and self.storage.db:
+            self.storage.save_login_sessions(rows)
+
+    def flush_audit(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all login attempts so far are recorded in login_sessions
+
+        Returns:
+            True if flushed, False on timeout
+        """
+        if self._audit_writer is None:
+            return True
+        return self._audit_writer.flush(timeout)
+
+    def close_audit(self):
+        """Flush pending audit rows and stop the writer thread"""
+        if self._audit_writer is not None:
+            self._audit_writer.close()
+
     def change_password(
         self,
         old_password: str,
@@ -224,20 +517,31 @@ class LoginManager(LoginInterface):
         Args:
             interface_type: Specific interface to unlock, or None for all
         """
-        if interface_type:
-            self.failed_attempts[interface_type] = 0
-            self.is_locked[interface_type] = False
-            print(f"{interface_type} unlocked")
-        else:
-            # Unlock all interfaces
-            for iface in list(self.failed_attempts.keys()):
-                self.failed_attempts[iface] = 0
-                self.is_locked[iface] = False
-            print("All interfaces unlocked")
+        with self._state_lock:
+            if interface_type:
+                self.failed_attempts[interface_type] = 0
+                self.is_locked[interface_type] = False
+                self.locked_until.pop(interface_type, None)
+                print(f"{interface_type} unlocked")
+            else:
+                # Unlock all interfaces
+                for iface in list(self.failed_attempts.keys()):
+                    self.failed_attempts[iface] = 0
+                    self.is_locked[iface] = False
+                self.locked_until.clear()
+                print("All interfaces unlocked")
 
     def is_interface_locked(self, interface_type: str) -> bool:
         """Check if a specific interface is locked"""
-        return self.is_locked.get(interface_type, False)
+        return self._check_locked(interface_type)
+
+    def get_lock_remaining(self, interface_type: str) -> float:
+        """Seconds until an interface unlocks (0 if not locked)"""
+        with self._state_lock:
+            if not self._check_locked(interface_type):
+                return 0.0
+            until = self.locked_until.get(interface_type)
+            return float("inf") if until is None else until - self.clock()
 
     def get_failed_attempts(self, interface_type: str) -> int:
         """Get number of failed attempts for an interface"""
@@ -0,0 +1,307 @@
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..device.clock import REAL_CLOCK, Clock
+
+
+class NotificationDispatcher:
+    """
+    Asynchronous e-mail notification delivery
+    notify() persists the alert in notification_queue and returns at once.
+    A worker thread waits digest_window seconds so alerts raised together
+    go out as one digest per recipient, sends over a reused SMTP
+    connection, and reschedules failed deliveries with backoff. Pending
+    rows survive restarts and are retried when the dispatcher starts.
+    """
+
+    RETRY_DELAYS = (10, 60, 300, 1800)  # seconds after the 1st, 2nd, ... failure
+    MAX_ATTEMPTS = 8
+
+    def __init__(
+        self,
+        settings,
+        storage,
+        logger=None,
+        digest_window: float = 2.0,
+        idle_timeout: float = 60.0,
+        smtp_timeout: float = 10.0,
+        smtp_factory: Optional[Callable] = None,
+        clock: Clock = REAL_CLOCK,
+    ):
+        """
+        Initialize Notification Dispatcher
+
+        Args:
+            settings: SystemSettings with SMTP host/port/credentials and
+                the default alert_email recipient
+            storage: StorageManager holding the notification queue
+            logger: LogManager for delivery events (optional)
+            digest_window: Seconds to collect alerts into one message
+            idle_timeout: Seconds an unused SMTP connection is kept open
+            smtp_timeout: Socket timeout for SMTP operations
+            smtp_factory: Callable(host, port, timeout) returning an SMTP
+                client (defaults to smtplib.SMTP)
+            clock: Time source for the digest window, idle timeout and
+                retry backoff (queue times are stored as its to_wall())
+        """
+        self.settings = settings
+        self.storage = storage
+        self.logger = logger
+        self.digest_window = digest_window
+        self.idle_timeout = idle_timeout
+        self.smtp_timeout = smtp_timeout
+        self.smtp_factory = smtp_factory
+        self.clock = clock
+
+        self._smtp = None
+        self._smtp_key: Optional[Tuple] = None  # settings the connection used
+        self._smtp_last_used = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flushed = threading.Condition()
+        self._flush_requested = 0  # flush() calls so far
+        self._flush_done = 0  # flush() calls the worker has served
+        self._thread: Optional[threading.Thread] = None
+        self.connections_opened = 0
+        self.messages_sent = 0
+
+    # ===== Public API =====
+    def notify(
+        self, subject: str, body: str, recipient: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Queue an alert for delivery (non-blocking)
+
+        Args:
+            subject: Alert subject
+            body: Alert text
+            recipient: Address (defaults to settings.alert_email)
+
+        Returns:
+            Notification ID, or None if there is no recipient
+        """
+        recipient = recipient or self.settings.alert_email
+        if not recipient:
+            self._log("Email alert skipped: no alert_email configured", level="WARNING")
+            return None
+        notification_id = self.storage.enqueue_notification(
+            recipient, subject, body, next_attempt_at=self._wall_now()
+        )
+        self.start()
+        self._wake.set()
+        return notification_id
+
+    def start(self):
+        """Start the worker thread (also resumes persisted retries)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="notification-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker; undelivered alerts stay queued in the database"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self._close_connection()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send due alerts now, skipping the digest window, and wait for the
+        attempt to finish
+
+        Returns:
+            True if no due alerts remain pending
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        self.start()
+        with self._flushed:
+            self._flush_requested += 1
+            target = self._flush_requested
+            self._wake.set()
+            while self._flush_done < target:
+                if deadline is None:
+                    self._flushed.wait()
+                    continue
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    return False
+                waited = self._flushed.wait(self.clock.real_seconds(remaining))
+                if not waited and self._flush_done < target:
+                    # Timed out (a ManualClock does not advance while we block)
+                    return False
+        return not self.storage.get_due_notifications(self._wall_now(), limit=1)
+
+    def is_running(self) -> bool:
+        """Check whether the worker thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    # ===== Worker =====
+    def _run(self):
+        while not self._stop.is_set():
+            # Clear the wake-up before reading the queue so an alert queued
+            # while this pass runs triggers another pass
+            self._wake.clear()
+            with self._flushed:
+                flush_seen = self._flush_requested
+            due = self._get_due()
+            if due:
+                if flush_seen == self._flush_done and self.digest_window > 0:
+                    # Let alerts raised together land in the same digest
+                    self._linger()
+                    if self._stop.is_set():
+                        break
+                    due = self._get_due()
+                self._deliver(due)
+                continue
+
+            self._mark_flushed(flush_seen)
+            timeout = self.idle_timeout
+            next_at = self.storage.get_next_notification_time()
+            if next_at is not None:
+                timeout = min(timeout, max(0.0, next_at - self._wall_now()))
+            woken = self.clock.wait(self._wake, timeout)
+            if (
+                not woken
+                and self._smtp is not None
+                and self.clock() - self._smtp_last_used >= self.idle_timeout
+            ):
+                self._close_connection()
+        self._mark_flushed(None)
+
+    def _linger(self):
+        """Wait out the digest window, ending early on stop() or flush()"""
+        deadline = self.clock() + self.digest_window
+        while not self._stop.is_set():
+            with self._flushed:
+                if self._flush_requested > self._flush_done:
+                    return
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return
+            self.clock.wait(self._wake, remaining)
+            self._wake.clear()
+
+    def _wall_now(self) -> float:
+        """Current Unix time on the dispatcher's clock (queue timestamps)"""
+        return self.clock.to_wall(self.clock())
+
+    def _get_due(self) -> List[dict]:
+        try:
+            return self.storage.get_due_notifications(self._wall_now())
+        except Exception as e:
+            self._log(f"Error reading notification queue: {e}", level="ERROR")
+            return []
+
+    def _mark_flushed(self, flush_seen: Optional[int]):
+        """Release flush() callers whose request this pass has served"""
+        with self._flushed:
+            if flush_seen is None:
+                flush_seen = self._flush_requested
+            self._flush_done = max(self._flush_done, flush_seen)
+            self._flushed.notify_all()
+
+    def _deliver(self, notifications: List[dict]):
+        """Send due notifications as one message per recipient"""
+        by_recipient: Dict[str, List[dict]] = {}
+        for item in notifications:
+            by_recipient.setdefault(item["recipient"], []).append(item)
+        for recipient, items in by_recipient.items():
+            ids = [item["notification_id"] for item in items]
+            try:
+                self._send(self._build_message(recipient, items))
+            except Exception as e:
+                self._close_connection()
+                attempts = max(item["attempts"] for item in items)
+                delay = self.RETRY_DELAYS[min(attempts, len(self.RETRY_DELAYS) - 1)]
+                self.storage.mark_notifications_failed(
+                    ids, str(e), self._wall_now() + delay, self.MAX_ATTEMPTS
+                )
+                self._log(
+                    f"Email alert failed ({len(ids)} queued, retry in {delay}s): {e}",
+                    level="ERROR",
+                )
+                continue
+            self.storage.mark_notifications_sent(ids)
+            self._log(f"Alert email sent to {recipient} ({len(ids)} alert(s))")
+
+    def _build_message(self, recipient: str, items: List[dict]):
+        from email.message import EmailMessage
+
+        msg = EmailMessage()
+        if len(items) == 1:
+            msg["Subject"] = items[0]["subject"]
+            msg.set_content(items[0]["body"])
+        else:
+            msg["Subject"] = f"SafeHome: {len(items)} alerts"
+            sections = [
+                f"[{item['created_at']}] {item['subject']}\n{item['body']}"
+                for item in items
+            ]
+            msg.set_content("\n\n".join(sections))
+        msg["From"] = self.settings.smtp_user
+        msg["To"] = recipient
+        return msg
+
+    # ===== SMTP connection =====
+    def _send(self, msg):
+        """Send over the cached connection, reconnecting once if it dropped"""
+        import smtplib
+
+        try:
+            self._connection().send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError, OSError):
+            self._close_connection()
+            self._connection().send_message(msg)
+        self._smtp_last_used = self.clock()
+        self.messages_sent += 1
+
+    def _connection(self):
+        """Get the open SMTP connection, (re)connecting if settings changed"""
+        settings = self.settings
+        port = int(settings.smtp_port) if settings.smtp_port else 587
+        key = (settings.smtp_host, port, settings.smtp_user, settings.smtp_password)
+        if self._smtp is not None and key == self._smtp_key:
+            return self._smtp
+        self._close_connection()
+
+        factory = self.smtp_factory
+        if factory is None:
+            import smtplib
+
+            factory = smtplib.SMTP
+        server = factory(settings.smtp_host, port, timeout=self.smtp_timeout)
+        try:
+            server.ehlo()
+            if server.has_extn("starttls"):
+                server.starttls()
+                server.ehlo()
+            if settings.smtp_user and settings.smtp_password:
+                if server.has_extn("auth"):
+                    server.login(settings.smtp_user, settings.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp, self._smtp_key = server, key
+        self.connections_opened += 1
+        return server
+
+    def _close_connection(self):
+        server, self._smtp, self._smtp_key = self._smtp, None, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self.logger:
+            self.logger.add_log(message, level=level, source="Notifications")
+        elif level != "INFO":
+            print(f"[Email] {message}")
@@ -0,0 +1,94 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe token buckets keyed by an arbitrary key
+    Each key may spend up to `capacity` attempts in a burst; tokens refill
+    continuously at `refill_rate` per second. Buckets are refilled lazily
+    when accessed, so no timer threads are involved.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        max_keys: int = 10000,
+    ):
+        """
+        Initialize Token Bucket Limiter
+
+        Args:
+            capacity: Maximum tokens (burst size) per key
+            refill_rate: Tokens added per second
+            clock: Monotonic time source in seconds
+            max_keys: Buckets kept before full (idle) buckets are pruned
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.clock = clock
+        self.max_keys = max_keys
+        self._buckets: Dict[Hashable, Tuple[float, float]] = {}  # key: (tokens, t)
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: Hashable, tokens: float = 1.0) -> bool:
+        """
+        Spend tokens from a key's bucket
+
+        Returns:
+            True if the bucket had enough tokens, False if rate limited
+        """
+        with self._lock:
+            now = self.clock()
+            available = self._refill(key, now)
+            if available < tokens:
+                self._buckets[key] = (available, now)
+                return False
+            self._buckets[key] = (available - tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+            return True
+
+    def get_tokens(self, key: Hashable) -> float:
+        """Get the tokens currently available to a key"""
+        with self._lock:
+            return self._refill(key, self.clock())
+
+    def retry_after(self, key: Hashable, tokens: float = 1.0) -> float:
+        """Seconds until the key can spend the given tokens (0 if now)"""
+        with self._lock:
+            missing = tokens - self._refill(key, self.clock())
+        if missing <= 0:
+            return 0.0
+        if self.refill_rate <= 0:
+            return float("inf")
+        return missing / self.refill_rate
+
+    def reset(self, key: Optional[Hashable] = None):
+        """Refill one key's bucket, or all buckets if key is None"""
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def _refill(self, key: Hashable, now: float) -> float:
+        """Tokens available at `now` (caller holds the lock)"""
+        entry = self._buckets.get(key)
+        if entry is None:
+            return self.capacity
+        tokens, updated = entry
+        return min(self.capacity, tokens + (now - updated) * self.refill_rate)
+
+    def _prune(self, now: float):
+        """Drop buckets that have refilled completely (caller holds the lock)"""
+        full = [
+            key
+            for key, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * self.refill_rate >= self.capacity
+        ]
+        for key in full:
+            del self._buckets[key]
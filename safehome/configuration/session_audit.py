@@ -0,0 +1,162 @@
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from ..device.clock import REAL_CLOCK, Clock
+
+# Audit durability levels
+GUARANTEE_SYNC = "sync"  # row committed before the login call returns
+GUARANTEE_ASYNC = "async"  # row committed within flush_interval (lost on crash)
+GUARANTEES = (GUARANTEE_SYNC, GUARANTEE_ASYNC)
+
+
+class _FlushMarker:
+    """Queue entry signalling that everything before it has been written"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class SessionAuditWriter:
+    """
+    Background batch writer for login audit rows
+    Rows are queued by submit() and written by one thread in batches of up
+    to max_batch rows per transaction, at most flush_interval seconds after
+    the first row of a batch arrived. The queue is bounded: when it is full
+    the caller writes its row itself, so audit rows are never dropped.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[tuple]], None],
+        max_queue: int = 10000,
+        max_batch: int = 500,
+        flush_interval: float = 0.1,
+        clock: Clock = REAL_CLOCK,
+    ):
+        """
+        Initialize Session Audit Writer
+
+        Args:
+            write_batch: Persists a list of rows in one transaction
+            max_queue: Rows buffered before submit() writes inline
+            max_batch: Rows written per transaction
+            flush_interval: Longest time a row waits before being written
+            clock: Time source the flush_interval is measured on
+        """
+        self.write_batch = write_batch
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.rows_written = 0
+        self.batches_written = 0
+        self.inline_writes = 0
+
+    def submit(self, row: tuple):
+        """Queue a row for writing (writes inline if the queue is full)"""
+        if self._closed:
+            self._write([row])
+            return
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.inline_writes += 1
+            self._write([row])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every row submitted so far is committed
+
+        Returns:
+            True if flushed, False on timeout
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return True
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Flush pending rows and stop the writer thread"""
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        self._drain()
+
+    def get_pending(self) -> int:
+        """Get the number of queued entries"""
+        return self._queue.qsize()
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="session-audit", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            # Linger up to flush_interval after the first row so a burst of
+            # logins shares one transaction
+            deadline = self.clock() + self.flush_interval
+            rows, markers, stop = [], [], False
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, _FlushMarker):
+                    markers.append(item)
+                else:
+                    rows.append(item)
+                if stop or markers or len(rows) >= self.max_batch:
+                    break
+                remaining = deadline - self.clock()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(
+                            timeout=self.clock.real_seconds(remaining)
+                        )
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if rows:
+                self._write(rows)
+            for marker in markers:
+                marker.done.set()
+            if stop:
+                return
+
+    def _drain(self):
+        """Write whatever is still queued on the calling thread"""
+        rows = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushMarker):
+                item.done.set()
+            elif item is not None:
+                rows.append(item)
+        if rows:
+            self._write(rows)
+
+    def _write(self, rows: List[tuple]):
+        try:
+            self.write_batch(rows)
+            self.rows_written += len(rows)
+            self.batches_written += 1
+        except Exception as e:
+            print(f"Error writing login audit rows: {e}")
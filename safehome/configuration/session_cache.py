@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+
+@dataclass
+class Session:
+    """An authenticated login session"""
+
+    token: str
+    user_id: str
+    interface_type: str
+    session_id: Optional[int]  # login_sessions row
+    created_at: float  # clock time
+    last_seen: float  # clock time, refreshed on every use
+
+
+class SessionCache:
+    """
+    LRU/TTL cache of active sessions
+    Sessions expire ttl seconds after their last use (sliding expiry).
+    Every use moves a session to the back of the ordering, so the front
+    always holds the least recently used session: expired sessions are
+    evicted in bulk from the front and the LRU victim is the front entry.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 900.0,
+        max_sessions: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize Session Cache
+
+        Args:
+            ttl: Idle seconds before a session expires
+            max_sessions: Sessions kept before the least recent is evicted
+            clock: Monotonic time source in seconds
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, session: Session) -> List[Session]:
+        """
+        Store a session
+
+        Returns:
+            Sessions evicted to make room (expired or least recently used)
+        """
+        with self._lock:
+            evicted = self._evict_expired(self.clock())
+            self._sessions[session.token] = session
+            while len(self._sessions) > self.max_sessions:
+                evicted.append(self._sessions.popitem(last=False)[1])
+            return evicted
+
+    def touch(self, token: str) -> Optional[Session]:
+        """
+        Look up a session and extend its expiry
+
+        Returns:
+            The session, or None if unknown or expired (an expired session
+            stays cached until evict_expired() reports it)
+        """
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            now = self.clock()
+            if now - session.last_seen >= self.ttl:
+                return None
+            session.last_seen = now
+            self._sessions.move_to_end(token)
+            return session
+
+    def remove(self, token: str) -> Optional[Session]:
+        """Drop a session, returning it if it was cached"""
+        with self._lock:
+            return self._sessions.pop(token, None)
+
+    def evict_expired(self) -> List[Session]:
+        """Remove and return all expired sessions"""
+        with self._lock:
+            return self._evict_expired(self.clock())
+
+    def clear(self) -> List[Session]:
+        """Remove and return all sessions"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            return sessions
+
+    def expires_at(self, session: Session) -> float:
+        """Clock time at which a session expires unless used again"""
+        return session.last_seen + self.ttl
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _evict_expired(self, now: float) -> List[Session]:
+        """Pop expired sessions off the front (caller holds the lock)"""
+        evicted = []
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_seen < self.ttl:
+                break
+            evicted.append(self._sessions.popitem(last=False)[1])
+        return evicted
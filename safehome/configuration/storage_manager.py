@@ -263,16 +263,228 @@ class StorageManager:
         self.db.execute_query(query, (password, camera_id))
         self.db.commit()
 
+    def update_camera_zone(self, camera_id: int, zone_id: Optional[int]):
+        """Update the safety zone a camera covers"""
+        self._check_db()
+        query = "UPDATE cameras SET zone_id = ? WHERE camera_id = ?"
+        self.db.execute_query(query, (zone_id, camera_id))
+        self.db.commit()
+
+    def save_camera_clip(
+        self,
+        camera_id: int,
+        file_path: str,
+        frame_count: int,
+        size_bytes: int,
+        event_time: str,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        log_id: Optional[int] = None,
+        sensor_id: Optional[int] = None,
+    ) -> int:
+        """Index a recorded clip and return its clip ID"""
+        self._check_db()
+        query = """
+            INSERT INTO camera_clips
+            (camera_id, log_id, sensor_id, file_path, frame_count, size_bytes,
+             event_time, start_time, end_time)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        clip_id = self.db.execute_insert_query(
+            query,
+            (
+                camera_id,
+                log_id,
+                sensor_id,
+                file_path,
+                frame_count,
+                size_bytes,
+                event_time,
+                start_time,
+                end_time,
+            ),
+        )
+        self.db.commit()
+        return clip_id
+
+    def get_camera_clips(
+        self,
+        camera_id: Optional[int] = None,
+        log_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        """Get recorded clips, newest first"""
+        self._check_db()
+        query = "SELECT * FROM camera_clips WHERE 1=1"
+        params = []
+        if camera_id is not None:
+            query += " AND camera_id = ?"
+            params.append(camera_id)
+        if log_id is not None:
+            query += " AND log_id = ?"
+            params.append(log_id)
+        query += " ORDER BY event_time DESC, clip_id DESC LIMIT ?"
+        params.append(limit)
+        rows = self.db.execute_query(query, tuple(params), fetch_all=True)
+        return [dict(row) for row in rows]
+
     def clear_camera_passwords(self):
         """Remove all camera passwords (used for system reset)."""
         self._check_db()
         self.db.execute_query("UPDATE cameras SET camera_password = NULL")
         self.db.commit()
 
-    def save_log(self, log, **kwargs):
-        """Save log entry to database"""
+    def save_login_sessions(self, rows: List[tuple]):
+        """
+        Insert login audit rows in one transaction
+
+        Args:
+            rows: (interface_type, username, login_successful,
+                failed_attempts, login_timestamp) tuples
+        """
+        self._check_db()
+        query = """
+            INSERT INTO login_sessions
+            (interface_type, username, login_successful, failed_attempts,
+             login_timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        with self.db.batch():
+            self.db.execute_many(query, rows)
+
+    def open_login_session(
+        self, interface_type: str, username: str, failed_attempts: int = 0
+    ) -> Optional[int]:
+        """Record a successful login that starts a session; returns its ID"""
+        self._check_db()
+        query = """
+            INSERT INTO login_sessions
+            (interface_type, username, login_successful, failed_attempts)
+            VALUES (?, ?, 1, ?)
+        """
+        session_id = self.db.execute_insert_query(
+            query, (interface_type, username, failed_attempts)
+        )
+        self.db.commit()
+        return session_id
+
+    def close_login_sessions(self, rows: List[tuple]):
+        """
+        Set logout_timestamp on ended sessions in one transaction
+
+        Args:
+            rows: (logout_timestamp, session_id) tuples
+        """
+        self._check_db()
+        query = "UPDATE login_sessions SET logout_timestamp = ? WHERE session_id = ?"
+        with self.db.batch():
+            self.db.execute_many(query, rows)
+
+    # ===== Notification Queue =====
+    def enqueue_notification(
+        self,
+        recipient: str,
+        subject: str,
+        body: str,
+        next_attempt_at: float,
+        channel: str = "EMAIL",
+    ) -> Optional[int]:
+        """Persist an outgoing notification and return its ID"""
+        self._check_db()
+        query = """
+            INSERT INTO notification_queue
+            (channel, recipient, subject, body, next_attempt_at)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        notification_id = self.db.execute_insert_query(
+            query, (channel, recipient, subject, body, next_attempt_at)
+        )
+        self.db.commit()
+        return notification_id
+
+    def get_due_notifications(
+        self, now: float, channel: str = "EMAIL", limit: int = 100
+    ) -> List[dict]:
+        """Get pending notifications whose next attempt is due, oldest first"""
+        self._check_db()
+        query = """
+            SELECT * FROM notification_queue
+            WHERE status = 'PENDING' AND channel = ? AND next_attempt_at <= ?
+            ORDER BY notification_id LIMIT ?
+        """
+        rows = self.db.execute_query(query, (channel, now, limit), fetch_all=True)
+        return [dict(row) for row in rows]
+
+    def get_next_notification_time(self, channel: str = "EMAIL") -> Optional[float]:
+        """Get the earliest next_attempt_at of pending notifications"""
+        self._check_db()
+        query = """
+            SELECT MIN(next_attempt_at) AS next_at FROM notification_queue
+            WHERE status = 'PENDING' AND channel = ?
+        """
+        row = self.db.execute_query(query, (channel,), fetch_one=True)
+        return row["next_at"] if row else None
+
+    def mark_notifications_sent(self, notification_ids: List[int]):
+        """Mark notifications as delivered"""
+        self._check_db()
+        query = """
+            UPDATE notification_queue
+            SET status = 'SENT', attempts = attempts + 1,
+                sent_at = CURRENT_TIMESTAMP, last_error = NULL
+            WHERE notification_id = ?
+        """
+        with self.db.batch():
+            self.db.execute_many(query, [(nid,) for nid in notification_ids])
+
+    def mark_notifications_failed(
+        self,
+        notification_ids: List[int],
+        error: str,
+        next_attempt_at: float,
+        max_attempts: int,
+    ):
+        """
+        Record a failed delivery attempt
+        Notifications reaching max_attempts are marked FAILED, the rest are
+        rescheduled for next_attempt_at.
+        """
+        self._check_db()
+        query = """
+            UPDATE notification_queue
+            SET attempts = attempts + 1, last_error = ?, next_attempt_at = ?,
+                status = CASE WHEN attempts + 1 >= ? THEN 'FAILED'
+                              ELSE 'PENDING' END
+            WHERE notification_id = ?
+        """
+        with self.db.batch():
+            self.db.execute_many(
+                query,
+                [
+                    (error, next_attempt_at, max_attempts, nid)
+                    for nid in notification_ids
+                ],
+            )
+
+    def get_notifications(
+        self, status: Optional[str] = None, limit: int = 100
+    ) -> List[dict]:
+        """Get queued notifications, newest first"""
+        self._check_db()
+        query = "SELECT * FROM notification_queue"
+        params = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY notification_id DESC LIMIT ?"
+        params.append(limit)
+        rows = self.db.execute_query(query, tuple(params), fetch_all=True)
+        return [dict(row) for row in rows]
+
+    def save_log(self, log, **kwargs) -> Optional[int]:
+        """Save log entry to database and return its log ID"""
         self._check_db()
-        self.db.add_event_log(
+        return self.db.add_event_log(
             event_type=log.level,
             event_message=log.message,
             source=log.source,
@@ -287,11 +499,18 @@ class StorageManager:
         event_type: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        before_log_id: Optional[int] = None,
+        offset: int = 0,
     ) -> List[dict]:
         """Get logs from database with filters"""
         self._check_db()
         rows = self.db.get_event_logs(
-            event_type=event_type, start_date=start_date, end_date=end_date, limit=limit
+            event_type=event_type,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            before_log_id=before_log_id,
+            offset=offset,
         )
         return [dict(row) for row in rows]
 
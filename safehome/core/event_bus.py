@@ -0,0 +1,206 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+from ..device.clock import REAL_CLOCK, Clock
+
+# Well-known topics published by the core system
+TOPIC_SENSOR = "sensor"
+TOPIC_MODE = "mode"
+TOPIC_ALARM = "alarm"
+TOPIC_LOG = "log"
+TOPIC_ZONE = "zone"
+TOPIC_LOGIN = "login"
+
+
+@dataclass
+class Event:
+    """A single published state change"""
+
+    seq: int
+    topic: str
+    data: Any
+    timestamp: float = field(default_factory=time.time)  # Unix seconds
+
+    def to_dict(self) -> dict:
+        """Convert event to dictionary"""
+        return {
+            "seq": self.seq,
+            "topic": self.topic,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+
+class Subscription:
+    """
+    Handle for one subscriber
+    Callback subscriptions are invoked on the publisher's thread; queue
+    subscriptions buffer events (bounded, oldest dropped first) for a
+    consumer thread to drain with get() or iteration
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        topics: Optional[Iterable[str]] = None,
+        callback: Optional[Callable[[Event], None]] = None,
+        max_queue: int = 1000,
+    ):
+        self._bus = bus
+        self.topics = frozenset(topics) if topics else None
+        self.callback = callback
+        self._queue: Deque[Event] = deque(maxlen=max_queue)
+        self._cond = threading.Condition()
+        self.dropped = 0
+        self.closed = False
+
+    def matches(self, topic: str) -> bool:
+        """Check whether this subscription wants the topic"""
+        return self.topics is None or topic in self.topics
+
+    def _deliver(self, event: Event):
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"Error in event subscriber: {e}")
+            return
+        with self._cond:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(event)
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """
+        Wait for the next queued event
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Next event, or None on timeout or after close()
+        """
+        with self._cond:
+            if not self._queue and not self.closed:
+                self._cond.wait(timeout)
+            if self._queue:
+                return self._queue.popleft()
+            return None
+
+    def drain(self) -> List[Event]:
+        """Return and remove all currently queued events"""
+        with self._cond:
+            events = list(self._queue)
+            self._queue.clear()
+            return events
+
+    def close(self):
+        """Unsubscribe and wake any waiting consumer"""
+        self._bus.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def __iter__(self):
+        while not self.closed:
+            event = self.get()
+            if event is not None:
+                yield event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus for system state changes
+    Keeps a short replay history so reconnecting clients can resume from
+    the last sequence number they saw
+    """
+
+    def __init__(self, history_size: int = 256, clock: Clock = REAL_CLOCK):
+        """
+        Initialize Event Bus
+
+        Args:
+            history_size: Number of recent events kept for replay
+            clock: Time source for event timestamps (Unix seconds via
+                clock.to_wall)
+        """
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._subscriptions: List[Subscription] = []
+        self._history: Deque[Event] = deque(maxlen=history_size)
+        self._seq = 0
+
+    def subscribe(
+        self,
+        callback: Optional[Callable[[Event], None]] = None,
+        topics: Optional[Iterable[str]] = None,
+        max_queue: int = 1000,
+        replay_after: Optional[int] = None,
+    ) -> Subscription:
+        """
+        Subscribe to events
+
+        Args:
+            callback: Called with each Event; if None, events are queued
+            topics: Topics to receive (None for all)
+            max_queue: Queue bound for queue subscriptions
+            replay_after: Queue buffered history events with seq greater
+                than this (queue subscriptions only)
+
+        Returns:
+            Subscription handle (close() to unsubscribe)
+        """
+        subscription = Subscription(self, topics, callback, max_queue)
+        with self._lock:
+            if replay_after is not None and callback is None:
+                for event in self._history:
+                    if event.seq > replay_after and subscription.matches(event.topic):
+                        subscription._deliver(event)
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription (no-op if already removed)"""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, topic: str, data: Any = None) -> Event:
+        """
+        Publish an event to all matching subscribers
+
+        Args:
+            topic: Event topic
+            data: JSON-serializable payload
+
+        Returns:
+            The published Event
+        """
+        with self._lock:
+            self._seq += 1
+            event = Event(self._seq, topic, data, self.clock.to_wall(self.clock()))
+            self._history.append(event)
+            targets = [s for s in self._subscriptions if s.matches(topic)]
+        for subscription in targets:
+            subscription._deliver(event)
+        return event
+
+    def get_last_seq(self) -> int:
+        """Get the sequence number of the most recent event"""
+        with self._lock:
+            return self._seq
+
+    def subscriber_count(self) -> int:
+        """Get the number of active subscriptions"""
+        with self._lock:
+            return len(self._subscriptions)
@@ -0,0 +1,389 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Histogram buckets are log-linear over integer microseconds (HDR-style):
+# values below 2**SUB_BUCKET_BITS get exact buckets, larger ones 16 buckets
+# per power of two, i.e. about 3% relative error at any magnitude.
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKETS = SUB_BUCKETS // 2
+MAX_SHIFT = 32  # largest tracked value ~ 2**37 us (38 hours)
+NUM_BUCKETS = SUB_BUCKETS + MAX_SHIFT * HALF_SUB_BUCKETS
+
+# Cumulative bucket bounds for the Prometheus export (seconds)
+PROMETHEUS_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _bucket_index(value_us: int) -> int:
+    if value_us < SUB_BUCKETS:
+        return max(0, value_us)
+    shift = value_us.bit_length() - SUB_BUCKET_BITS
+    if shift > MAX_SHIFT:
+        return NUM_BUCKETS - 1
+    index = SUB_BUCKETS + (shift - 1) * HALF_SUB_BUCKETS
+    return index + (value_us >> shift) - HALF_SUB_BUCKETS
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """[low, high) range of a bucket in microseconds"""
+    if index < SUB_BUCKETS:
+        return index, index + 1
+    shift = (index - SUB_BUCKETS) // HALF_SUB_BUCKETS + 1
+    mantissa = (index - SUB_BUCKETS) % HALF_SUB_BUCKETS + HALF_SUB_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class _Sharded:
+    """
+    Per-thread storage cells
+    Each thread only ever writes its own cell, so updates need no lock;
+    readers add the cells up (a read may miss an in-flight update). Cells
+    of finished threads are folded into one retired cell.
+    """
+
+    def __init__(self, factory: Callable, merge: Callable):
+        self._factory = factory
+        self._merge = merge
+        self._local = threading.local()
+        self._retired = factory()
+        self._cells: List[tuple] = []  # (owner thread, cell)
+        self._lock = threading.Lock()
+
+    def cell(self):
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = self._factory()
+            with self._lock:
+                self._sweep()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+        return cell
+
+    def cells(self) -> List:
+        with self._lock:
+            return [self._retired] + [cell for _, cell in self._cells]
+
+    def _sweep(self):
+        """Fold cells of finished threads into the retired cell (lock held)"""
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                self._merge(self._retired, cell)
+        self._cells = live
+
+
+def _merge_count(into: list, cell: list):
+    into[0] += cell[0]
+
+
+class Counter:
+    """Monotonically increasing count (lock-free per-thread shards)"""
+
+    kind = "counter"
+
+    def __init__(self):
+        self._shards = _Sharded(lambda: [0], _merge_count)
+
+    def inc(self, amount: float = 1):
+        self._shards.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(cell[0] for cell in self._shards.cells())
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    """Current value; either set explicitly or read from a callback"""
+
+    kind = "gauge"
+
+    def __init__(self, fn: Optional[Callable[[], float]] = None):
+        self.fn = fn
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self._value = value
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        if self.fn is not None:
+            try:
+                return self.fn()
+            except Exception:
+                return float("nan")
+        return self._value
+
+    def snapshot(self):
+        return self.value
+
+
+class _HistogramCell:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def merge(self, other: "_HistogramCell"):
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+
+class Histogram:
+    """
+    Latency distribution in seconds with HDR-style log-linear buckets
+    observe() touches only the calling thread's shard; percentiles are
+    accurate to about 3% of the value.
+    """
+
+    kind = "histogram"
+
+    def __init__(self):
+        self._shards = _Sharded(_HistogramCell, _HistogramCell.merge)
+
+    def observe(self, seconds: float):
+        cell = self._shards.cell()
+        cell.counts[_bucket_index(int(seconds * 1_000_000))] += 1
+        cell.count += 1
+        cell.total += seconds
+        if seconds > cell.max:
+            cell.max = seconds
+
+    @contextmanager
+    def time(self):
+        """Observe the duration of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def _merged(self) -> Tuple[List[int], int, float, float]:
+        merged = _HistogramCell()
+        for cell in self._shards.cells():
+            merged.merge(cell)
+        return merged.counts, merged.count, merged.total, merged.max
+
+    @staticmethod
+    def _percentile(counts: List[int], count: int, pct: float) -> float:
+        if count == 0:
+            return 0.0
+        rank = max(1, round(pct / 100 * count))
+        seen = 0
+        for i, n in enumerate(counts):
+            seen += n
+            if seen >= rank:
+                low, high = _bucket_bounds(i)
+                return (low + high) / 2 / 1_000_000
+        return 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Get the pct-th percentile in seconds"""
+        counts, count, _, _ = self._merged()
+        return self._percentile(counts, count, pct)
+
+    @property
+    def count(self) -> int:
+        return sum(cell.count for cell in self._shards.cells())
+
+    def snapshot(self) -> dict:
+        counts, count, total, largest = self._merged()
+        return {
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else 0.0,
+            # Bucket midpoints can exceed the largest value seen
+            "p50": min(largest, self._percentile(counts, count, 50)),
+            "p90": min(largest, self._percentile(counts, count, 90)),
+            "p99": min(largest, self._percentile(counts, count, 99)),
+            "max": largest,
+        }
+
+    def cumulative_buckets(self, bounds=PROMETHEUS_BUCKETS) -> List[int]:
+        """Observations <= each bound (seconds), for the Prometheus export"""
+        counts, _, _, _ = self._merged()
+        result = []
+        for bound in bounds:
+            limit = bound * 1_000_000
+            result.append(
+                sum(
+                    n
+                    for i, n in enumerate(counts)
+                    if n and _bucket_bounds(i)[0] < limit
+                )
+            )
+        return result
+
+
+class _Family:
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.children: Dict[Labels, object] = {}
+
+
+class MetricsRegistry:
+    """
+    In-process metrics (counters, gauges, histograms)
+    Metrics are identified by name plus optional labels; asking for the
+    same name and labels again returns the same metric, so call sites can
+    look metrics up on every use or keep a reference.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str = "", **labels) -> Counter:
+        return self._get(name, Counter, help, labels)
+
+    def gauge(
+        self,
+        name: str,
+        help: str = "",
+        fn: Optional[Callable[[], float]] = None,
+        **labels,
+    ) -> Gauge:
+        gauge = self._get(name, Gauge, help, labels)
+        if fn is not None:
+            gauge.fn = fn
+        return gauge
+
+    def histogram(self, name: str, help: str = "", **labels) -> Histogram:
+        return self._get(name, Histogram, help, labels)
+
+    def _get(self, name: str, metric_type, help_text: str, labels: dict):
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        family = self._families.get(name)
+        if family is not None:
+            metric = family.children.get(key)
+            if metric is not None:
+                return metric
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = _Family(name, metric_type.kind, help_text)
+                self._families[name] = family
+            elif family.kind != metric_type.kind:
+                raise ValueError(f"Metric {name} is a {family.kind}")
+            if help_text and not family.help:
+                family.help = help_text
+            metric = family.children.get(key)
+            if metric is None:
+                metric = metric_type()
+                family.children[key] = metric
+            return metric
+
+    def _items(self):
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda f: f.name)
+            return [(f, sorted(f.children.items())) for f in families]
+
+    def snapshot(self) -> dict:
+        """
+        Get all metric values
+
+        Returns:
+            {'name' or 'name{label="value"}': number, or for histograms
+            {"count", "sum", "mean", "p50", "p90", "p99", "max"}}
+        """
+        return {
+            family.name + _format_labels(labels): metric.snapshot()
+            for family, children in self._items()
+            for labels, metric in children
+        }
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+        for family, children in self._items():
+            if family.help:
+                lines.append(f"# HELP {family.name} {_escape(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels, metric in children:
+                if family.kind != "histogram":
+                    lines.append(
+                        f"{family.name}{_format_labels(labels)} "
+                        f"{_format_value(metric.value)}"
+                    )
+                    continue
+                snap = metric.snapshot()
+                buckets = metric.cumulative_buckets()
+                for bound, n in zip(PROMETHEUS_BUCKETS, buckets):
+                    bucket_labels = labels + (("le", repr(bound)),)
+                    lines.append(
+                        f"{family.name}_bucket{_format_labels(bucket_labels)} {n}"
+                    )
+                inf_labels = labels + (("le", "+Inf"),)
+                lines.append(
+                    f"{family.name}_bucket{_format_labels(inf_labels)} {snap['count']}"
+                )
+                lines.append(
+                    f"{family.name}_sum{_format_labels(labels)} "
+                    f"{_format_value(snap['sum'])}"
+                )
+                lines.append(
+                    f"{family.name}_count{_format_labels(labels)} {snap['count']}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(key, _escape(value).replace('"', '\\"'))
+        for key, value in labels
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,402 @@
+import itertools
+import json
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class MonitoringAlert:
+    """An alarm reported to the monitoring service"""
+
+    alert_id: int
+    location: str
+    message: str
+    sensor_id: Optional[int] = None
+    zone_id: Optional[int] = None
+    triggered_at: float = 0.0  # time.monotonic() when the sensor tripped
+    alarm_at: float = 0.0  # time.monotonic() when the alarm was raised
+
+    def to_dict(self) -> dict:
+        return {
+            "alert_id": self.alert_id,
+            "location": self.location,
+            "message": self.message,
+            "sensor_id": self.sensor_id,
+            "zone_id": self.zone_id,
+        }
+
+
+@dataclass
+class ChannelResult:
+    """Outcome of reporting one alert over one channel"""
+
+    channel: str
+    ok: bool
+    attempts: int
+    latency: Optional[float] = None  # sensor trigger -> acknowledgement (s)
+    dispatch_latency: Optional[float] = None  # alarm -> acknowledgement (s)
+    error: Optional[str] = None
+
+
+@dataclass
+class MonitoringIncident:
+    """Alert dispatch in progress; done is set once every channel finished"""
+
+    alert: MonitoringAlert
+    results: Dict[str, ChannelResult] = field(default_factory=dict)
+    done: threading.Event = field(default_factory=threading.Event)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+    def acknowledged(self) -> bool:
+        """True if at least one channel acknowledged the alert"""
+        return any(result.ok for result in self.results.values())
+
+
+class MonitoringChannel(ABC):
+    """
+    Path to the monitoring service (phone gateway, webhook, e-mail, ...)
+    send() returns once the far end acknowledged the alert and raises
+    otherwise. The dispatcher gives each channel `timeout` seconds, starts
+    a hedged duplicate attempt if the first has not answered after
+    `hedge_after` seconds, and retries failures up to `max_attempts`.
+    """
+
+    name = "channel"
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        hedge_after: Optional[float] = 1.0,
+        max_attempts: int = 3,
+    ):
+        """
+        Initialize Monitoring Channel
+
+        Args:
+            timeout: Seconds until the channel gives up on an alert
+            hedge_after: Seconds without an answer before a parallel
+                attempt is started (None disables hedging)
+            max_attempts: Attempts per alert, hedged ones included
+        """
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.max_attempts = max(1, max_attempts)
+
+    @abstractmethod
+    def send(self, alert: MonitoringAlert, timeout: float):
+        """
+        Deliver an alert, raising if it was not acknowledged
+
+        Args:
+            alert: Alert to report
+            timeout: Seconds left for this attempt
+        """
+
+
+def post_json(url: str, payload: dict, timeout: float, headers=None) -> int:
+    """
+    POST a JSON document, raising unless the server answers 2xx
+
+    Returns:
+        HTTP status code
+    """
+    # Imported here: only needed once an alarm is actually reported
+    import urllib.request
+
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json", **(headers or {})},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status
+
+
+class WebhookChannel(MonitoringChannel):
+    """Reports alerts as JSON POSTs; any 2xx response is the acknowledgement"""
+
+    name = "webhook"
+
+    def __init__(self, url: str, headers: Optional[dict] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url
+        self.headers = headers or {}
+
+    def send(self, alert: MonitoringAlert, timeout: float):
+        post_json(self.url, alert.to_dict(), timeout, self.headers)
+
+
+class PhoneGatewayChannel(MonitoringChannel):
+    """
+    Dials the monitoring phone number (settings.monitoring_phone)
+    With a gateway_url the call is placed through that HTTP voice gateway;
+    without one the call is simulated and acknowledged at once, as on the
+    demo hardware.
+    """
+
+    name = "phone"
+
+    def __init__(self, settings, gateway_url: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.settings = settings
+        self.gateway_url = gateway_url
+
+    def send(self, alert: MonitoringAlert, timeout: float):
+        if self.gateway_url is None:
+            return
+        payload = {"to": self.settings.monitoring_phone, **alert.to_dict()}
+        post_json(self.gateway_url, payload, timeout)
+
+
+class EmailChannel(MonitoringChannel):
+    """
+    Mails the alert through the notification queue
+    Acknowledged once the alert is persisted for delivery.
+    """
+
+    name = "email"
+
+    def __init__(self, config, **kwargs):
+        kwargs.setdefault("hedge_after", None)
+        super().__init__(**kwargs)
+        self.config = config
+
+    def send(self, alert: MonitoringAlert, timeout: float):
+        notification_id = self.config.queue_email_alert(
+            f"SafeHome ALARM: {alert.location}", alert.message
+        )
+        if notification_id is None:
+            raise RuntimeError("no alert_email configured")
+
+
+class MonitoringDispatcher:
+    """
+    Reports alarms to every monitoring channel concurrently
+    Each channel runs on its own thread so a slow or dead channel never
+    delays the others. Trigger-to-acknowledgement latency is recorded per
+    channel and available from get_latency_stats().
+    """
+
+    LATENCY_SAMPLES = 1000  # per channel
+
+    def __init__(
+        self,
+        channels: Optional[List[MonitoringChannel]] = None,
+        logger=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize Monitoring Dispatcher
+
+        Args:
+            channels: Channels alarms are reported on
+            logger: LogManager for delivery results (optional)
+            clock: Monotonic time source in seconds
+        """
+        self.channels: List[MonitoringChannel] = list(channels or [])
+        self.logger = logger
+        self.clock = clock
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque] = {}
+
+    def add_channel(self, channel: MonitoringChannel):
+        """Register a channel (replaces a channel with the same name)"""
+        with self._lock:
+            self.channels = [c for c in self.channels if c.name != channel.name]
+            self.channels.append(channel)
+
+    def remove_channel(self, name: str) -> bool:
+        """Unregister a channel by name"""
+        with self._lock:
+            remaining = [c for c in self.channels if c.name != name]
+            removed = len(remaining) != len(self.channels)
+            self.channels = remaining
+            return removed
+
+    def get_channel(self, name: str) -> Optional[MonitoringChannel]:
+        for channel in self.channels:
+            if channel.name == name:
+                return channel
+        return None
+
+    def create_alert(
+        self,
+        location: str,
+        message: str,
+        sensor_id: Optional[int] = None,
+        zone_id: Optional[int] = None,
+        triggered_at: Optional[float] = None,
+    ) -> MonitoringAlert:
+        """Build an alert stamped with the current clock time"""
+        now = self.clock()
+        return MonitoringAlert(
+            alert_id=next(self._ids),
+            location=location,
+            message=message,
+            sensor_id=sensor_id,
+            zone_id=zone_id,
+            triggered_at=now if triggered_at is None else triggered_at,
+            alarm_at=now,
+        )
+
+    def dispatch(self, alert: MonitoringAlert) -> MonitoringIncident:
+        """
+        Report an alert on all channels (non-blocking)
+
+        Returns:
+            MonitoringIncident; wait() on it for the per-channel results
+        """
+        incident = MonitoringIncident(alert)
+        channels = list(self.channels)
+        if not channels:
+            incident.done.set()
+            return incident
+        pending = [len(channels)]
+
+        def run(channel):
+            result = self._run_channel(channel, alert)
+            self._record(result)
+            with self._lock:
+                incident.results[channel.name] = result
+                pending[0] -= 1
+                if pending[0] == 0:
+                    incident.done.set()
+
+        for channel in channels:
+            threading.Thread(
+                target=run,
+                args=(channel,),
+                name=f"monitoring-{channel.name}",
+                daemon=True,
+            ).start()
+        return incident
+
+    def get_latency_stats(self) -> Dict[str, dict]:
+        """
+        Get trigger-to-acknowledgement latency per channel
+
+        Returns:
+            {channel: {"count", "p50_ms", "p99_ms", "max_ms"}}
+        """
+        with self._lock:
+            snapshot = {name: sorted(v) for name, v in self._latencies.items()}
+        return {
+            name: {
+                "count": len(values),
+                "p50_ms": round(_percentile(values, 50) * 1000, 3),
+                "p99_ms": round(_percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            }
+            for name, values in snapshot.items()
+            if values
+        }
+
+    def _run_channel(
+        self, channel: MonitoringChannel, alert: MonitoringAlert
+    ) -> ChannelResult:
+        """Drive one channel's attempts until one is acknowledged or time runs out"""
+        answers: "queue.Queue" = queue.Queue()
+        start = self.clock()
+        deadline = start + channel.timeout
+        attempts = 0
+        in_flight = 0
+        errors: List[str] = []
+
+        def attempt():
+            try:
+                channel.send(alert, max(0.0, deadline - self.clock()))
+                answers.put(None)
+            except Exception as e:
+                answers.put(f"{type(e).__name__}: {e}")
+
+        def launch():
+            nonlocal attempts, in_flight, next_hedge
+            attempts += 1
+            in_flight += 1
+            threading.Thread(
+                target=attempt,
+                name=f"monitoring-{channel.name}-{attempts}",
+                daemon=True,
+            ).start()
+            next_hedge = (
+                None
+                if channel.hedge_after is None
+                else self.clock() + channel.hedge_after
+            )
+
+        next_hedge: Optional[float] = None
+        launch()
+        while True:
+            now = self.clock()
+            if now >= deadline:
+                errors.append(f"timed out after {channel.timeout}s")
+                break
+            wait = deadline - now
+            can_hedge = next_hedge is not None and attempts < channel.max_attempts
+            if can_hedge:
+                wait = min(wait, max(0.0, next_hedge - now))
+            try:
+                error = answers.get(timeout=wait)
+            except queue.Empty:
+                if can_hedge and self.clock() >= next_hedge:
+                    launch()  # hedge: the first attempt may still answer
+                continue
+            in_flight -= 1
+            if error is None:
+                acked = self.clock()
+                return ChannelResult(
+                    channel.name,
+                    True,
+                    attempts,
+                    latency=acked - alert.triggered_at,
+                    dispatch_latency=acked - alert.alarm_at,
+                )
+            errors.append(error)
+            if attempts < channel.max_attempts:
+                launch()  # retry at once
+            elif in_flight == 0:
+                break
+        return ChannelResult(channel.name, False, attempts, error="; ".join(errors))
+
+    def _record(self, result: ChannelResult):
+        if result.ok:
+            with self._lock:
+                samples = self._latencies.setdefault(
+                    result.channel, deque(maxlen=self.LATENCY_SAMPLES)
+                )
+                samples.append(result.latency)
+        if not self.logger:
+            return
+        if result.ok:
+            self.logger.add_log(
+                f"Monitoring service acknowledged via {result.channel} in "
+                f"{result.dispatch_latency * 1000:.1f} ms "
+                f"({result.latency * 1000:.1f} ms since trigger)",
+                level="ALARM",
+                source="Monitoring",
+            )
+        else:
+            self.logger.add_log(
+                f"Monitoring service unreachable via {result.channel} "
+                f"after {result.attempts} attempt(s): {result.error}",
+                level="ERROR",
+                source="Monitoring",
+            )
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
@@ -0,0 +1,71 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+class StartupProfiler:
+    """
+    Records wall-clock timings of named startup phases
+    Phases are reported in the order they started; nested phases use
+    dotted names (e.g. "config.schema") and are indented in the report
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Initialize Startup Profiler
+
+        Args:
+            clock: Monotonic clock returning seconds (injectable for tests)
+        """
+        self._clock = clock
+        self._started_at = clock()
+        self._finished_at = None
+        self._phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time the enclosed block as a named phase
+
+        Args:
+            name: Phase name
+        """
+        index = len(self._phases)
+        self._phases.append((name, 0.0))
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._phases[index] = (name, (self._clock() - start) * 1000.0)
+
+    def finish(self):
+        """Mark startup as complete (fixes the total time)"""
+        self._finished_at = self._clock()
+
+    def get_timings(self) -> Dict[str, float]:
+        """
+        Get phase timings
+
+        Returns:
+            Dictionary of phase name to duration in milliseconds
+        """
+        return dict(self._phases)
+
+    def get_total_ms(self) -> float:
+        """Get total elapsed startup time in milliseconds"""
+        end = self._finished_at if self._finished_at is not None else self._clock()
+        return (end - self._started_at) * 1000.0
+
+    def report(self) -> str:
+        """
+        Format a human-readable timing report
+
+        Returns:
+            Multi-line report string
+        """
+        lines = ["Startup profile:"]
+        for name, ms in self._phases:
+            indent = "  " * (name.count(".") + 1)
+            lines.append(f"{indent}{name:<{32 - len(indent)}} {ms:8.2f} ms")
+        lines.append(f"  {'total':<30} {self.get_total_ms():8.2f} ms")
+        return "\n".join(lines)
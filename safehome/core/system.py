@@ -1,12 +1,31 @@
+import itertools
 import threading
-import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from ..configuration.configuration_manager import ConfigurationManager
 from ..configuration.safehome_mode import SafeHomeMode
 from ..device.alarm.alarm import Alarm
+from ..device.alarm.scheduler import ScheduledCall, Scheduler, scheduler_for
 from ..device.camera.camera_controller import CameraController
+from ..device.camera.clip_recorder import ClipRecorder
+from ..device.camera.motion_analytics import MotionAnalytics
+from ..device.clock import REAL_CLOCK, Clock
 from ..device.sensor.sensor_controller import SensorController
+from .event_bus import TOPIC_ALARM, EventBus
+from .metrics import MetricsRegistry
+from .monitoring import MonitoringChannel, MonitoringDispatcher, PhoneGatewayChannel
+from .startup_profiler import StartupProfiler
+from .tracing import (
+    STAGE_ALARM_RING,
+    STAGE_ENTRY_DELAY,
+    STAGE_HANDLED,
+    STAGE_LOG_PERSISTED,
+    STAGE_MONITORING,
+    IntrusionTrace,
+    IntrusionTracer,
+)
 
 
 class System:
@@ -17,61 +36,216 @@ class System:
     Based on SRS requirements for system control and intrusion detection
     """
 
-    def __init__(self, db_path: str = "data/safehome.db"):
+    def __init__(
+        self,
+        db_path: str = "data/safehome.db",
+        lazy: bool = False,
+        scheduler: Optional[Scheduler] = None,
+        clock: Optional[Clock] = None,
+    ):
         """
         Initialize System
 
         Args:
             db_path: Path to SQLite database
+            lazy: Defer camera hardware, the log preload and zone loading
+                until they are first used (fast startup)
+            scheduler: Timer scheduler for the entry delay and alarm
+                (default: one running on `clock`)
+            clock: Time source for polling, entry delay, alarm, login and
+                camera lockouts (default: the scheduler's clock if it is
+                a Clock, else real time). ManualClock and AcceleratedClock
+                run the whole system on virtual time.
         """
+        if clock is None:
+            scheduler_clock = getattr(scheduler, "clock", None)
+            clock = (
+                scheduler_clock if isinstance(scheduler_clock, Clock) else REAL_CLOCK
+            )
+        self.clock = clock
+        self.scheduler = scheduler if scheduler is not None else scheduler_for(clock)
+        self.lazy = lazy
+        self.startup_profiler = StartupProfiler()
+        phase = self.startup_profiler.phase
+
+        # State-change events (sensor, mode, alarm, log, zone)
+        self.event_bus = EventBus(clock=clock)
+        # Counters, gauges and latency histograms (see get_metrics)
+        self.metrics = MetricsRegistry()
+        # Sensor-to-monitoring timelines of recent intrusions
+        self.tracer = IntrusionTracer(clock=clock)
+
         # 1. Configuration Manager initialization
-        self.config = ConfigurationManager(db_path=db_path)
+        with phase("config"):
+            self.config = ConfigurationManager(
+                db_path=db_path,
+                lazy=lazy,
+                profiler=self.startup_profiler,
+                event_bus=self.event_bus,
+                metrics=self.metrics,
+                clock=clock,
+            )
 
         # 2. Device Controllers initialization
-        self.sensor_controller = SensorController(
-            storage_manager=self.config.storage, logger=self.config.logger
-        )
-        self.camera_controller = CameraController(
-            storage_manager=self.config.storage,
-            logger=self.config.logger,
-            login_manager=self.config.login_manager,
-            settings=self.config.settings,
-        )
-        self.alarm = Alarm(duration=self.config.settings.alarm_duration)
+        with phase("controllers"):
+            self.sensor_controller = SensorController(
+                storage_manager=self.config.storage,
+                logger=self.config.logger,
+                event_bus=self.event_bus,
+                metrics=self.metrics,
+                clock=clock,
+            )
+            self.camera_controller = CameraController(
+                storage_manager=self.config.storage,
+                logger=self.config.logger,
+                login_manager=self.config.login_manager,
+                settings=self.config.settings,
+                lazy=lazy,
+                metrics=self.metrics,
+                clock=clock,
+            )
+            # Pre/post-event camera clips on intrusion
+            self.clip_recorder = ClipRecorder(
+                self.camera_controller,
+                storage=self.config.storage,
+                logger=self.config.logger,
+                clip_dir=str(Path(db_path).parent / "clips"),
+                clock=clock,
+            )
+            # Optional camera motion analytics (see enable_motion_analytics)
+            self.motion_analytics: Optional[MotionAnalytics] = None
+            self.alarm = Alarm(
+                duration=self.config.settings.alarm_duration,
+                scheduler=self.scheduler,
+            )
+            self.alarm.on_state_change = lambda ringing: self.event_bus.publish(
+                TOPIC_ALARM, {"active": ringing}
+            )
+            self.alarm.on_stage = self._on_alarm_stage
+            # Logging and monitoring calls of timer callbacks run on this
+            # worker, off the shared scheduler thread (one worker keeps
+            # them in order)
+            self._alarm_actions = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="alarm-actions"
+            )
+            # Pending entry-delay timers, cancelled on shutdown
+            self._entry_timers: Dict[int, ScheduledCall] = {}
+            self._entry_timer_ids = itertools.count(1)
+            self._entry_timer_lock = threading.Lock()
+            # Monitoring service channels (see add_monitoring_channel)
+            self.monitoring = MonitoringDispatcher(
+                [PhoneGatewayChannel(self.config.settings)],
+                logger=self.config.logger,
+            )
 
         # 3. State
         self.is_running = False
         self.is_system_locked = False
+        self._register_gauges()
 
         # 4. Polling Thread
+        self.poll_interval = 1.0  # seconds between sensor polls
         self._polling_thread: Optional[threading.Thread] = None
         self._stop_polling = threading.Event()
 
-        # Load existing sensors and cameras from storage
-        self.sensor_controller.load_sensors_from_storage()
-        self.camera_controller.load_cameras_from_storage()
+        # Startup writes share one transaction
+        with self.config.db_manager.batch():
+            # Load existing sensors and cameras from storage
+            with phase("load_sensors"):
+                self.sensor_controller.load_sensors_from_storage()
+            with phase("load_cameras"):
+                self.camera_controller.load_cameras_from_storage()
 
-        # Ensure system starts in a clean, ready-to-arm state
-        self.sensor_controller.disarm_all_sensors()
-        self.sensor_controller.close_all_windoor_sensors()
+            # Ensure system starts in a clean, ready-to-arm state
+            with phase("initial_state"):
+                self.sensor_controller.disarm_all_sensors()
+                self.sensor_controller.close_all_windoor_sensors()
+
+        self.startup_profiler.finish()
+
+    def subscribe(self, callback=None, topics=None, **kwargs):
+        """
+        Subscribe to system state-change events
+        Shortcut for self.event_bus.subscribe (see EventBus.subscribe)
+
+        Args:
+            callback: Called with each Event; if None, events are queued
+            topics: Topics to receive ("sensor", "mode", "alarm", "log",
+                "zone", "login"); None for all
+
+        Returns:
+            Subscription handle
+        """
+        return self.event_bus.subscribe(callback=callback, topics=topics, **kwargs)
+
+    def _register_gauges(self):
+        """Gauges read from live system state at export time"""
+        metrics = self.metrics
+        metrics.gauge(
+            "safehome_sensors",
+            "Registered sensors",
+            fn=lambda: len(self.sensor_controller.sensors),
+        )
+        metrics.gauge(
+            "safehome_cameras",
+            "Registered cameras",
+            fn=lambda: len(self.camera_controller.cameras),
+        )
+        metrics.gauge(
+            "safehome_alarm_active",
+            "1 while the alarm rings",
+            fn=lambda: int(self.alarm.is_active()),
+        )
+        metrics.gauge(
+            "safehome_threads", "Live Python threads", fn=threading.active_count
+        )
+
+    def get_metrics(self) -> dict:
+        """
+        Get a snapshot of all metrics
+
+        Returns:
+            {metric name with labels: value}; histograms map to
+            {"count", "sum", "mean", "p50", "p90", "p99", "max"} in seconds
+        """
+        return self.metrics.snapshot()
+
+    def get_startup_report(self) -> str:
+        """
+        Get the per-phase startup timing report
+
+        Returns:
+            Formatted report string
+        """
+        return self.startup_profiler.report()
+
+    def turn_on(self, polling: bool = True):
+        """
+        Turn on the system
 
-    def turn_on(self):
-        """Turn on the system"""
+        Args:
+            polling: Start the sensor polling thread; pass False when a
+                driver (e.g. EventReplayer) calls poll_once() itself
+        """
         self.is_running = True
-        self._start_sensor_polling()
+        if polling:
+            self._start_sensor_polling()
+        self.clip_recorder.start()
+        self.config.notifier.start()  # resume alerts left queued by a restart
         self.config.logger.add_log("System turned ON", source="System")
 
     def turn_off(self):
         """Turn off the system"""
         self.is_running = False
         self._stop_sensor_polling()
+        self.clip_recorder.stop()  # flush pending clips before the DB closes
         self.config.save_configuration()
         self.config.logger.add_log("System turned OFF", source="System")
 
     def reset(self):
         """Reset the system"""
         self.turn_off()
-        time.sleep(1)
+        self.clock.sleep(1)
         self.turn_on()
         self.config.logger.add_log("System RESET", source="System")
 
@@ -81,9 +255,48 @@ class System:
         Stops all threads, saves state, and closes connections
         """
         self.turn_off()
+        # No entry delay or alarm stage may fire against a stopped system
+        with self._entry_timer_lock:
+            for timer in self._entry_timers.values():
+                timer.cancel()
+            self._entry_timers.clear()
+        if self.alarm.is_active():
+            self.alarm.stop()
+        self._alarm_actions.shutdown(wait=True)
+        if self.motion_analytics is not None:
+            self.motion_analytics.stop()
         self.camera_controller.shutdown()
         self.config.shutdown()
 
+    def enable_motion_analytics(
+        self, thresholds: Optional[dict] = None, **kwargs
+    ) -> MotionAnalytics:
+        """
+        Start camera motion analytics
+        Each enabled camera is published as a CAMERA_MOTION virtual sensor
+        that is polled for intrusions like any other motion sensor.
+
+        Args:
+            thresholds: Optional {camera_id: score threshold}
+            **kwargs: MotionAnalytics options (interval, downsample, ...)
+
+        Returns:
+            The running MotionAnalytics instance
+        """
+        if self.motion_analytics is None:
+            kwargs.setdefault("clock", self.clock)
+            self.motion_analytics = MotionAnalytics(
+                self.camera_controller, self.sensor_controller, **kwargs
+            )
+        for camera_id, threshold in (thresholds or {}).items():
+            self.motion_analytics.set_threshold(camera_id, threshold)
+        self.motion_analytics.start()
+        self.config.logger.add_log(
+            f"Motion analytics started ({self.motion_analytics.backend})",
+            source="System",
+        )
+        return self.motion_analytics
+
     # ===== Sensor Polling =====
     def _start_sensor_polling(self):
         """Start sensor polling (background thread)"""
@@ -104,69 +317,202 @@ class System:
         Periodically poll sensors to detect intrusions
         Runs in separate thread while system is running
         """
+        clock = self.clock
         while self.is_running and not self._stop_polling.is_set():
-            detections = self.sensor_controller.poll_sensors()
-            if detections:
-                for sensor_id, sensor in detections:
-                    self._handle_intrusion(sensor)
-            time.sleep(1)  # Poll every 1 second
+            self.poll_once()
+            if clock.wait(self._stop_polling, self.poll_interval):
+                break
 
-    def _handle_intrusion(self, sensor):
+    def poll_once(self) -> int:
+        """
+        Poll all sensors once and handle any intrusion found
+
+        Returns:
+            Number of detections
+        """
+        detections = self.sensor_controller.poll_sensors()
+        if detections:
+            detected_at = self.clock.now()
+            for sensor_id, sensor in detections:
+                self._handle_intrusion(sensor, detected_at=detected_at)
+        return len(detections)
+
+    def _handle_intrusion(self, sensor, detected_at: Optional[float] = None):
         """
         Handle intrusion detection
-        Logs event and starts entry delay countdown
+        Logs event, saves camera clips and starts entry delay countdown
 
         Args:
             sensor: Sensor that detected intrusion
+            detected_at: Clock time when polling saw it (defaults to now)
         """
-        self.config.logger.add_log(
+        handled_at = self.clock.now()
+        if detected_at is None:
+            detected_at = handled_at
+        trace = self.tracer.start(sensor, detected_at=detected_at)
+        trace.mark(STAGE_HANDLED, handled_at)
+        log_id = self.config.logger.add_log(
             f"INTRUSION DETECTED at {sensor.location}",
             level="ALARM",
             source="System",
             sensor_id=sensor.sensor_id,
             zone_id=sensor.zone_id,
         )
+        trace.mark(STAGE_LOG_PERSISTED)
+
+        # Clip nearby cameras around the detection (written in background)
+        self.clip_recorder.on_intrusion(
+            sensor.zone_id,
+            sensor.location,
+            log_id=log_id if isinstance(log_id, int) else None,
+            sensor_id=sensor.sensor_id,
+        )
 
         # Start entry delay countdown
-        self._start_entry_delay_countdown(sensor)
+        self._start_entry_delay_countdown(sensor, detected_at=detected_at, trace=trace)
 
-    def _start_entry_delay_countdown(self, sensor):
+    def _start_entry_delay_countdown(
+        self,
+        sensor,
+        detected_at: Optional[float] = None,
+        trace: Optional[IntrusionTrace] = None,
+    ):
         """
         Start entry delay countdown before triggering alarm
         Allows user time to disarm system (SRS UC8, UC9)
 
         Args:
             sensor: Sensor that detected intrusion
+            detected_at: Clock time of the detection
+            trace: Intrusion trace to extend (optional)
         """
         delay = self.config.settings.entry_delay
         self.config.logger.add_log(f"Entry delay: {delay} seconds", source="System")
 
-        # Entry delay thread
-        def countdown():
-            time.sleep(delay)
-            # If sensor still detecting and system still armed, trigger alarm
-            if self.is_running and sensor.is_active and sensor.read():
-                self._trigger_alarm(sensor)
-
-        threading.Thread(target=countdown, daemon=True).start()
+        # Timer on the scheduler instead of a sleeping thread per intrusion
+        with self._entry_timer_lock:
+            timer_id = next(self._entry_timer_ids)
+            self._entry_timers[timer_id] = self.scheduler.call_later(
+                delay, self._end_entry_delay, sensor, detected_at, trace, timer_id
+            )
 
-    def _trigger_alarm(self, sensor):
+    def _end_entry_delay(
+        self,
+        sensor,
+        detected_at: Optional[float] = None,
+        trace: Optional[IntrusionTrace] = None,
+        timer_id: Optional[int] = None,
+    ):
+        """
+        Entry delay elapsed: alarm unless disarmed or closed meanwhile
+        Runs on the scheduler thread, so it must not block
+        """
+        with self._entry_timer_lock:
+            self._entry_timers.pop(timer_id, None)
+        if trace is not None:
+            trace.mark(STAGE_ENTRY_DELAY)
+        # If sensor still detecting and system still armed, trigger alarm
+        if self.is_running and sensor.is_active and sensor.read():
+            self._trigger_alarm(sensor, detected_at=detected_at, trace=trace)
+        elif trace is not None:
+            trace.finish("cancelled")
+
+    def _trigger_alarm(
+        self,
+        sensor,
+        detected_at: Optional[float] = None,
+        trace: Optional[IntrusionTrace] = None,
+    ):
         """
         Trigger alarm and call monitoring service
+        The alarm rings at once; logging and the monitoring call run on the
+        alarm-action worker, since this is called from the scheduler thread
 
         Args:
             sensor: Sensor that triggered alarm
+            detected_at: Clock time of the detection
+            trace: Intrusion trace to extend (optional)
+        """
+        if trace is not None:
+            trace.mark(STAGE_ALARM_RING)
+        if self.alarm.ring(context=(sensor, detected_at, trace)) is None:
+            # Already ringing: its stages will not run again, report now
+            self._run_alarm_action(
+                self.call_monitoring_service, sensor, detected_at, trace
+            )
+        # Queued behind the first stage, so its monitoring call is on the trace
+        if trace is not None:
+            self._run_alarm_action(trace.finish, "alarm")
+
+    def _on_alarm_stage(self, stage, generation: int, context):
+        """
+        Alarm escalation listener (runs on the scheduler thread)
+        Hands the stage's logging and monitoring call to the worker
+
+        Args:
+            stage: AlarmStage entered
+            generation: Alarm generation ID
+            context: (sensor, detected_at, trace) for intrusion alarms,
+                None for panic
+        """
+        self._run_alarm_action(self._enter_alarm_stage, stage, context)
+
+    def _enter_alarm_stage(self, stage, context):
+        """Log an escalation and call the monitoring service if asked to"""
+        if stage.after > 0:
+            self.config.logger.add_log(
+                f"Alarm escalated to {stage.name}", level="ALARM", source="System"
+            )
+        if stage.call_monitoring and context is not None:
+            sensor, detected_at, trace = context
+            self.call_monitoring_service(sensor, detected_at=detected_at, trace=trace)
+
+    def _run_alarm_action(self, action, *args):
+        """Run action(*args) on the alarm-action worker"""
+        try:
+            self._alarm_actions.submit(self._alarm_action, action, *args)
+        except RuntimeError:
+            pass  # shut down: the system no longer reports alarms
+
+    @staticmethod
+    def _alarm_action(action, *args):
+        try:
+            action(*args)
+        except Exception as e:
+            print(f"Error in alarm action: {e}")
+
+    def wait_for_alarm_actions(self, timeout: Optional[float] = None) -> bool:
         """
-        self.alarm.ring()
-        self.call_monitoring_service(sensor)
+        Wait until logging and monitoring calls queued by alarm timers ran
 
-    def call_monitoring_service(self, sensor):
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        try:
+            marker = self._alarm_actions.submit(lambda: None)
+        except RuntimeError:
+            return True  # shut down: everything queued has run
+        done, _ = wait([marker], timeout=timeout)
+        return marker in done
+
+    def call_monitoring_service(
+        self,
+        sensor,
+        detected_at: Optional[float] = None,
+        trace: Optional[IntrusionTrace] = None,
+    ):
         """
-        Call monitoring service (simulation)
-        In real system, would dial monitoring phone number
+        Report an intrusion to the monitoring service
+        All monitoring channels are contacted concurrently in background
+        threads; results and latencies are logged when they answer.
 
         Args:
             sensor: Sensor that triggered alarm
+            detected_at: Clock time of the detection (defaults to now)
+            trace: Intrusion trace to complete (optional)
+
+        Returns:
+            MonitoringIncident tracking the per-channel results
         """
         phone = self.config.settings.monitoring_phone
         self.config.logger.add_log(
@@ -175,6 +521,40 @@ class System:
             source="System",
         )
         print(f"☏ Calling {phone}: INTRUSION at {sensor.location}")
+        alert = self.monitoring.create_alert(
+            sensor.location,
+            f"Intrusion detected at {sensor.location}",
+            sensor_id=getattr(sensor, "sensor_id", None),
+            zone_id=getattr(sensor, "zone_id", None),
+            # Channels answer in real time; a virtual detection stamp
+            # would skew their trigger-to-acknowledgement latency
+            triggered_at=None if self.clock.virtual else detected_at,
+        )
+        incident = self.monitoring.dispatch(alert)
+        if trace is not None:
+            trace.mark(STAGE_MONITORING)
+        return incident
+
+    def add_monitoring_channel(self, channel: MonitoringChannel):
+        """
+        Report alarms on an additional channel (webhook, e-mail, gateway)
+        A channel with the same name replaces the existing one.
+
+        Args:
+            channel: MonitoringChannel instance
+        """
+        self.monitoring.add_channel(channel)
+        self.config.logger.add_log(
+            f"Monitoring channel '{channel.name}' enabled", source="System"
+        )
+
+    def get_monitoring_latency(self) -> dict:
+        """Get trigger-to-acknowledgement latency per monitoring channel"""
+        return self.monitoring.get_latency_stats()
+
+    def get_intrusion_latency(self) -> dict:
+        """Get per-hop latency of recent intrusions (see IntrusionTracer)"""
+        return self.tracer.stage_breakdown()
 
     # ===== Mode Control =====
     def arm_system(self, mode: SafeHomeMode):
@@ -233,6 +613,7 @@ class System:
         zone = self.config.get_safety_zone(zone_id)
         if zone:
             zone.arm()
+            self.config.storage.save_safety_zone(zone)
             self.config.logger.add_log(f"Zone {zone.name} ARMED", source="System")
 
     def disarm_zone(self, zone_id: int):
@@ -247,6 +628,7 @@ class System:
         zone = self.config.get_safety_zone(zone_id)
         if zone:
             zone.disarm()
+            self.config.storage.save_safety_zone(zone)
             self.config.logger.add_log(f"Zone {zone.name} DISARMED", source="System")
 
     # ===== Login Control =====
@@ -269,6 +651,50 @@ class System:
             user_id, password, interface_type
         )
 
+    def check_credentials(
+        self, user_id: str, password: str, interface_type: str = "WEB"
+    ) -> bool:
+        """
+        Check per-request credentials (see LoginManager.check_credentials)
+
+        Returns:
+            True if the credentials are valid
+        """
+        return self.config.login_manager.check_credentials(
+            user_id, password, interface_type
+        )
+
+    def create_session(
+        self, user_id: str, password: str, interface_type: str = "WEB"
+    ) -> Optional[str]:
+        """
+        Log in and open a session (see LoginManager.create_session)
+
+        Returns:
+            Session token, or None if the login failed
+        """
+        return self.config.login_manager.create_session(
+            user_id, password, interface_type
+        )
+
+    def validate_session(self, token: Optional[str], interface_type: str = "WEB"):
+        """
+        Check a session token and extend its expiry
+
+        Returns:
+            The Session, or None if the token is not valid
+        """
+        return self.config.login_manager.validate_session(token, interface_type)
+
+    def logout(self, token: str) -> bool:
+        """
+        End a session and record its logout time
+
+        Returns:
+            True if the session was active
+        """
+        return self.config.login_manager.end_session(token)
+
     def change_password(
         self,
         old_password: str,
@@ -300,12 +726,18 @@ class System:
         return changed
 
     def _send_password_change_alert(self) -> bool:
-        """Send an email alert when the admin (control panel) password changes."""
-        return self.config.send_email_alert(
+        """
+        Queue an email alert when the admin (control panel) password changes.
+
+        Returns:
+            True if the alert was queued for delivery
+        """
+        notification_id = self.config.queue_email_alert(
             "SafeHome password changed",
             "Your SafeHome control panel password was changed.\n"
             "If you did not make this change, please reset it immediately.",
         )
+        return notification_id is not None
 
     # ===== Helper Methods =====
     def _get_sensors_for_mode(self, mode: SafeHomeMode) -> List[int]:
@@ -0,0 +1,278 @@
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+# Hops of the intrusion critical path, in order
+STAGE_INTRUDE = "intrude"  # hardware sensor tripped
+STAGE_DETECTED = "detected"  # poll_sensors reported it
+STAGE_HANDLED = "handled"  # _handle_intrusion started
+STAGE_LOG_PERSISTED = "log_persisted"  # intrusion log row written
+STAGE_ENTRY_DELAY = "entry_delay_elapsed"  # countdown finished
+STAGE_ALARM_RING = "alarm_ring"  # Alarm.ring() called
+STAGE_MONITORING = "monitoring_called"  # monitoring service dispatched
+
+STAGES = (
+    STAGE_INTRUDE,
+    STAGE_DETECTED,
+    STAGE_HANDLED,
+    STAGE_LOG_PERSISTED,
+    STAGE_ENTRY_DELAY,
+    STAGE_ALARM_RING,
+    STAGE_MONITORING,
+)
+
+
+@dataclass
+class Span:
+    """One hop of an intrusion, stamped with the tracer's clock"""
+
+    stage: str
+    at: float
+
+
+@dataclass
+class IntrusionTrace:
+    """
+    Timeline of one intrusion from sensor trip to monitoring call
+    Spans are added by whichever thread reaches the hop (polling thread,
+    entry delay countdown, alarm scheduler); outcome is set when the
+    intrusion ends ("alarm" or "cancelled" if disarmed during the delay).
+    """
+
+    incident_id: int
+    sensor_id: Optional[int] = None
+    location: str = ""
+    spans: List[Span] = field(default_factory=list)
+    outcome: Optional[str] = None
+    clock: Callable[[], float] = field(
+        default=time.monotonic, repr=False, compare=False
+    )
+
+    def mark(self, stage: str, at: Optional[float] = None):
+        """Record reaching a stage (at defaults to now)"""
+        self.spans.append(Span(stage, self.clock() if at is None else at))
+
+    def finish(self, outcome: str):
+        self.outcome = outcome
+
+    def get_span(self, stage: str) -> Optional[Span]:
+        for span in self.spans:
+            if span.stage == stage:
+                return span
+        return None
+
+    def hop_latencies(self) -> Dict[str, float]:
+        """Seconds from the previous span to each span (first span omitted)"""
+        spans = list(self.spans)
+        return {
+            current.stage: current.at - previous.at
+            for previous, current in zip(spans, spans[1:])
+        }
+
+    def total_latency(self) -> Optional[float]:
+        """Seconds from the first to the last span"""
+        spans = list(self.spans)
+        if len(spans) < 2:
+            return None
+        return spans[-1].at - spans[0].at
+
+    def to_dict(self) -> dict:
+        spans = list(self.spans)
+        origin = spans[0].at if spans else 0.0
+        return {
+            "incident_id": self.incident_id,
+            "sensor_id": self.sensor_id,
+            "location": self.location,
+            "outcome": self.outcome,
+            "spans": [
+                {
+                    "stage": span.stage,
+                    "at": span.at,
+                    "offset_ms": round((span.at - origin) * 1000, 3),
+                }
+                for span in spans
+            ],
+        }
+
+
+class IntrusionTracer:
+    """
+    In-memory buffer of intrusion traces
+    Keeps the most recent `capacity` traces; export_json() dumps them and
+    stage_breakdown() summarizes the per-hop latency across all of them.
+    """
+
+    def __init__(
+        self, capacity: int = 1000, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize Intrusion Tracer
+
+        Args:
+            capacity: Traces kept (oldest dropped first)
+            clock: Monotonic time source in seconds
+        """
+        self.clock = clock
+        self._traces = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # Detection time of each sensor's latest trace (stale-stamp check)
+        self._last_detected: Dict[Optional[int], float] = {}
+
+    def start(
+        self,
+        sensor,
+        detected_at: Optional[float] = None,
+        intruded_at: Optional[float] = None,
+    ) -> IntrusionTrace:
+        """
+        Open a trace for a detected intrusion
+
+        Args:
+            sensor: Sensor that detected the intrusion
+            detected_at: When polling saw it (defaults to now)
+            intruded_at: When the hardware tripped (defaults to the
+                hardware's intruded_at, if it records one)
+
+        Returns:
+            New IntrusionTrace, already holding the intrude/detected spans
+        """
+        if detected_at is None:
+            detected_at = self.clock()
+        if intruded_at is None:
+            hardware = getattr(sensor, "hardware", None)
+            intruded_at = getattr(hardware, "intruded_at", None)
+        sensor_id = getattr(sensor, "sensor_id", None)
+        trace = IntrusionTrace(
+            incident_id=next(self._ids),
+            sensor_id=sensor_id,
+            location=getattr(sensor, "location", ""),
+            clock=self.clock,
+        )
+        with self._lock:
+            previous = self._last_detected.get(sensor_id)
+            self._last_detected[sensor_id] = detected_at
+            self._traces.append(trace)
+        # The trip must precede this detection and follow the sensor's
+        # previous one; anything else is a stale stamp from an earlier
+        # intrusion on the same hardware
+        if (
+            intruded_at is not None
+            and intruded_at <= detected_at
+            and (previous is None or intruded_at > previous)
+        ):
+            trace.mark(STAGE_INTRUDE, intruded_at)
+        trace.mark(STAGE_DETECTED, detected_at)
+        return trace
+
+    def get_traces(self) -> List[IntrusionTrace]:
+        with self._lock:
+            return list(self._traces)
+
+    def get_trace(self, incident_id: int) -> Optional[IntrusionTrace]:
+        for trace in self.get_traces():
+            if trace.incident_id == incident_id:
+                return trace
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._traces.clear()
+            self._last_detected.clear()
+
+    def export_json(self, path: Optional[str] = None) -> str:
+        """
+        Export all buffered traces as JSON
+
+        Args:
+            path: File to write (optional)
+
+        Returns:
+            JSON text
+        """
+        text = json.dumps(
+            {
+                "traces": [trace.to_dict() for trace in self.get_traces()],
+                "breakdown": self.stage_breakdown(),
+            },
+            indent=2,
+        )
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def stage_breakdown(
+        self, traces: Optional[List[IntrusionTrace]] = None
+    ) -> Dict[str, dict]:
+        """
+        Summarize the latency of each hop across traces
+
+        Args:
+            traces: Traces to summarize (default: all buffered traces)
+
+        Returns:
+            {stage: {"count", "mean_ms", "p50_ms", "p99_ms", "max_ms"}} in
+            critical-path order, plus "total" (first to last span)
+        """
+        samples: Dict[str, List[float]] = {}
+        for trace in self.get_traces() if traces is None else traces:
+            for stage, seconds in trace.hop_latencies().items():
+                samples.setdefault(stage, []).append(seconds)
+            total = trace.total_latency()
+            if total is not None and trace.get_span(STAGE_MONITORING):
+                samples.setdefault("total", []).append(total)
+        order = [s for s in STAGES if s in samples]
+        order += sorted(s for s in samples if s not in STAGES and s != "total")
+        if "total" in samples:
+            order.append("total")
+        breakdown = {}
+        for stage in order:
+            values = sorted(samples[stage])
+            breakdown[stage] = {
+                "count": len(values),
+                "mean_ms": round(sum(values) / len(values) * 1000, 3),
+                "p50_ms": round(_percentile(values, 50) * 1000, 3),
+                "p99_ms": round(_percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            }
+        return breakdown
+
+    def report(self, traces: Optional[List[IntrusionTrace]] = None) -> str:
+        """
+        Format the stage breakdown as a table
+
+        Args:
+            traces: Traces to summarize (default: all buffered traces)
+
+        Returns:
+            Report text
+        """
+        if traces is None:
+            traces = self.get_traces()
+        breakdown = self.stage_breakdown(traces)
+        lines = [
+            f"Intrusion latency: {len(traces)} traces",
+            f"  {'stage':<22} {'count':>6} {'mean ms':>10} {'p50 ms':>10} "
+            f"{'p99 ms':>10} {'max ms':>10}",
+        ]
+        for stage, stats in breakdown.items():
+            lines.append(
+                f"  {stage:<22} {stats['count']:>6} {stats['mean_ms']:>10.3f} "
+                f"{stats['p50_ms']:>10.3f} {stats['p99_ms']:>10.3f} "
+                f"{stats['max_ms']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
@@ -1,25 +1,75 @@
+import re
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Optional, Tuple
 
+from .query_profiler import QueryProfiler
+
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+STATEMENT_TABLE_PATTERN = re.compile(
+    r"\b(?:FROM|INTO|UPDATE|TABLE(?: IF (?:NOT )?EXISTS)?)\s+(\w+)", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=512)
+def summarize_statement(query: str) -> str:
+    """
+    Short, low-cardinality label for a SQL statement, e.g. "SELECT event_logs"
+
+    Args:
+        query: SQL text
+
+    Returns:
+        Statement verb followed by the first table it names
+    """
+    words = query.split(None, 1)
+    verb = words[0].upper() if words else "?"
+    match = STATEMENT_TABLE_PATTERN.search(query)
+    return f"{verb} {match.group(1)}" if match else verb
+
 
 class DatabaseManager:
     """
     SQLite3 Database Manager for SafeHome System
-    Handles database connection, schema initialization, and query execution
+    Handles database connection, schema migrations, and query execution
     """
 
-    def __init__(self, db_path: str = "data/safehome.db"):
+    MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+    def __init__(self, db_path: str = "data/safehome.db", metrics=None):
         """
         Initialize Database Manager
 
         Args:
             db_path: Path to SQLite database file
+            metrics: Optional MetricsRegistry receiving per-statement timings
         """
         self.db_path = db_path
+        self.metrics = metrics
+        # Opt-in per-statement profiling (see enable_profiling)
+        self.profiler: Optional[QueryProfiler] = None
         self.connection: Optional[sqlite3.Connection] = None
+        # batch() nesting depth, tracked per thread
+        self._batch_local = threading.local()
+        # Held for the whole of a batch() block and around every statement, so
+        # other threads' writes wait for the batch instead of joining (and
+        # possibly being rolled back with) its transaction
+        self._batch_lock = threading.RLock()
         self._ensure_db_directory()
 
+    @property
+    def _batch_depth(self) -> int:
+        """batch() nesting depth of the calling thread"""
+        return getattr(self._batch_local, "depth", 0)
+
+    @_batch_depth.setter
+    def _batch_depth(self, value: int):
+        self._batch_local.depth = value
+
     def _ensure_db_directory(self):
         """Ensure database directory exists"""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -51,21 +101,117 @@ class DatabaseManager:
 
     def initialize_schema(self):
         """
-        Initialize database schema from schema.sql file
-        Creates all tables and inserts default data
+        Bring the database schema up to date
+        Applies any pending numbered migrations; a no-op when already current
         """
-        schema_path = Path(__file__).parent / "schema.sql"
+        self.migrate()
 
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    # ===== Schema Migrations =====
 
-        with open(schema_path, "r") as f:
-            schema_sql = f.read()
+    @classmethod
+    def get_available_migrations(cls) -> List[Tuple[int, str, Path]]:
+        """
+        Discover migration files in MIGRATIONS_DIR
 
-        # Execute schema SQL
-        cursor = self.connection.cursor()
-        cursor.executescript(schema_sql)
-        self.connection.commit()
+        Migration files are named ``NNNN_description.sql`` and are applied
+        in ascending numeric order.
+
+        Returns:
+            Sorted list of (version, name, path) tuples
+        """
+        migrations_dir = Path(cls.MIGRATIONS_DIR)
+        if not migrations_dir.is_dir():
+            raise FileNotFoundError(f"Migrations directory not found: {migrations_dir}")
+
+        migrations = []
+        for path in migrations_dir.glob("*.sql"):
+            match = MIGRATION_FILE_PATTERN.match(path.name)
+            if match:
+                migrations.append((int(match.group(1)), match.group(2), path))
+        migrations.sort(key=lambda m: m[0])
+        return migrations
+
+    def get_schema_version(self) -> int:
+        """
+        Get the highest applied migration version
+
+        Returns:
+            int: Current schema version (0 for an empty/unversioned database)
+        """
+        if self.connection is None:
+            self.connect()
+        row = self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+            ("schema_version",),
+        ).fetchone()
+        if row is None:
+            return 0
+        row = self.connection.execute(
+            "SELECT MAX(version) AS version FROM schema_version"
+        ).fetchone()
+        return row["version"] or 0
+
+    def migrate(self, target_version: Optional[int] = None) -> List[int]:
+        """
+        Apply pending migrations, each in its own transaction
+
+        Args:
+            target_version: Stop after this version (default: latest)
+
+        Returns:
+            List of migration versions applied by this call
+
+        Raises:
+            sqlite3.Error: If a migration fails (that migration is rolled back)
+        """
+        if self.connection is None:
+            self.connect()
+
+        migrations = self.get_available_migrations()
+        if not migrations:
+            raise FileNotFoundError(f"No migrations found in {self.MIGRATIONS_DIR}")
+
+        latest = migrations[-1][0] if target_version is None else target_version
+        current = self.get_schema_version()
+        # Fast path: database already current, skip reading any SQL
+        if current >= latest:
+            return []
+
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """)
+
+        applied = []
+        for version, name, path in migrations:
+            if version <= current or version > latest:
+                continue
+            self._apply_migration(version, name, path)
+            applied.append(version)
+        return applied
+
+    def _apply_migration(self, version: int, name: str, path: Path):
+        """Run one migration script and record it atomically"""
+        with open(path, "r") as f:
+            migration_sql = f.read()
+
+        # executescript() commits any open transaction and ignores the
+        # connection's transaction state, so the script opens its own
+        # transaction, which stays open until its schema_version row is in.
+        try:
+            self.connection.executescript(f"BEGIN;\n{migration_sql}\n;")
+            self.connection.execute(
+                "INSERT INTO schema_version (version, name) VALUES (?, ?)",
+                (version, name),
+            )
+            self.connection.execute("COMMIT")
+        except sqlite3.Error:
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            raise
 
     def execute_query(
         self,
@@ -88,19 +234,31 @@ class DatabaseManager:
         """
         if self.connection is None:  # Ensure connection is open before proceeding
             self.connect()
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
+        timed = self.metrics is not None or self.profiler is not None
+        start = time.perf_counter() if timed else None
+        with self._batch_lock:
+            cursor = self.connection.cursor()
+            cursor.execute(query, params)
 
-        if fetch_one:
-            return cursor.fetchone()
-        elif fetch_all:
-            return cursor.fetchall()
-        else:
-            # For non-SELECT queries, we might want the cursor itself
-            # to get info like lastrowid, but we need a consistent return type.
-            # We will return the cursor for legacy compatibility but encourage
-            # using execute_insert_query for inserts.
-            return cursor
+            if fetch_one:
+                result = cursor.fetchone()
+            elif fetch_all:
+                result = cursor.fetchall()
+            else:
+                # For non-SELECT queries, we might want the cursor itself
+                # to get info like lastrowid, but we need a consistent return
+                # type. We will return the cursor for legacy compatibility but
+                # encourage using execute_insert_query for inserts.
+                result = cursor
+        if start is not None:
+            if fetch_all:
+                rows = len(result)
+            elif fetch_one:
+                rows = 0 if result is None else 1
+            else:
+                rows = cursor.rowcount
+            self._observe_query(query, start, rows)
+        return result
 
     def execute_insert_query(self, query: str, params: Tuple = ()) -> Optional[int]:
         """
@@ -115,13 +273,19 @@ class DatabaseManager:
         """
         if self.connection is None:
             self.connect()
+        timed = self.metrics is not None or self.profiler is not None
+        start = time.perf_counter() if timed else None
         cursor = self.connection.cursor()
         try:
-            cursor.execute(query, params)
+            with self._batch_lock:
+                cursor.execute(query, params)
             return cursor.lastrowid
         except Exception as e:
             print(f"Error during insert query: {e}")
             return None
+        finally:
+            if start is not None:
+                self._observe_query(query, start, cursor.rowcount)
 
     def execute_many(self, query: str, params_list: List[Tuple]):
         """
@@ -131,18 +295,112 @@ class DatabaseManager:
             query: SQL query string
             params_list: List of parameter tuples
         """
+        timed = self.metrics is not None or self.profiler is not None
+        start = time.perf_counter() if timed else None
         cursor = self.connection.cursor()
-        cursor.executemany(query, params_list)
+        with self._batch_lock:
+            cursor.executemany(query, params_list)
+        if start is not None:
+            self._observe_query(query, start, cursor.rowcount)
+
+    def _observe_query(self, query: str, start: float, rows: Optional[int] = None):
+        """Report a statement's duration to the metrics registry and profiler"""
+        duration = time.perf_counter() - start
+        if self.metrics is not None:
+            self.metrics.histogram(
+                "safehome_db_query_seconds",
+                "SQL statement execution time",
+                statement=summarize_statement(query),
+            ).observe(duration)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.record(
+                query, duration, rows if rows is None or rows >= 0 else None
+            )
+
+    # ===== Query Profiling =====
+
+    def enable_profiling(
+        self,
+        slow_threshold: Optional[float] = None,
+        slow_log_path: Optional[str] = None,
+    ) -> QueryProfiler:
+        """
+        Start recording per-statement timings
+        Statements are grouped by shape (literals and whitespace collapsed).
+        Disabled by default: without a profiler no timing is taken at all.
+
+        Args:
+            slow_threshold: Seconds at or above which a statement is logged
+                as slow (None: no slow-query log)
+            slow_log_path: File slow statements are appended to
+
+        Returns:
+            The active QueryProfiler
+        """
+        self.profiler = QueryProfiler(
+            slow_threshold=slow_threshold, slow_log_path=slow_log_path
+        )
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[QueryProfiler]:
+        """Stop profiling and return the profiler with its collected data"""
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def dump_profile(self, sort_by: str = "total", limit: Optional[int] = 20) -> str:
+        """
+        Report the statements recorded since enable_profiling()
+
+        Args:
+            sort_by: "total", "count", "p99", "max" or "rows"
+            limit: Statements shown (None for all)
+
+        Returns:
+            Report text (a hint if profiling is disabled)
+        """
+        if self.profiler is None:
+            return "SQL profiling is disabled (call enable_profiling())"
+        return self.profiler.report(sort_by=sort_by, limit=limit)
 
     def commit(self):
-        """Commit current transaction"""
-        if self.connection:
-            self.connection.commit()
+        """Commit current transaction (deferred while inside batch())"""
+        if self.connection and self._batch_depth == 0:
+            with self._batch_lock:
+                self.connection.commit()
 
     def rollback(self):
         """Rollback current transaction"""
         if self.connection:
-            self.connection.rollback()
+            with self._batch_lock:
+                self.connection.rollback()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into a single transaction
+        commit() calls inside the block are deferred until it exits, so many
+        small writes cost one journal sync instead of one each. Nesting is
+        allowed; only the outermost block commits or rolls back. While a
+        block is open, statements from other threads wait for it to exit.
+        """
+        if self.connection is None:
+            self.connect()
+        with self._batch_lock:
+            outermost = self._batch_depth == 0
+            if outermost and not self.connection.in_transaction:
+                self.connection.execute("BEGIN")
+            self._batch_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._batch_depth -= 1
+                if outermost and self.connection.in_transaction:
+                    self.connection.rollback()
+                raise
+            self._batch_depth -= 1
+            if outermost:
+                self.connection.commit()
 
     def get_last_insert_id(self) -> int:
         """
@@ -249,6 +507,8 @@ class DatabaseManager:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         limit: int = 100,
+        before_log_id: Optional[int] = None,
+        offset: int = 0,
     ) -> List[sqlite3.Row]:
         """
         Get event logs with optional filters
@@ -258,6 +518,8 @@ class DatabaseManager:
             start_date: Start date (ISO format)
             end_date: End date (ISO format)
             limit: Maximum number of rows to return
+            before_log_id: Only return rows with a smaller log_id
+            offset: Number of matching rows to skip (for paging)
 
         Returns:
             List of log entries
@@ -277,8 +539,12 @@ class DatabaseManager:
             query += " AND event_timestamp <= ?"
             params.append(end_date)
 
-        query += " ORDER BY event_timestamp DESC LIMIT ?"
-        params.append(limit)
+        if before_log_id is not None:
+            query += " AND log_id < ?"
+            params.append(before_log_id)
+
+        query += " ORDER BY event_timestamp DESC, log_id DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
 
         return self.execute_query(query, tuple(params), fetch_all=True)
 
@@ -1,5 +1,6 @@
 -- SafeHome Database Schema (SQLite3)
 -- Based on SRS and SDS requirements
+-- Migration 0001: initial schema and default data
 
 -- 1. SystemSettings Table
 CREATE TABLE IF NOT EXISTS system_settings (
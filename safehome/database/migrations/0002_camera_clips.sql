@@ -0,0 +1,25 @@
+-- Migration 0002: camera zones and recorded intrusion clips
+
+-- Cameras may be assigned to a safety zone so intrusions there are recorded
+ALTER TABLE cameras ADD COLUMN zone_id INTEGER REFERENCES safety_zones(zone_id) ON DELETE SET NULL;
+
+-- Pre/post-event clips written on intrusion (one row per camera and event)
+CREATE TABLE IF NOT EXISTS camera_clips (
+    clip_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    camera_id INTEGER,
+    log_id INTEGER,                   -- event_logs row of the intrusion
+    sensor_id INTEGER,
+    file_path TEXT NOT NULL,          -- MJPEG file (concatenated JPEG frames)
+    frame_count INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    event_time TIMESTAMP NOT NULL,
+    start_time TIMESTAMP,
+    end_time TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (camera_id) REFERENCES cameras(camera_id) ON DELETE SET NULL,
+    FOREIGN KEY (log_id) REFERENCES event_logs(log_id) ON DELETE SET NULL,
+    FOREIGN KEY (sensor_id) REFERENCES sensors(sensor_id) ON DELETE SET NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_camera_clips_log ON camera_clips(log_id);
+CREATE INDEX IF NOT EXISTS idx_camera_clips_camera ON camera_clips(camera_id, event_time DESC);
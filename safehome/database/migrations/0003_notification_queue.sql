@@ -0,0 +1,18 @@
+-- Migration 0003: persisted outgoing notification queue
+
+-- Alerts waiting for (or retrying) delivery by the NotificationDispatcher
+CREATE TABLE IF NOT EXISTS notification_queue (
+    notification_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL DEFAULT 'EMAIL',
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'PENDING',  -- 'PENDING', 'SENT', 'FAILED'
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,           -- Unix time of the next try
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_queue_due ON notification_queue(status, next_attempt_at);
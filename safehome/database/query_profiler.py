@@ -0,0 +1,201 @@
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(query: str) -> str:
+    """
+    Collapse a SQL statement to its shape
+    Literals become ?, placeholder lists become (?...) and whitespace is
+    collapsed, so statements differing only in values share one entry.
+    """
+    text = _STRING_LITERAL.sub("?", query)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _PLACEHOLDER_LIST.sub("(?...)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class _StatementStats:
+    __slots__ = ("count", "total", "max", "rows", "samples")
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.samples = deque(maxlen=sample_size)  # most recent durations
+
+
+class QueryProfiler:
+    """
+    Per-statement SQL timing
+    DatabaseManager reports every statement it executes; statements are
+    grouped by normalize_statement(). Statements slower than slow_threshold
+    are kept in slow_queries and optionally appended to a slow-query log
+    file (statement shape only: parameters may hold passwords).
+    """
+
+    def __init__(
+        self,
+        slow_threshold: Optional[float] = None,
+        slow_log_path: Optional[str] = None,
+        sample_size: int = 1024,
+        max_slow_queries: int = 100,
+    ):
+        """
+        Initialize Query Profiler
+
+        Args:
+            slow_threshold: Seconds at or above which a statement is slow
+                (None disables the slow-query log)
+            slow_log_path: File slow statements are appended to (optional)
+            sample_size: Recent durations kept per statement for percentiles
+            max_slow_queries: Slow statements kept in memory
+        """
+        self.slow_threshold = slow_threshold
+        self.slow_log_path = slow_log_path
+        self.sample_size = sample_size
+        self.slow_queries = deque(maxlen=max_slow_queries)
+        self._stats: Dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, query: str, duration: float, rows: Optional[int] = None):
+        """
+        Record one executed statement
+
+        Args:
+            query: SQL text as executed
+            duration: Execution time in seconds
+            rows: Rows returned or affected (None if unknown)
+        """
+        statement = normalize_statement(query)
+        with self._lock:
+            stats = self._stats.get(statement)
+            if stats is None:
+                stats = self._stats[statement] = _StatementStats(self.sample_size)
+            stats.count += 1
+            stats.total += duration
+            stats.samples.append(duration)
+            if duration > stats.max:
+                stats.max = duration
+            if rows is not None and rows > 0:
+                stats.rows += rows
+        if self.slow_threshold is not None and duration >= self.slow_threshold:
+            self._log_slow(statement, duration, rows)
+
+    def _log_slow(self, statement: str, duration: float, rows: Optional[int]):
+        entry = {
+            "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+            "duration_ms": round(duration * 1000, 3),
+            "rows": rows,
+            "statement": statement,
+        }
+        self.slow_queries.append(entry)
+        if not self.slow_log_path:
+            return
+        try:
+            with open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write(
+                    f"{entry['timestamp']} {entry['duration_ms']:.3f}ms "
+                    f"rows={rows} {statement}\n"
+                )
+        except IOError as e:
+            print(f"Error writing slow query log: {e}")
+
+    def get_stats(self, sort_by: str = "total") -> List[dict]:
+        """
+        Get per-statement statistics
+
+        Args:
+            sort_by: "total", "count", "p99", "max" or "rows" (descending)
+
+        Returns:
+            List of {"statement", "count", "total_ms", "mean_ms", "p50_ms",
+            "p99_ms", "max_ms", "rows"}
+        """
+        with self._lock:
+            items = [
+                (statement, s.count, s.total, s.max, s.rows, sorted(s.samples))
+                for statement, s in self._stats.items()
+            ]
+        stats = []
+        for statement, count, total, largest, rows, samples in items:
+            stats.append(
+                {
+                    "statement": statement,
+                    "count": count,
+                    "total_ms": total * 1000,
+                    "mean_ms": total / count * 1000,
+                    "p50_ms": _percentile(samples, 50) * 1000,
+                    "p99_ms": _percentile(samples, 99) * 1000,
+                    "max_ms": largest * 1000,
+                    "rows": rows,
+                }
+            )
+        key = {"total": "total_ms", "p99": "p99_ms", "max": "max_ms"}.get(
+            sort_by, sort_by
+        )
+        stats.sort(key=lambda s: s[key], reverse=True)
+        return stats
+
+    def reset(self):
+        """Discard all recorded statistics"""
+        with self._lock:
+            self._stats.clear()
+            self.slow_queries.clear()
+            self.started_at = time.time()
+
+    def report(self, sort_by: str = "total", limit: Optional[int] = 20) -> str:
+        """
+        Format the statistics as a fixed-width table
+
+        Args:
+            sort_by: Sort key (see get_stats)
+            limit: Statements shown (None for all)
+
+        Returns:
+            Report text
+        """
+        stats = self.get_stats(sort_by)
+        shown = stats if limit is None else stats[:limit]
+        total_ms = sum(s["total_ms"] for s in stats)
+        lines = [
+            f"SQL profile: {len(stats)} statements, "
+            f"{sum(s['count'] for s in stats)} executions, {total_ms:.1f} ms total",
+            f"{'count':>8} {'total ms':>10} {'p50 ms':>9} {'p99 ms':>9} "
+            f"{'rows':>8}  statement",
+        ]
+        for s in shown:
+            statement = s["statement"]
+            if len(statement) > 100:
+                statement = statement[:97] + "..."
+            lines.append(
+                f"{s['count']:>8} {s['total_ms']:>10.2f} {s['p50_ms']:>9.3f} "
+                f"{s['p99_ms']:>9.3f} {s['rows']:>8}  {statement}"
+            )
+        if self.slow_queries:
+            lines.append(
+                f"{len(self.slow_queries)} slow statement(s) "
+                f">= {self.slow_threshold * 1000:.1f} ms"
+            )
+        return "\n".join(lines)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
@@ -1,56 +1,173 @@
 import threading
-import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from .scheduler import ScheduledCall, Scheduler, get_default_scheduler
+
+
+@dataclass(frozen=True)
+class AlarmStage:
+    """
+    One escalation step of a ringing alarm
+    The alarm enters the stage `after` seconds after ring(); the stage name
+    becomes the alarm state (e.g. "CHIRP", "SIREN").
+    """
+
+    name: str
+    after: float = 0.0
+    call_monitoring: bool = False  # report to the monitoring service on entry
+
+
+STATE_IDLE = "IDLE"
+
+# Siren at once and an immediate monitoring call (SRS UC8, UC9)
+DEFAULT_STAGES = (AlarmStage("SIREN", 0.0, call_monitoring=True),)
 
 
 class Alarm:
     """
     Alarm hardware driver (simulation)
-    Implements alarm control with automatic shutoff timer
+    Implements alarm control with escalation stages and automatic shutoff
     Based on SRS requirements for alarm activation (UC8, UC9, UC16)
+
+    The alarm is a state machine (IDLE -> stage -> stage ... -> IDLE) whose
+    timed transitions run on a Scheduler. Every ring() starts a new
+    generation; timers carry the generation they were scheduled for and are
+    ignored once the alarm was stopped or rung again, so a stale shutoff
+    can never silence a newer alarm.
     """
 
-    def __init__(self, duration: int = 180):
+    def __init__(
+        self,
+        duration: int = 180,
+        stages: Optional[Sequence[AlarmStage]] = None,
+        scheduler: Optional[Scheduler] = None,
+    ):
         """
         Initialize Alarm
 
         Args:
             duration: Duration in seconds before auto-shutoff (default: 180s = 3 minutes)
+            stages: Escalation stages (default: siren plus monitoring call)
+            scheduler: Timer scheduler (default: shared process scheduler)
         """
         self.duration = duration
-        self.is_ringing = False
-        self._alarm_thread: Optional[threading.Thread] = None
-
-    def ring(self):
+        self.stages = self._validate_stages(stages or DEFAULT_STAGES)
+        self.scheduler = scheduler
+        self.state = STATE_IDLE
+        self.generation = 0
+        self.context: Any = None  # what triggered the current alarm
+        self._timers: List[ScheduledCall] = []
+        self._lock = threading.RLock()
+        # Optional callback(is_ringing: bool) on start/stop transitions
+        self.on_state_change = None
+        # Optional callback(stage, generation, context) on entering a stage
+        self.on_stage = None
+
+    @property
+    def is_ringing(self) -> bool:
+        return self.state != STATE_IDLE
+
+    def ring(self, context: Any = None) -> Optional[int]:
         """
         Trigger the alarm
-        Starts alarm sound in separate thread with auto-shutoff
-        """
-        if self.is_ringing:
-            # Alarm already ringing
-            return
+        Enters the first stage at once and schedules later stages and the
+        auto-shutoff
 
-        self.is_ringing = True
-        self._alarm_thread = threading.Thread(
-            target=self._ring_for_duration, daemon=True
-        )
-        self._alarm_thread.start()
+        Args:
+            context: Opaque trigger details passed to on_stage
+
+        Returns:
+            Generation ID of the new alarm, or None if already ringing
+        """
+        with self._lock:
+            if self.is_ringing:
+                # Alarm already ringing
+                return None
+            self.generation += 1
+            generation = self.generation
+            self.context = context
+            first = self.stages[0]
+            self.state = first.name
+            scheduler = self._get_scheduler()
+            self._timers = [
+                scheduler.call_later(stage.after, self._enter_stage, generation, stage)
+                for stage in self.stages[1:]
+            ]
+            self._timers.append(
+                scheduler.call_later(self.duration, self._expire, generation)
+            )
 
-    def _ring_for_duration(self):
-        """
-        Internal method that runs in separate thread
-        Rings alarm for specified duration then auto-stops
-        """
         print("🚨 ALARM RINGING! 🚨")
-        time.sleep(self.duration)
-        self.stop()
+        self._notify_state_change(True)
+        self._notify_stage(first, generation, context)
+        return generation
 
     def stop(self):
         """
         Stop the alarm immediately
         """
-        self.is_ringing = False
+        with self._lock:
+            was_ringing = self._reset()
         print("🔇 Alarm stopped.")
+        if was_ringing:
+            self._notify_state_change(False)
+
+    def _reset(self) -> bool:
+        """Return to IDLE and cancel pending timers (caller holds the lock)"""
+        was_ringing = self.is_ringing
+        self.state = STATE_IDLE
+        self.context = None
+        for timer in self._timers:
+            timer.cancel()
+        self._timers = []
+        return was_ringing
+
+    def _enter_stage(self, generation: int, stage: AlarmStage):
+        """Timer callback: escalate to a stage if the alarm is still current"""
+        with self._lock:
+            if generation != self.generation or not self.is_ringing:
+                return  # stale timer of a stopped or re-rung alarm
+            self.state = stage.name
+            context = self.context
+        print(f"🚨 Alarm escalated: {stage.name}")
+        self._notify_stage(stage, generation, context)
+
+    def _expire(self, generation: int):
+        """Timer callback: auto-shutoff after duration"""
+        with self._lock:
+            if generation != self.generation or not self.is_ringing:
+                return
+            self._reset()
+        print("🔇 Alarm stopped.")
+        self._notify_state_change(False)
+
+    def _notify_state_change(self, is_ringing: bool):
+        """Report a start/stop transition to the registered listener"""
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(is_ringing)
+            except Exception as e:
+                print(f"Error in alarm state callback: {e}")
+
+    def _notify_stage(self, stage: AlarmStage, generation: int, context: Any):
+        if self.on_stage is not None:
+            try:
+                self.on_stage(stage, generation, context)
+            except Exception as e:
+                print(f"Error in alarm stage callback: {e}")
+
+    def _get_scheduler(self) -> Scheduler:
+        if self.scheduler is None:
+            self.scheduler = get_default_scheduler()
+        return self.scheduler
+
+    @staticmethod
+    def _validate_stages(stages: Sequence[AlarmStage]) -> tuple:
+        ordered = tuple(sorted(stages, key=lambda stage: stage.after))
+        if not ordered or ordered[0].after != 0:
+            raise ValueError("The first alarm stage must start at 0 seconds")
+        return ordered
 
     def is_active(self) -> bool:
         """
@@ -63,7 +180,7 @@ class Alarm:
 
     def set_duration(self, duration: int):
         """
-        Set alarm duration
+        Set alarm duration (applies from the next ring)
 
         Args:
             duration: Duration in seconds
@@ -79,6 +196,31 @@ class Alarm:
         """
         return self.duration
 
+    def set_stages(self, stages: Sequence[AlarmStage]):
+        """
+        Configure escalation stages (applies from the next ring)
+        e.g. [AlarmStage("CHIRP"), AlarmStage("SIREN", 10),
+        AlarmStage("SIREN_CALLED", 30, call_monitoring=True)]
+
+        Args:
+            stages: Stages; the earliest must start at 0 seconds
+
+        Raises:
+            ValueError: If no stage starts at 0 seconds
+        """
+        validated = self._validate_stages(stages)
+        with self._lock:
+            self.stages = validated
+
+    def get_state(self) -> str:
+        """
+        Get the current state ("IDLE" or the active stage name)
+
+        Returns:
+            State name
+        """
+        return self.state
+
     def get_status(self) -> dict:
         """
         Get alarm status as dictionary
@@ -86,12 +228,17 @@ class Alarm:
         Returns:
             Dictionary with alarm status information
         """
-        return {
-            "is_ringing": self.is_ringing,
-            "duration": self.duration,
-            "has_active_thread": self._alarm_thread is not None
-            and self._alarm_thread.is_alive(),
-        }
+        with self._lock:
+            return {
+                "is_ringing": self.is_ringing,
+                "state": self.state,
+                "generation": self.generation,
+                "duration": self.duration,
+                "stages": [stage.name for stage in self.stages],
+            }
 
     def __repr__(self):
-        return f"Alarm(ringing={self.is_ringing}, duration={self.duration}s)"
+        return (
+            f"Alarm(state={self.state}, ringing={self.is_ringing}, "
+            f"duration={self.duration}s)"
+        )
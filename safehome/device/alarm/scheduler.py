@@ -0,0 +1,193 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional
+
+from ..clock import REAL_CLOCK, Clock, ManualClock, RealClock
+
+
+class ScheduledCall:
+    """Handle for a callback scheduled on a Scheduler"""
+
+    def __init__(self, when: float, callback: Callable, args: tuple):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Prevent the callback from running (no-op once it ran)"""
+        self.cancelled = True
+
+    def __repr__(self):
+        state = "cancelled" if self.cancelled else "pending"
+        return f"ScheduledCall(when={self.when:.3f}, {state})"
+
+
+class Scheduler:
+    """
+    Timer service running callbacks at clock times
+    All timers share one daemon thread that sleeps until the earliest
+    deadline, instead of one sleeping thread per timer. Callbacks run on
+    that thread and must not block.
+    """
+
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, name: str = "scheduler"
+    ):
+        """
+        Initialize Scheduler
+
+        Args:
+            clock: Monotonic time source in seconds
+            name: Timer thread name
+        """
+        self.clock = clock
+        self.name = name
+        # Clock seconds to wait -> real seconds (AcceleratedClock runs faster)
+        self._real_seconds = getattr(clock, "real_seconds", lambda seconds: seconds)
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_later(self, delay: float, callback: Callable, *args) -> ScheduledCall:
+        """Run callback(*args) after delay seconds"""
+        return self.call_at(self.clock() + max(0.0, delay), callback, *args)
+
+    def call_at(self, when: float, callback: Callable, *args) -> ScheduledCall:
+        """Run callback(*args) at clock time `when`"""
+        call = ScheduledCall(when, callback, args)
+        with self._cond:
+            heapq.heappush(self._heap, (when, next(self._seq), call))
+            self._ensure_thread()
+            self._cond.notify()
+        return call
+
+    def pending(self) -> int:
+        """Get the number of scheduled, not cancelled callbacks"""
+        with self._cond:
+            return sum(1 for _, _, call in self._heap if not call.cancelled)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def _pop_due(self, now: float) -> List[ScheduledCall]:
+        """Remove and return due callbacks in deadline order (lock held)"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            call = heapq.heappop(self._heap)[2]
+            if not call.cancelled:
+                due.append(call)
+        return due
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    now = self.clock()
+                    due = self._pop_due(now)
+                    if due:
+                        break
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._cond.wait(
+                        None if timeout is None else self._real_seconds(timeout)
+                    )
+            self._fire(due)
+
+    def _fire(self, calls: List[ScheduledCall]):
+        for call in calls:
+            if call.cancelled:
+                continue
+            try:
+                call.callback(*call.args)
+            except Exception as e:
+                print(f"Error in scheduled callback: {e}")
+
+
+class ManualScheduler(Scheduler):
+    """
+    Deterministic scheduler for tests and simulation
+    Runs on a ManualClock: time only moves when advance() is called; due
+    callbacks then run on the calling thread in deadline order.
+    """
+
+    def __init__(self, start: float = 0.0, clock: Optional[ManualClock] = None):
+        """
+        Initialize Manual Scheduler
+
+        Args:
+            start: Initial time of the clock created when none is given
+            clock: ManualClock to run on (shared with other components)
+        """
+        super().__init__(
+            clock=clock if clock is not None else ManualClock(start),
+            name="manual-scheduler",
+        )
+        self.clock.attach(self)
+
+    @property
+    def now(self) -> float:
+        return self.clock.now()
+
+    def advance(self, seconds: float) -> int:
+        """
+        Move time forward, running every callback that falls due
+        (advances the shared clock, so timers of other schedulers on it
+        run too)
+
+        Returns:
+            Number of callbacks run
+        """
+        return self.clock.advance(seconds)
+
+    def _next_deadline(self) -> Optional[float]:
+        """Deadline of the earliest pending callback, if any"""
+        with self._cond:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def _run_due(self, now: float) -> int:
+        """Run the callbacks due at `now`"""
+        with self._cond:
+            due = self._pop_due(now)
+        self._fire(due)
+        return sum(1 for call in due if not call.cancelled)
+
+    def _ensure_thread(self):
+        pass  # callbacks only run from advance()
+
+
+_default_scheduler: Optional[Scheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_default_scheduler() -> Scheduler:
+    """Get the process-wide timer scheduler (created on first use)"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = Scheduler(name="safehome-timers")
+        return _default_scheduler
+
+
+def scheduler_for(clock: Clock) -> Scheduler:
+    """
+    Get a scheduler running on the given clock
+    Real time shares the process-wide scheduler; a ManualClock gets a
+    ManualScheduler advanced with it; other clocks get their own timer
+    thread.
+    """
+    if clock is None or clock is REAL_CLOCK or isinstance(clock, RealClock):
+        return get_default_scheduler()
+    if isinstance(clock, ManualClock):
+        return ManualScheduler(clock=clock)
+    return Scheduler(clock=clock, name="safehome-timers")
@@ -1,9 +1,14 @@
-from typing import Dict, List, Optional
-
-from PIL import Image
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from ..clock import REAL_CLOCK, Clock
+from .camera_render import CameraRenderPool
+from .camera_stream import CameraStream, StreamViewer
 from .safehome_camera import SafeHomeCamera
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class CameraAccessGuard:
     """Helper to centralize camera lookup and password/lock checks."""
@@ -43,8 +48,17 @@ class CameraController:
     Based on SRS requirements UC19-25 for camera access control
     """
 
+    STREAM_FPS = 10.0
+
     def __init__(
-        self, storage_manager=None, logger=None, login_manager=None, settings=None
+        self,
+        storage_manager=None,
+        logger=None,
+        login_manager=None,
+        settings=None,
+        lazy: bool = False,
+        metrics=None,
+        clock: Clock = REAL_CLOCK,
     ):
         """
         Initialize Camera Controller
@@ -54,12 +68,16 @@ class CameraController:
             logger: LogManager for logging events
             login_manager: LoginManager for user authentication
             settings: SystemSettings (for lockout policy)
+            lazy: Defer camera hardware startup until each camera is first used
+            metrics: Optional MetricsRegistry receiving view render timings
+            clock: Time source for camera lockouts, hardware and streams
         """
         self.cameras: Dict[int, SafeHomeCamera] = (
             {}
         )  # {camera_id: SafeHomeCamera instance}
         self.storage = storage_manager
         self.logger = logger
+        self.metrics = metrics
         self.login_manager = login_manager
         self._next_camera_id = 1  # Auto-increment camera ID
         self.max_attempts = (
@@ -69,9 +87,17 @@ class CameraController:
             getattr(settings, "system_lock_time", 300) if settings else 300
         )
         self.access_guard = CameraAccessGuard(logger)
+        self.lazy = lazy
+        self.clock = clock
+        self._streams: Dict[int, CameraStream] = {}  # shared MJPEG producers
+        self._render_pool: Optional[CameraRenderPool] = None  # started on demand
 
     def add_camera(
-        self, name: str, location: str, password: Optional[str] = None
+        self,
+        name: str,
+        location: str,
+        password: Optional[str] = None,
+        zone_id: Optional[int] = None,
     ) -> SafeHomeCamera:
         """
         Add a new camera to the system
@@ -80,6 +106,7 @@ class CameraController:
             name: Camera name
             location: Physical location description
             password: Optional password for camera access
+            zone_id: Optional safety zone the camera covers
 
         Returns:
             Created camera instance
@@ -95,6 +122,9 @@ class CameraController:
             password,
             max_attempts=self.max_attempts,
             lockout_seconds=self.lockout_seconds,
+            lazy=self.lazy,
+            zone_id=zone_id,
+            clock=self.clock,
         )
 
         # Store camera
@@ -103,6 +133,8 @@ class CameraController:
         # Persist to database
         if self.storage:
             self.storage.save_camera(camera_id, name, location, password)
+            if zone_id is not None:
+                self.storage.update_camera_zone(camera_id, zone_id)
 
         # Log event
         if self.logger:
@@ -128,7 +160,10 @@ class CameraController:
 
         camera = self.cameras[camera_id]
 
-        # Stop camera hardware
+        # Stop any live stream and the camera hardware
+        stream = self._streams.pop(camera_id, None)
+        if stream:
+            stream.stop()
         camera.stop()
 
         # Remove from memory
@@ -154,9 +189,54 @@ class CameraController:
         """Get list of all cameras"""
         return list(self.cameras.values())
 
+    def set_camera_zone(self, camera_id: int, zone_id: Optional[int]) -> bool:
+        """
+        Assign the safety zone a camera covers
+
+        Args:
+            camera_id: Camera ID
+            zone_id: Zone ID (None to unassign)
+
+        Returns:
+            True if updated, False if camera not found
+        """
+        camera = self.get_camera(camera_id)
+        if not camera:
+            return False
+        camera.zone_id = zone_id
+        if self.storage:
+            self.storage.update_camera_zone(camera_id, zone_id)
+        if self.logger:
+            self.logger.add_log(
+                f"Camera {camera_id} assigned to zone {zone_id}",
+                source="CameraController",
+            )
+        return True
+
+    def get_cameras_covering(
+        self, zone_id: Optional[int], location: Optional[str]
+    ) -> List[SafeHomeCamera]:
+        """
+        Find cameras in a zone or at a location (case-insensitive)
+
+        Args:
+            zone_id: Safety zone ID (ignored if None)
+            location: Location description (ignored if empty)
+
+        Returns:
+            Matching cameras
+        """
+        place = (location or "").strip().lower()
+        return [
+            camera
+            for camera in self.cameras.values()
+            if (zone_id is not None and camera.zone_id == zone_id)
+            or (place and camera.location.strip().lower() == place)
+        ]
+
     def get_camera_view(
         self, camera_id: int, password: Optional[str] = None
-    ) -> Optional[Image.Image]:
+    ) -> Optional["Image.Image"]:
         """
         Get camera view with password verification
         Implements SRS UC19-25 camera password protection
@@ -172,7 +252,14 @@ class CameraController:
         if not camera:
             return None
 
-        view = camera.get_view()
+        if self.metrics is None:
+            view = camera.get_view()
+        else:
+            start = time.perf_counter()
+            view = camera.get_view()
+            self.metrics.histogram(
+                "safehome_camera_render_seconds", "Camera view render time"
+            ).observe(time.perf_counter() - start)
 
         if view and self.logger:
             self.logger.add_log(
@@ -181,6 +268,90 @@ class CameraController:
 
         return view
 
+    def open_stream(
+        self, camera_id: int, password: Optional[str] = None
+    ) -> Optional[StreamViewer]:
+        """
+        Start watching a camera's shared MJPEG stream
+
+        All viewers of a camera share one producer thread, so each frame is
+        rendered and encoded once regardless of the number of viewers.
+
+        Args:
+            camera_id: Camera ID
+            password: Password for camera access (if required)
+
+        Returns:
+            StreamViewer (close() when done) if access granted, None otherwise
+        """
+        camera = self._get_camera_with_access(camera_id, password, action="stream")
+        if not camera:
+            return None
+
+        stream = self._streams.get(camera_id)
+        if stream is None or stream.camera is not camera:
+            stream = CameraStream(camera, fps=self.STREAM_FPS, clock=self.clock)
+            self._streams[camera_id] = stream
+        viewer = stream.open()
+
+        if self.logger:
+            self.logger.add_log(
+                f"Camera {camera_id} stream opened", source="CameraController"
+            )
+
+        return viewer
+
+    def render_all(
+        self,
+        size: Optional[Tuple[int, int]] = None,
+        passwords: Optional[Dict[int, str]] = None,
+        image_format: str = "JPEG",
+        max_workers: Optional[int] = None,
+    ) -> Dict[int, bytes]:
+        """
+        Render every viewable camera in parallel worker processes
+
+        Source images are shared with the workers through shared memory, so
+        only camera state crosses the process boundary. Disabled or locked
+        cameras are skipped, as are password-protected cameras without a
+        matching entry in passwords.
+
+        Args:
+            size: Output (width, height); None keeps the native 500x500
+            passwords: {camera_id: password} for protected cameras
+            image_format: Pillow format name ("JPEG", "PNG") or "RAW"
+            max_workers: Worker processes; changing it restarts the pool
+
+        Returns:
+            {camera_id: image bytes}
+        """
+        passwords = passwords or {}
+        states = []
+        for camera_id, camera in self.cameras.items():
+            if camera.has_password():
+                if camera_id not in passwords:
+                    continue
+                if not self._get_camera_with_access(
+                    camera_id, passwords[camera_id], action="render"
+                ):
+                    continue
+            state = camera.get_render_state()
+            if state is not None:
+                states.append(state)
+
+        pool = self._render_pool
+        if pool is None or (
+            max_workers is not None and max_workers != pool.max_workers
+        ):
+            if pool is not None:
+                pool.close()
+            pool = self._render_pool = CameraRenderPool(max_workers)
+        return pool.render(states, size=size, image_format=image_format)
+
+    def get_stream(self, camera_id: int) -> Optional[CameraStream]:
+        """Get the shared stream for a camera, if one was opened"""
+        return self._streams.get(camera_id)
+
     def pan_camera(
         self, camera_id: int, direction: str, password: Optional[str] = None
     ) -> bool:
@@ -483,6 +654,7 @@ class CameraController:
             name = data["camera_name"]
             location = data["camera_location"]
             password = data.get("camera_password")
+            zone_id = data.get("zone_id")
 
             # Update next ID
             if camera_id >= self._next_camera_id:
@@ -496,6 +668,9 @@ class CameraController:
                 password,
                 max_attempts=self.max_attempts,
                 lockout_seconds=self.lockout_seconds,
+                lazy=self.lazy,
+                zone_id=zone_id,
+                clock=self.clock,
             )
             self.cameras[camera_id] = camera
 
@@ -506,7 +681,13 @@ class CameraController:
             )
 
     def shutdown(self):
-        """Stop all camera hardware threads"""
+        """Stop all camera streams and hardware threads"""
+        for stream in self._streams.values():
+            stream.stop()
+        self._streams.clear()
+        if self._render_pool is not None:
+            self._render_pool.close()
+            self._render_pool = None
         for camera in self.cameras.values():
             camera.stop()
 
@@ -0,0 +1,322 @@
+"""
+Camera view rendering
+Pure rendering helpers shared by DeviceCamera and the multi-process
+CameraRenderPool used by CameraController.render_all()
+"""
+
+import io
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+# Pillow and multiprocessing are imported inside the functions so that
+# importing this module (and the camera package) stays cheap.
+
+RETURN_SIZE = 500
+SOURCE_SIZE = 200
+OVERLAY_CACHE_SIZE = 256  # badges kept per process (one per distinct text)
+
+_overlay_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_overlay_lock = threading.Lock()
+
+
+def format_overlay(time_: int, zoom: int, pan: int, tilt: int) -> str:
+    """Build the status text drawn in the corner of every view"""
+    view = "Time = "
+    if time_ < 10:
+        view += "0"
+    view += f"{time_}, zoom x{zoom}, "
+
+    if pan > 0:
+        view += f"right {pan}"
+    elif pan == 0:
+        view += "center"
+    else:
+        view += f"left {-pan}"
+
+    if tilt > 0:
+        view += f", up {tilt}"
+    elif tilt < 0:
+        view += f", down {-tilt}"
+    return view
+
+
+def render_overlay(text: str, font):
+    """
+    Draw the overlay badge (gray rounded box, cyan text) on a transparent
+    RGBA image whose origin is the top-left corner of the view
+    """
+    from PIL import Image, ImageDraw
+
+    bbox = ImageDraw.Draw(Image.new("L", (1, 1))).textbbox((0, 0), text, font=font)
+    wText = bbox[2] - bbox[0]
+    hText = bbox[3] - bbox[1]
+    width = max(wText + 10, 5 + bbox[2]) + 1
+    height = max(hText + 5, 2 + bbox[3]) + 1
+
+    badge = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(badge)
+    # Draw rounded rectangle background (gray)
+    draw.rounded_rectangle(
+        [(0, 0), (wText + 10, hText + 5)], radius=hText // 2, fill="gray"
+    )
+    # Draw text (cyan)
+    draw.text((5, 2), text, fill="cyan", font=font)
+    return badge
+
+
+def get_overlay(text: str, font):
+    """Get the overlay badge for a text, rendering it on a cache miss"""
+    key = (text, font)
+    with _overlay_lock:
+        badge = _overlay_cache.get(key)
+        if badge is not None:
+            _overlay_cache.move_to_end(key)
+            return badge
+    badge = render_overlay(text, font)
+    with _overlay_lock:
+        _overlay_cache[key] = badge
+        while len(_overlay_cache) > OVERLAY_CACHE_SIZE:
+            _overlay_cache.popitem(last=False)
+    return badge
+
+
+def clear_overlay_cache():
+    """Drop all cached overlay badges"""
+    with _overlay_lock:
+        _overlay_cache.clear()
+
+
+def compose_view(
+    source,
+    time_: int,
+    pan: int,
+    tilt: int,
+    zoom: int,
+    font,
+    overlay_cache: bool = True,
+):
+    """
+    Render one camera view
+
+    Args:
+        source: Source PIL Image (or None for a black frame)
+        time_, pan, tilt, zoom: Camera state
+        font: PIL font for the overlay
+        overlay_cache: Reuse the cached overlay badge instead of laying out
+            the text on every frame
+
+    Returns:
+        RETURN_SIZE x RETURN_SIZE RGB PIL Image
+    """
+    from PIL import Image, ImageDraw
+
+    view = format_overlay(time_, zoom, pan, tilt)
+
+    # Create the view image (500x500)
+    imgView = Image.new("RGB", (RETURN_SIZE, RETURN_SIZE), "black")
+
+    if source is not None:
+        centerWidth = source.width // 2
+        centerHeight = source.height // 2
+
+        zoomed = SOURCE_SIZE * (10 - zoom) // 10
+        panned = pan * SOURCE_SIZE // 5
+        tilted = tilt * SOURCE_SIZE // 5
+
+        left = centerWidth + panned - zoomed
+        top = centerHeight - tilted - zoomed
+        right = centerWidth + panned + zoomed
+        bottom = centerHeight - tilted + zoomed
+
+        # Crop and resize to fill the view
+        try:
+            cropped = source.crop((left, top, right, bottom))
+            resized = cropped.resize((RETURN_SIZE, RETURN_SIZE), Image.LANCZOS)
+            imgView.paste(resized, (0, 0))
+        except Exception:
+            # If crop fails, keep black background
+            pass
+
+    if overlay_cache:
+        badge = get_overlay(view, font)
+        imgView.paste(badge, (0, 0), badge)
+        return imgView
+
+    draw = ImageDraw.Draw(imgView)
+
+    # Get text size
+    bbox = draw.textbbox((0, 0), view, font=font)
+    wText = bbox[2] - bbox[0]
+    hText = bbox[3] - bbox[1]
+
+    # Draw rounded rectangle background (gray)
+    rX = 0
+    rY = 0
+    draw.rounded_rectangle(
+        [(rX, rY), (rX + wText + 10, rY + hText + 5)],
+        radius=hText // 2,
+        fill="gray",
+    )
+
+    # Draw text (cyan)
+    xText = rX + 5
+    yText = rY + 2
+    draw.text((xText, yText), view, fill="cyan", font=font)
+
+    return imgView
+
+
+def encode_image(
+    image, size: Optional[Tuple[int, int]], image_format: str, quality: int = 80
+) -> bytes:
+    """Resize (if needed) and encode an image; "RAW" returns RGB bytes"""
+    from PIL import Image
+
+    if size is not None and image.size != tuple(size):
+        image = image.resize(tuple(size), Image.LANCZOS)
+    if image_format.upper() == "RAW":
+        return image.tobytes()
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, quality=quality)
+    return buffer.getvalue()
+
+
+# ===== Worker-process side =====
+
+_worker_sources: Dict[str, tuple] = {}  # {shm name: (SharedMemory, Image)}
+_worker_font = None
+
+
+def _attach_source(name: str, image_size: Tuple[int, int]):
+    """Map a shared source image into this worker (once per segment)"""
+    from multiprocessing.shared_memory import SharedMemory
+
+    from PIL import Image
+
+    entry = _worker_sources.get(name)
+    if entry is None:
+        shm = SharedMemory(name=name)
+        image = Image.frombuffer("RGB", image_size, shm.buf, "raw", "RGB", 0, 1)
+        entry = _worker_sources[name] = (shm, image)
+    return entry[1]
+
+
+def _render_job(job: dict) -> Tuple[int, bytes]:
+    """Render and encode one camera in a worker process"""
+    global _worker_font
+    from PIL import ImageFont
+
+    if _worker_font is None:
+        _worker_font = ImageFont.load_default()
+    source = None
+    if job["shm_name"] is not None:
+        source = _attach_source(job["shm_name"], job["image_size"])
+    image = compose_view(
+        source, job["time"], job["pan"], job["tilt"], job["zoom"], _worker_font
+    )
+    return job["camera_id"], encode_image(image, job["size"], job["format"])
+
+
+# ===== Parent side =====
+
+
+class CameraRenderPool:
+    """
+    Process pool rendering many camera views in parallel
+    Decoded source images are copied once into shared memory and mapped by
+    the workers, so a render job only pickles the camera state
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize Camera Render Pool
+
+        Args:
+            max_workers: Worker processes (defaults to the CPU count)
+        """
+        self.max_workers = max_workers
+        self._executor: Optional["ProcessPoolExecutor"] = None
+        self._sources: Dict[str, Tuple["SharedMemory", tuple]] = {}
+
+    def render(
+        self,
+        states: List[dict],
+        size: Optional[Tuple[int, int]] = None,
+        image_format: str = "JPEG",
+    ) -> Dict[int, bytes]:
+        """
+        Render camera states in parallel
+
+        Args:
+            states: Dicts with camera_id, source_path, time, pan, tilt, zoom
+            size: Output (width, height); None keeps 500x500
+            image_format: Pillow format name, or "RAW" for RGB bytes
+
+        Returns:
+            {camera_id: encoded image bytes}
+        """
+        if not states:
+            return {}
+        jobs = []
+        for state in states:
+            shm_name, image_size = self._share_source(state.get("source_path"))
+            jobs.append(
+                {
+                    "camera_id": state["camera_id"],
+                    "shm_name": shm_name,
+                    "image_size": image_size,
+                    "time": state["time"],
+                    "pan": state["pan"],
+                    "tilt": state["tilt"],
+                    "zoom": state["zoom"],
+                    "size": size,
+                    "format": image_format,
+                }
+            )
+        return dict(self._get_executor().map(_render_job, jobs))
+
+    def close(self):
+        """Stop the workers and release shared source images"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for shm, _ in self._sources.values():
+            shm.close()
+            shm.unlink()
+        self._sources.clear()
+
+    def _get_executor(self) -> "ProcessPoolExecutor":
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn: forking a process that runs camera/sensor threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _share_source(self, path: Optional[str]):
+        """Copy a decoded source image into shared memory (once per path)"""
+        if path is None:
+            return None, None
+        entry = self._sources.get(path)
+        if entry is None:
+            from multiprocessing.shared_memory import SharedMemory
+
+            from PIL import Image
+
+            with Image.open(path) as img:
+                rgb = img.convert("RGB")
+            data = rgb.tobytes()
+            shm = SharedMemory(create=True, size=len(data))
+            shm.buf[: len(data)] = data
+            entry = self._sources[path] = (shm, rgb.size)
+        shm, image_size = entry
+        return shm.name, image_size
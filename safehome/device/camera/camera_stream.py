@@ -0,0 +1,173 @@
+import io
+import threading
+from typing import Optional
+
+from ..clock import REAL_CLOCK, Clock
+
+
+class StreamViewer:
+    """
+    One client watching a CameraStream
+    Viewers only ever receive the newest frame; a slow viewer skips frames
+    instead of queueing them
+    """
+
+    def __init__(self, stream: "CameraStream", last_seq: int = 0):
+        self._stream = stream
+        self._last_seq = last_seq
+        self.closed = False
+
+    @property
+    def camera_id(self) -> int:
+        """ID of the camera being watched"""
+        return self._stream.camera_id
+
+    def next_frame(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Wait for a frame newer than the last one returned
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            JPEG bytes, or None on timeout or once the stream is stopped
+        """
+        if self.closed:
+            return None
+        return self._stream._wait_frame(self, timeout)
+
+    def close(self):
+        """Stop watching (the producer stops with the last viewer)"""
+        if not self.closed:
+            self.closed = True
+            self._stream._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CameraStream:
+    """
+    Shared MJPEG source for one camera
+    A single producer thread renders and JPEG-encodes each frame once and
+    hands the same bytes to every viewer. The thread starts with the first
+    viewer and exits when the last one closes.
+    """
+
+    def __init__(
+        self,
+        camera,
+        fps: float = 10.0,
+        quality: int = 80,
+        clock: Clock = REAL_CLOCK,
+    ):
+        """
+        Initialize Camera Stream
+
+        Args:
+            camera: SafeHomeCamera to render
+            fps: Target frames per second
+            quality: JPEG quality (1-95)
+            clock: Time source pacing the frame interval
+        """
+        self.camera = camera
+        self.camera_id = camera.get_id()
+        self.interval = 1.0 / fps
+        self.quality = quality
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._frame: Optional[bytes] = None
+        self._frame_seq = 0
+        self._viewers = 0
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self.frames_encoded = 0
+
+    def open(self) -> StreamViewer:
+        """Add a viewer, starting the producer if it is not running"""
+        with self._cond:
+            self._stopped = False
+            self._viewers += 1
+            if self._thread is not None:
+                # Joining a running stream: the current frame is served at once
+                return StreamViewer(self)
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"camera-stream-{self.camera_id}",
+                daemon=True,
+            )
+            self._thread.start()
+            return StreamViewer(self, last_seq=self._frame_seq)
+
+    def get_viewer_count(self) -> int:
+        """Get the number of open viewers"""
+        with self._cond:
+            return self._viewers
+
+    def is_running(self) -> bool:
+        """Check whether the producer thread is active"""
+        with self._cond:
+            return self._thread is not None
+
+    def stop(self):
+        """Stop producing and wake all viewers (they receive None)"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    def _release(self):
+        with self._cond:
+            self._viewers -= 1
+            self._cond.notify_all()
+
+    def _wait_frame(self, viewer: StreamViewer, timeout: Optional[float]):
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._stopped or self._frame_seq > viewer._last_seq, timeout
+            )
+            if self._stopped or self._frame_seq <= viewer._last_seq:
+                return None
+            viewer._last_seq = self._frame_seq
+            return self._frame
+
+    def _encode(self) -> Optional[bytes]:
+        """Render the current view and encode it as JPEG"""
+        view = self.camera.get_view()
+        if view is None:
+            return None
+        buffer = io.BytesIO()
+        view.save(buffer, format="JPEG", quality=self.quality)
+        return buffer.getvalue()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._viewers <= 0 or self._stopped:
+                    self._thread = None
+                    self._frame = None
+                    return
+            started = self.clock()
+            try:
+                frame = self._encode()
+            except Exception as e:
+                print(f"Error encoding camera {self.camera_id} frame: {e}")
+                frame = None
+            with self._cond:
+                if frame is not None:
+                    self._frame = frame
+                    self._frame_seq += 1
+                    self.frames_encoded += 1
+                    self._cond.notify_all()
+                # Sleep out the frame interval, waking early once idle
+                remaining = self.interval - (self.clock() - started)
+                if remaining > 0:
+                    self._cond.wait_for(
+                        lambda: self._viewers <= 0 or self._stopped,
+                        self.clock.real_seconds(remaining),
+                    )
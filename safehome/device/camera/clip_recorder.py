@@ -0,0 +1,283 @@
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from ..clock import REAL_CLOCK, Clock
+from .frame_buffer import Frame
+
+
+def _db_time(timestamp: float) -> str:
+    """Format a Unix time like SQLite CURRENT_TIMESTAMP (UTC), with millis"""
+    moment = datetime.fromtimestamp(timestamp, timezone.utc)
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+@dataclass
+class ClipJob:
+    """A clip waiting for its post-event window to elapse"""
+
+    camera: object
+    event_time: float
+    due: float
+    pre_frames: List[Frame]
+    log_id: Optional[int] = None
+    sensor_id: Optional[int] = None
+    done: threading.Event = field(default_factory=threading.Event)
+    clip_id: Optional[int] = None
+
+
+class ClipRecorder:
+    """
+    Records pre/post-event camera clips on intrusion
+    While the system runs, a capture thread keeps the frame ring buffers
+    filled for cameras mapped to a safety zone and for cameras that have
+    been asked for a clip before; other cameras (and their lazy hardware)
+    are left alone. on_intrusion() only snapshots the pre-event frames and
+    queues a job; a writer thread waits out the post-event window, writes
+    the clip to disk as MJPEG and indexes it in camera_clips.
+    """
+
+    def __init__(
+        self,
+        camera_controller,
+        storage=None,
+        logger=None,
+        clip_dir: str = "data/clips",
+        fps: float = 2.0,
+        pre_seconds: float = 10.0,
+        post_seconds: float = 10.0,
+        cooldown_seconds: float = 30.0,
+        clock: Clock = REAL_CLOCK,
+    ):
+        """
+        Initialize Clip Recorder
+
+        Args:
+            camera_controller: CameraController whose cameras are recorded
+            storage: StorageManager used to index clips (optional)
+            logger: LogManager for recording warnings and errors (optional)
+            clip_dir: Directory clip files are written to
+            fps: Frames captured per second per camera
+            pre_seconds: Seconds of footage kept before an intrusion
+            post_seconds: Seconds of footage recorded after an intrusion
+            cooldown_seconds: Minimum gap between clip starts per camera
+            clock: Time source for frame timestamps and clip windows
+        """
+        self.camera_controller = camera_controller
+        self.storage = storage
+        self.logger = logger
+        self.clip_dir = Path(clip_dir)
+        self.interval = 1.0 / fps
+        self.pre_seconds = pre_seconds
+        self.post_seconds = post_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+
+        self._jobs: "queue.Queue[Optional[ClipJob]]" = queue.Queue()
+        self._last_clip: Dict[int, float] = {}  # {camera_id: event_time}
+        # Cameras without a zone that have been asked for a clip
+        self._watched: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stop_capture = threading.Event()
+        self._flush_now = threading.Event()
+        self._capture_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
+
+    # ===== Lifecycle =====
+    def start(self):
+        """Start the capture and writer threads"""
+        self._stop_capture.clear()
+        self._flush_now.clear()
+        if self._capture_thread is None or not self._capture_thread.is_alive():
+            self._capture_thread = threading.Thread(
+                target=self._capture_loop, name="clip-capture", daemon=True
+            )
+            self._capture_thread.start()
+        self._ensure_writer()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop capturing and flush pending clips without waiting out their
+        post-event windows
+        """
+        self._stop_capture.set()
+        self._flush_now.set()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=timeout)
+            self._capture_thread = None
+        if self._writer_thread is not None:
+            self._jobs.put(None)
+            self._writer_thread.join(timeout=timeout)
+            self._writer_thread = None
+
+    def is_running(self) -> bool:
+        """Check whether frames are being captured"""
+        return self._capture_thread is not None and self._capture_thread.is_alive()
+
+    # ===== Capture =====
+    def get_watched_cameras(self) -> list:
+        """Get the cameras whose frames are buffered for clips"""
+        with self._lock:
+            watched = set(self._watched)
+        return [
+            camera
+            for camera in self.camera_controller.get_all_cameras()
+            if camera.zone_id is not None or camera.camera_id in watched
+        ]
+
+    def capture_once(self, timestamp: Optional[float] = None) -> int:
+        """
+        Capture one frame from every enabled watched camera
+
+        Returns:
+            Number of frames buffered
+        """
+        timestamp = self.clock() if timestamp is None else timestamp
+        captured = 0
+        for camera in self.get_watched_cameras():
+            if camera.capture_frame(timestamp):
+                captured += 1
+        return captured
+
+    def _capture_loop(self):
+        while not self._stop_capture.is_set():
+            started = self.clock()
+            try:
+                self.capture_once()
+            except Exception as e:
+                print(f"Error capturing camera frames: {e}")
+            remaining = self.interval - (self.clock() - started)
+            self.clock.wait(self._stop_capture, remaining)
+
+    # ===== Intrusion handling =====
+    def on_intrusion(
+        self,
+        zone_id: Optional[int],
+        location: Optional[str],
+        log_id: Optional[int] = None,
+        sensor_id: Optional[int] = None,
+    ) -> List[ClipJob]:
+        """
+        Queue clips for cameras covering the intrusion's zone or location
+        Returns immediately; files are written by the writer thread. A
+        camera without a zone has no pre-event frames on its first clip
+        (a warning is logged); it is captured from then on.
+
+        Args:
+            zone_id: Zone of the triggering sensor
+            location: Location of the triggering sensor
+            log_id: event_logs row the clips are linked to
+            sensor_id: Triggering sensor
+
+        Returns:
+            Queued clip jobs (wait on job.done to block until written)
+        """
+        now = self.clock()
+        jobs = []
+        for camera in self.camera_controller.get_cameras_covering(zone_id, location):
+            with self._lock:
+                self._watched.add(camera.camera_id)
+                last = self._last_clip.get(camera.camera_id)
+                if last is not None and now - last < self.cooldown_seconds:
+                    continue
+                self._last_clip[camera.camera_id] = now
+            pre_frames = camera.frame_buffer.get_frames(start=now - self.pre_seconds)
+            if not pre_frames:
+                self._log(
+                    f"Camera {camera.camera_id} ({camera.location}) has no "
+                    "pre-event frames for this intrusion; assign it to a safety "
+                    "zone to buffer footage before intrusions",
+                    level="WARNING",
+                )
+            jobs.append(
+                ClipJob(
+                    camera=camera,
+                    event_time=now,
+                    due=now + self.post_seconds,
+                    pre_frames=pre_frames,
+                    log_id=log_id,
+                    sensor_id=sensor_id,
+                )
+            )
+        if jobs:
+            self._ensure_writer()
+            for job in jobs:
+                self._jobs.put(job)
+        return jobs
+
+    # ===== Writer =====
+    def _ensure_writer(self):
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="clip-writer", daemon=True
+            )
+            self._writer_thread.start()
+
+    def _writer_loop(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                if self._jobs.empty():
+                    return
+                self._jobs.put(None)  # finish the queued clips first
+                continue
+            # Wait out the post-event window unless asked to flush now
+            delay = job.due - self.clock()
+            if delay > 0:
+                self.clock.wait(self._flush_now, delay)
+            try:
+                self._write_clip(job)
+            except Exception as e:
+                self._log(
+                    f"Failed to write clip for camera {job.camera.camera_id}: {e}",
+                    level="ERROR",
+                )
+            finally:
+                job.done.set()
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self.logger:
+            self.logger.add_log(message, level=level, source="ClipRecorder")
+        elif level != "INFO":
+            print(f"[ClipRecorder] {message}")
+
+    def _write_clip(self, job: ClipJob):
+        post_frames = [
+            (ts, frame)
+            for ts, frame in job.camera.frame_buffer.get_frames(start=job.event_time)
+            if ts <= job.due
+        ]
+        seen = {ts for ts, _ in job.pre_frames}
+        frames = job.pre_frames + [f for f in post_frames if f[0] not in seen]
+        if not frames:
+            return
+
+        self.clip_dir.mkdir(parents=True, exist_ok=True)
+        event_wall = self.clock.to_wall(job.event_time)
+        stamp = datetime.fromtimestamp(event_wall).strftime("%Y%m%d_%H%M%S")
+        name = f"clip_{stamp}_cam{job.camera.camera_id}"
+        if job.log_id is not None:
+            name += f"_log{job.log_id}"
+        path = self.clip_dir / f"{name}.mjpeg"
+
+        # MJPEG: concatenated JPEG frames, playable by common video players
+        with open(path, "wb") as f:
+            for _, frame in frames:
+                f.write(frame)
+        size = path.stat().st_size
+
+        if self.storage:
+            job.clip_id = self.storage.save_camera_clip(
+                camera_id=job.camera.camera_id,
+                file_path=str(path),
+                frame_count=len(frames),
+                size_bytes=size,
+                event_time=_db_time(event_wall),
+                start_time=_db_time(self.clock.to_wall(frames[0][0])),
+                end_time=_db_time(self.clock.to_wall(frames[-1][0])),
+                log_id=job.log_id,
+                sensor_id=job.sensor_id,
+            )
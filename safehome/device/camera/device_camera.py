@@ -1,20 +1,24 @@
 import threading
-import time
-from tkinter import messagebox
-
-from PIL import Image, ImageDraw, ImageFont
+from pathlib import Path
 
+from ..clock import REAL_CLOCK, Clock
+from .camera_render import RETURN_SIZE, SOURCE_SIZE, compose_view
 from .interface_camera import InterfaceCamera
 
+# Pillow is imported inside the rendering methods so that headless users of
+# the core system do not pay for it until the first frame is rendered.
+
 
 class DeviceCamera(threading.Thread, InterfaceCamera):
 
-    RETURN_SIZE = 500
-    SOURCE_SIZE = 200
+    RETURN_SIZE = RETURN_SIZE
+    SOURCE_SIZE = SOURCE_SIZE
 
-    def __init__(self):
+    def __init__(self, clock: Clock = REAL_CLOCK):
         super().__init__(daemon=True)
 
+        self.clock = clock  # paces the time counter
+
         self.cameraId = 0
         self.time = 0
         self.pan = 0
@@ -23,30 +27,53 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
         self.imgSource = None
         self.centerWidth = 0
         self.centerHeight = 0
+        self._source_path = None  # decoded on first render
+        self.image_path = None  # source image file for this camera
         self._running = True
+        self._stopped = threading.Event()
         self._lock = threading.Lock()
-        # Font was previously missing; using a default PIL font prevents AttributeError in getView
-        self.font = ImageFont.load_default()
+        # Default PIL font, loaded on first render (prevents AttributeError in getView)
+        self.font = None
+        # Paste the cached overlay badge instead of re-laying out its text
+        self.overlay_cache = True
 
         self.start()
 
     def set_id(self, id_):
-        """Set the camera ID and load associated image (synchronized)."""
+        """Set the camera ID and locate the associated image (synchronized)."""
         with self._lock:
             self.cameraId = id_
             fileName = f"assets/images/camera{id_}.jpg"
 
-            try:
-                self.imgSource = Image.open(fileName)
-                self.centerWidth = self.imgSource.width // 2
-                self.centerHeight = self.imgSource.height // 2
-            except FileNotFoundError:
-                self.imgSource = None
+            if self.imgSource is not None:
+                self.imgSource.close()
+            self.imgSource = None
+            self._source_path = None
+            self.image_path = None
+            if not Path(fileName).is_file():
                 try:
+                    from tkinter import messagebox
+
                     messagebox.showerror("File Error", f"{fileName} file open error")
                 except:
                     print(f"ERROR: {fileName} file open error")
                 return
+            self._source_path = fileName
+            self.image_path = fileName
+
+    def _load_source(self):
+        """Decode the source image on first use (caller holds the lock)."""
+        from PIL import Image
+
+        fileName = self._source_path
+        self._source_path = None
+        try:
+            self.imgSource = Image.open(fileName)
+            self.centerWidth = self.imgSource.width // 2
+            self.centerHeight = self.imgSource.height // 2
+        except (FileNotFoundError, OSError):
+            self.imgSource = None
+            print(f"ERROR: {fileName} file open error")
 
     def get_id(self):
         """Get the camera ID."""
@@ -54,72 +81,34 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
 
     def get_view(self):
         """Get the current camera view as a PIL Image (synchronized)."""
-        with self._lock:
-
-            view = "Time = "
-            if self.time < 10:
-                view += "0"
-            view += f"{self.time}, zoom x{self.zoom}, "
-
-            if self.pan > 0:
-                view += f"right {self.pan}"
-            elif self.pan == 0:
-                view += "center"
-            else:
-                view += f"left {-self.pan}"
-
-            if self.tilt > 0:
-                view += f", up {self.tilt}"
-            elif self.tilt < 0:
-                view += f", down {-self.tilt}"
+        from PIL import ImageFont
 
-            # Create the view image (500x500)
-            imgView = Image.new("RGB", (self.RETURN_SIZE, self.RETURN_SIZE), "black")
-
-            if self.imgSource is not None:
-
-                zoomed = self.SOURCE_SIZE * (10 - self.zoom) // 10
-                panned = self.pan * self.SOURCE_SIZE // 5
-                tilted = self.tilt * self.SOURCE_SIZE // 5
-
-                left = self.centerWidth + panned - zoomed
-                top = self.centerHeight - tilted - zoomed
-                right = self.centerWidth + panned + zoomed
-                bottom = self.centerHeight - tilted + zoomed
-
-                # Crop and resize to fill the view
-                try:
-                    cropped = self.imgSource.crop((left, top, right, bottom))
-                    resized = cropped.resize(
-                        (self.RETURN_SIZE, self.RETURN_SIZE), Image.LANCZOS
-                    )
-                    imgView.paste(resized, (0, 0))
-                except Exception:
-                    # If crop fails, keep black background
-                    pass
-
-            draw = ImageDraw.Draw(imgView)
-
-            # Get text size
-            bbox = draw.textbbox((0, 0), view, font=self.font)
-            wText = bbox[2] - bbox[0]
-            hText = bbox[3] - bbox[1]
-
-            # Draw rounded rectangle background (gray)
-            rX = 0
-            rY = 0
-            draw.rounded_rectangle(
-                [(rX, rY), (rX + wText + 10, rY + hText + 5)],
-                radius=hText // 2,
-                fill="gray",
+        with self._lock:
+            if self._source_path is not None:
+                self._load_source()
+            if self.font is None:
+                self.font = ImageFont.load_default()
+            return compose_view(
+                self.imgSource,
+                self.time,
+                self.pan,
+                self.tilt,
+                self.zoom,
+                self.font,
+                overlay_cache=self.overlay_cache,
             )
 
-            # Draw text (cyan)
-            xText = rX + 5
-            yText = rY + 2
-            draw.text((xText, yText), view, fill="cyan", font=self.font)
-
-            return imgView
+    def get_render_state(self) -> dict:
+        """Snapshot of what get_view() would render, for out-of-process rendering."""
+        with self._lock:
+            return {
+                "camera_id": self.cameraId,
+                "source_path": self.image_path,
+                "time": self.time,
+                "pan": self.pan,
+                "tilt": self.tilt,
+                "zoom": self.zoom,
+            }
 
     def pan_right(self):
         """Pan camera to the right (synchronized)."""
@@ -186,7 +175,8 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
         """Thread run method - updates time every second."""
         while self._running:
             try:
-                time.sleep(1.0)
+                if self.clock.wait(self._stopped, 1.0):
+                    break
             except InterruptedError:
                 pass
             self._tick()
@@ -194,5 +184,6 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
     def stop(self):
         """Stop the camera thread."""
         self._running = False
+        self._stopped.set()
         if self.imgSource:
             self.imgSource.close()
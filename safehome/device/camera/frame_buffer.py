@@ -0,0 +1,70 @@
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+Frame = Tuple[float, bytes]  # (timestamp, encoded image)
+
+
+class FrameRingBuffer:
+    """
+    Memory-bounded ring buffer of recent encoded frames
+    Oldest frames are evicted once the stored bytes exceed max_bytes
+    """
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Initialize Frame Ring Buffer
+
+        Args:
+            max_bytes: Upper bound on the total size of buffered frames
+        """
+        self.max_bytes = max_bytes
+        self._frames: Deque[Frame] = deque()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def append(self, timestamp: float, frame: bytes):
+        """Add a frame, evicting the oldest ones to stay within max_bytes"""
+        if len(frame) > self.max_bytes:
+            return
+        with self._lock:
+            self._frames.append((timestamp, frame))
+            self._bytes += len(frame)
+            while self._bytes > self.max_bytes:
+                _, old = self._frames.popleft()
+                self._bytes -= len(old)
+
+    def get_frames(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[Frame]:
+        """
+        Get buffered frames with start <= timestamp <= end
+
+        Args:
+            start: Earliest timestamp (None for the oldest frame)
+            end: Latest timestamp (None for the newest frame)
+
+        Returns:
+            Frames in timestamp order
+        """
+        with self._lock:
+            return [
+                (ts, frame)
+                for ts, frame in self._frames
+                if (start is None or ts >= start) and (end is None or ts <= end)
+            ]
+
+    def get_total_bytes(self) -> int:
+        """Get the total size of buffered frames"""
+        with self._lock:
+            return self._bytes
+
+    def clear(self):
+        """Drop all buffered frames"""
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._frames)
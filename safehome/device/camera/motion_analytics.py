@@ -0,0 +1,258 @@
+"""
+Camera motion analytics
+Frame-differencing motion detection on camera views, published to the
+SensorController as one virtual motion sensor per camera
+"""
+
+import threading
+from typing import Dict, Optional
+
+from ..clock import REAL_CLOCK, Clock
+
+# NumPy is optional: when it is missing the same score is computed with
+# Pillow's C image operations. Both are imported on first use.
+_numpy = None
+_numpy_checked = False
+
+
+def get_numpy():
+    """Return the numpy module, or None if it is not installed"""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _numpy_checked = True
+    return _numpy
+
+
+def prepare_frame(image, downsample: int = 8, backend: str = "numpy"):
+    """
+    Reduce a camera view to a small grayscale frame for differencing
+
+    Args:
+        image: RGB PIL Image
+        downsample: Box-filter factor applied in each dimension
+        backend: "numpy" for an ndarray, "pillow" for an "L" Image
+
+    Returns:
+        uint8 ndarray or grayscale PIL Image
+    """
+    small = image.convert("L")
+    if downsample > 1:
+        small = small.reduce(downsample)
+    if backend == "numpy":
+        # Exposes the reduced buffer through the array interface; only the
+        # already-downsampled pixels are copied
+        return get_numpy().asarray(small)
+    return small
+
+
+def motion_score(previous, current, pixel_threshold: int = 25) -> float:
+    """
+    Fraction of pixels whose brightness changed by more than the threshold
+
+    Args:
+        previous, current: Frames from prepare_frame (same backend and size)
+        pixel_threshold: Per-pixel absolute difference counted as change
+
+    Returns:
+        Score between 0.0 and 1.0
+    """
+    np = get_numpy()
+    if np is not None and isinstance(current, np.ndarray):
+        # |a - b| without widening: max - min stays within uint8
+        diff = np.maximum(previous, current) - np.minimum(previous, current)
+        return np.count_nonzero(diff > pixel_threshold) / diff.size
+    from PIL import ImageChops
+
+    diff = ImageChops.difference(previous, current)
+    lut = [255 if v > pixel_threshold else 0 for v in range(256)]
+    changed = diff.point(lut).histogram()[255]
+    return changed / (diff.width * diff.height)
+
+
+class MotionAnalytics:
+    """
+    Periodic frame-differencing over all enabled cameras
+    Each camera gets a CameraMotionSensor in the SensorController; the
+    sensor reports motion while the camera's score is at or above its
+    threshold and clears after clear_frames quiet frames in a row.
+    """
+
+    def __init__(
+        self,
+        camera_controller,
+        sensor_controller,
+        interval: float = 0.5,
+        downsample: int = 8,
+        pixel_threshold: int = 25,
+        default_threshold: float = 0.02,
+        clear_frames: int = 3,
+        backend: Optional[str] = None,
+        clock: Clock = REAL_CLOCK,
+    ):
+        """
+        Initialize Motion Analytics
+
+        Args:
+            camera_controller: CameraController providing the frames
+            sensor_controller: SensorController receiving virtual sensors
+            interval: Seconds between analysed frames
+            downsample: Box-filter factor before differencing
+            pixel_threshold: Per-pixel change counted as motion
+            default_threshold: Score threshold for cameras without their own
+            clear_frames: Quiet frames before a detection clears
+            backend: "numpy" or "pillow"; defaults to numpy when installed
+            clock: Time source pacing the analysis interval
+        """
+        self.camera_controller = camera_controller
+        self.sensor_controller = sensor_controller
+        self.interval = interval
+        self.downsample = downsample
+        self.pixel_threshold = pixel_threshold
+        self.default_threshold = default_threshold
+        self.clear_frames = clear_frames
+        self.clock = clock
+        if backend is None:
+            backend = "numpy" if get_numpy() is not None else "pillow"
+        self.backend = backend
+
+        self._thresholds: Dict[int, float] = {}
+        self._previous: Dict[int, object] = {}
+        self._quiet: Dict[int, int] = {}
+        self._scores: Dict[int, float] = {}
+        self._sensors: Dict[int, object] = {}  # camera_id -> CameraMotionSensor
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ===== Configuration =====
+    def set_threshold(self, camera_id: int, threshold: Optional[float]):
+        """Set a camera's motion threshold (None restores the default)"""
+        with self._lock:
+            if threshold is None:
+                self._thresholds.pop(camera_id, None)
+            else:
+                self._thresholds[camera_id] = threshold
+
+    def get_threshold(self, camera_id: int) -> float:
+        """Get a camera's motion threshold"""
+        with self._lock:
+            return self._thresholds.get(camera_id, self.default_threshold)
+
+    def get_scores(self) -> Dict[int, float]:
+        """Get the latest score per camera"""
+        with self._lock:
+            return dict(self._scores)
+
+    # ===== Lifecycle =====
+    def start(self):
+        """Start analysing frames in a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="motion-analytics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the analytics thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Check whether the analytics thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.analyse_once()
+            except Exception as e:
+                print(f"Error in motion analytics: {e}")
+            self.clock.wait(self._stop, self.interval)
+
+    # ===== Analysis =====
+    def analyse_once(self) -> Dict[int, float]:
+        """
+        Analyse the current view of every enabled camera
+
+        Returns:
+            {camera_id: score} for cameras with a previous frame
+        """
+        scores = {}
+        for camera in self.camera_controller.get_all_cameras():
+            if not camera.is_enabled:
+                continue
+            image = camera.get_view()
+            if image is None:
+                continue
+            score = self.process_frame(camera, image)
+            if score is not None:
+                scores[camera.camera_id] = score
+        return scores
+
+    def process_frame(self, camera, image) -> Optional[float]:
+        """
+        Score one frame against the camera's previous frame and update its
+        virtual sensor
+
+        Args:
+            camera: SafeHomeCamera the frame came from
+            image: RGB PIL Image of the camera view
+
+        Returns:
+            Motion score, or None for the camera's first frame
+        """
+        frame = prepare_frame(image, self.downsample, self.backend)
+        camera_id = camera.camera_id
+        with self._lock:
+            previous = self._previous.get(camera_id)
+            self._previous[camera_id] = frame
+        if previous is None or _frame_size(previous) != _frame_size(frame):
+            return None
+
+        score = motion_score(previous, frame, self.pixel_threshold)
+        moving = score >= self.get_threshold(camera_id)
+        with self._lock:
+            quiet = 0 if moving else self._quiet.get(camera_id, self.clear_frames) + 1
+            self._quiet[camera_id] = quiet
+            self._scores[camera_id] = score
+
+        self._get_sensor(camera).update_motion(score, quiet < self.clear_frames)
+        return score
+
+    def _get_sensor(self, camera):
+        """Get the camera's virtual sensor, resolving it only when needed"""
+        camera_id = camera.camera_id
+        with self._lock:
+            sensor = self._sensors.get(camera_id)
+        # Resolve again only if the sensor was removed from the controller
+        if (
+            sensor is None
+            or self.sensor_controller.get_sensor(sensor.sensor_id) is not sensor
+        ):
+            sensor = self.sensor_controller.add_camera_motion_sensor(
+                camera_id, camera.location, getattr(camera, "zone_id", None)
+            )
+            with self._lock:
+                self._sensors[camera_id] = sensor
+        return sensor
+
+    def forget(self, camera_id: int):
+        """Drop a camera's state (e.g. after it was removed)"""
+        with self._lock:
+            self._previous.pop(camera_id, None)
+            self._quiet.pop(camera_id, None)
+            self._scores.pop(camera_id, None)
+            self._sensors.pop(camera_id, None)
+
+
+def _frame_size(frame):
+    return frame.shape if hasattr(frame, "shape") else frame.size
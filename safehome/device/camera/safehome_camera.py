@@ -1,9 +1,13 @@
-import time
-from typing import Optional
-
-from PIL import Image
+import threading
+from typing import TYPE_CHECKING, Optional
 
+from ..clock import REAL_CLOCK, Clock
+from .camera_render import encode_image
 from .device_camera import DeviceCamera
+from .frame_buffer import FrameRingBuffer
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 class SafeHomeCamera:
@@ -21,6 +25,10 @@ class SafeHomeCamera:
         password: Optional[str] = None,
         max_attempts: int = 3,
         lockout_seconds: int = 300,
+        lazy: bool = False,
+        zone_id: Optional[int] = None,
+        buffer_bytes: int = 4 * 1024 * 1024,
+        clock: Clock = REAL_CLOCK,
     ):
         """
         Initialize SafeHome Camera
@@ -32,6 +40,11 @@ class SafeHomeCamera:
             password: Optional password for camera access
             max_attempts: How many wrong tries before lock
             lockout_seconds: Lock duration in seconds
+            lazy: Defer creating the hardware device (thread and image
+                decode) until it is first used
+            zone_id: Safety zone the camera covers (for intrusion clips)
+            buffer_bytes: Memory bound of the recent-frame ring buffer
+            clock: Time source for the password lockout and the hardware
         """
         self.camera_id = camera_id
         self.name = name
@@ -42,10 +55,40 @@ class SafeHomeCamera:
         self.lockout_seconds = lockout_seconds
         self.failed_attempts = 0
         self.locked_until = 0.0
+        self.zone_id = zone_id
+        self.clock = clock
+
+        # Recent encoded frames, kept for pre-event intrusion clips
+        self.frame_buffer = FrameRingBuffer(max_bytes=buffer_bytes)
 
         # Create hardware device instance
-        self.hardware = DeviceCamera()
-        self.hardware.set_id(camera_id)
+        self._hardware: Optional[DeviceCamera] = None
+        # Lazy startup may be triggered from the API, recorder and UI threads
+        self._hardware_lock = threading.Lock()
+        if not lazy:
+            self._start_hardware()
+
+    def _start_hardware(self) -> DeviceCamera:
+        """Create and start the DeviceCamera for this camera"""
+        hardware = DeviceCamera(clock=self.clock)
+        hardware.set_id(self.camera_id)
+        self._hardware = hardware
+        return hardware
+
+    @property
+    def hardware(self) -> DeviceCamera:
+        """Camera hardware device (started on first access)"""
+        hardware = self._hardware
+        if hardware is None:
+            with self._hardware_lock:
+                hardware = self._hardware
+                if hardware is None:
+                    hardware = self._start_hardware()
+        return hardware
+
+    @hardware.setter
+    def hardware(self, value):
+        self._hardware = value
 
     def get_id(self) -> int:
         """Get camera ID"""
@@ -59,7 +102,7 @@ class SafeHomeCamera:
         """Get camera location"""
         return self.location
 
-    def get_view(self) -> Optional[Image.Image]:
+    def get_view(self) -> Optional["Image.Image"]:
         """
         Get current camera view as PIL Image
 
@@ -75,6 +118,42 @@ class SafeHomeCamera:
             print(f"Error getting camera view: {e}")
             return None
 
+    def capture_frame(self, timestamp: Optional[float] = None) -> bool:
+        """
+        Render the current view into the frame ring buffer as JPEG
+
+        Args:
+            timestamp: Capture time on the camera's clock (defaults to now)
+
+        Returns:
+            True if a frame was buffered
+        """
+        if not self.is_enabled:
+            return False
+        try:
+            view = self.hardware.get_view()
+        except Exception as e:
+            print(f"Error capturing camera frame: {e}")
+            return False
+        if view is None:
+            return False
+        frame = encode_image(view, None, "JPEG", quality=70)
+        self.frame_buffer.append(
+            self.clock() if timestamp is None else timestamp, frame
+        )
+        return True
+
+    def get_render_state(self) -> Optional[dict]:
+        """
+        Get the camera state needed to render its view elsewhere
+
+        Returns:
+            State dict if camera is enabled, None otherwise
+        """
+        if not self.is_enabled or self._is_locked():
+            return None
+        return self.hardware.get_render_state()
+
     def pan_left(self) -> bool:
         """
         Pan camera to the left
@@ -219,7 +298,7 @@ class SafeHomeCamera:
         # Wrong password handling
         self.failed_attempts += 1
         if self.failed_attempts >= self.max_attempts:
-            self.locked_until = time.time() + self.lockout_seconds
+            self.locked_until = self.clock() + self.lockout_seconds
         return False
 
     def has_password(self) -> bool:
@@ -232,9 +311,10 @@ class SafeHomeCamera:
 
     def _is_locked(self) -> bool:
         """Check if camera is in lockout state."""
-        if self.locked_until and time.time() < self.locked_until:
+        now = self.clock()
+        if self.locked_until and now < self.locked_until:
             return True
-        if self.locked_until and time.time() >= self.locked_until:
+        if self.locked_until and now >= self.locked_until:
             # Auto unlock after timeout
             self.locked_until = 0.0
             self.failed_attempts = 0
@@ -251,16 +331,17 @@ class SafeHomeCamera:
             "id": self.camera_id,
             "name": self.name,
             "location": self.location,
+            "zone_id": self.zone_id,
             "is_enabled": self.is_enabled,
             "has_password": self.has_password(),
-            "pan_angle": getattr(self.hardware, "pan", 0),
-            "zoom_level": getattr(self.hardware, "zoom", 2),
+            "pan_angle": getattr(self._hardware, "pan", 0),
+            "zoom_level": getattr(self._hardware, "zoom", 2),
         }
 
     def stop(self):
         """Stop camera hardware thread"""
-        if self.hardware:
-            self.hardware.stop()
+        if self._hardware:
+            self._hardware.stop()
 
     def __repr__(self):
         return f"SafeHomeCamera(id={self.camera_id}, name='{self.name}', location='{self.location}', enabled={self.is_enabled})"
@@ -0,0 +1,209 @@
+import threading
+import time
+from typing import List
+
+
+class Clock:
+    """
+    Time source for time-dependent code
+    A clock is callable and returns now(), so it fits every
+    `clock: Callable[[], float]` parameter (LoginManager, SessionCache,
+    RateLimiter, IntrusionTracer, Scheduler) as well as code that also
+    needs to sleep on it.
+    """
+
+    virtual = False  # True if clock time is not wall-clock time
+
+    def now(self) -> float:
+        """Get monotonic clock time in seconds"""
+        raise NotImplementedError
+
+    def sleep(self, seconds: float):
+        """Block the calling thread for `seconds` of clock time"""
+        raise NotImplementedError
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        """
+        Sleep up to `seconds` of clock time, waking early if event is set
+
+        Returns:
+            True if the event is set
+        """
+        raise NotImplementedError
+
+    def real_seconds(self, seconds: float) -> float:
+        """Get the wall-clock seconds that `seconds` of clock time take"""
+        return seconds
+
+    def to_wall(self, when: float) -> float:
+        """
+        Get the Unix time for clock time `when`, for timestamps shown to
+        people or stored in the database
+
+        Args:
+            when: Clock time (e.g. an earlier now())
+
+        Returns:
+            Unix seconds, offset from the current time by (now() - when);
+            virtual clocks anchor clock time to the wall time they were
+            created at, so their Unix time moves at clock speed
+        """
+        return time.time() - (self.now() - when)
+
+    def __call__(self) -> float:
+        return self.now()
+
+
+class RealClock(Clock):
+    """Wall-clock time (time.monotonic / time.sleep)"""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        time.sleep(max(0.0, seconds))
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        return event.wait(max(0.0, seconds))
+
+    def __repr__(self):
+        return "RealClock()"
+
+
+class AcceleratedClock(Clock):
+    """
+    Wall-clock time sped up by a constant factor
+    Everything runs on real threads as usual, but a 300 s entry delay
+    takes 3 s at factor=100.
+    """
+
+    virtual = True
+
+    def __init__(self, factor: float, start: float = 0.0):
+        """
+        Initialize Accelerated Clock
+
+        Args:
+            factor: Clock seconds per wall-clock second
+            start: Clock time at creation
+        """
+        if factor <= 0:
+            raise ValueError("factor must be positive")
+        self.factor = factor
+        self.start = start
+        self._origin = time.monotonic()
+        self._wall_origin = time.time() - start
+
+    def now(self) -> float:
+        return self.start + (time.monotonic() - self._origin) * self.factor
+
+    def sleep(self, seconds: float):
+        time.sleep(self.real_seconds(seconds))
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        return event.wait(self.real_seconds(seconds))
+
+    def real_seconds(self, seconds: float) -> float:
+        return max(0.0, seconds) / self.factor
+
+    def to_wall(self, when: float) -> float:
+        # Unix time runs at clock speed, from the wall time at creation
+        return self._wall_origin + when
+
+    def __repr__(self):
+        return f"AcceleratedClock(factor={self.factor})"
+
+
+class ManualClock(Clock):
+    """
+    Clock that only moves when advance() is called
+    The thread that created the clock drives it: its sleep() and wait()
+    advance time themselves and return at once. Any other thread (polling
+    loop, camera thread) blocks until the driver advances past its
+    deadline. Timers of attached ManualSchedulers run on the driver's
+    thread during advance(), in deadline order.
+    """
+
+    virtual = True
+    EVENT_POLL = 0.05  # real seconds between event checks of a blocked wait()
+
+    def __init__(self, start: float = 0.0):
+        """
+        Initialize Manual Clock
+
+        Args:
+            start: Initial clock time
+        """
+        self._now = start
+        self._wall_origin = time.time() - start
+        self._cond = threading.Condition()
+        self._driver = threading.get_ident()
+        self._schedulers: List = []
+
+    def now(self) -> float:
+        return self._now
+
+    def to_wall(self, when: float) -> float:
+        # Unix time only moves with advance(), from the wall time at creation
+        return self._wall_origin + when
+
+    def attach(self, scheduler):
+        """Run a ManualScheduler's timers as this clock advances"""
+        if scheduler not in self._schedulers:
+            self._schedulers.append(scheduler)
+
+    def advance(self, seconds: float) -> int:
+        """
+        Move time forward, running every timer that falls due
+
+        Returns:
+            Number of timer callbacks run
+        """
+        target = self._now + max(0.0, seconds)
+        ran = 0
+        while True:
+            due = None  # (deadline, scheduler) of the earliest due timer
+            for scheduler in self._schedulers:
+                when = scheduler._next_deadline()
+                if when is not None and when <= target:
+                    if due is None or when < due[0]:
+                        due = (when, scheduler)
+            if due is None:
+                break
+            self._move_to(due[0])
+            ran += due[1]._run_due(due[0])
+        self._move_to(target)
+        return ran
+
+    def sleep(self, seconds: float):
+        if threading.get_ident() == self._driver:
+            self.advance(seconds)
+            return
+        deadline = self._now + max(0.0, seconds)
+        with self._cond:
+            while self._now < deadline:
+                self._cond.wait()
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        if threading.get_ident() == self._driver:
+            if not event.is_set():
+                self.advance(seconds)
+            return event.is_set()
+        deadline = self._now + max(0.0, seconds)
+        with self._cond:
+            # event.set() does not notify us; re-check it periodically
+            while self._now < deadline and not event.is_set():
+                self._cond.wait(self.EVENT_POLL)
+        return event.is_set()
+
+    def _move_to(self, when: float):
+        with self._cond:
+            if when > self._now:
+                self._now = when
+            self._cond.notify_all()
+
+    def __repr__(self):
+        return f"ManualClock(now={self._now:.3f})"
+
+
+REAL_CLOCK = RealClock()
@@ -0,0 +1,58 @@
+from typing import Callable, Optional
+
+from ..clock import REAL_CLOCK
+from .motion_sensor import MotionSensor
+
+
+class CameraMotionSensor(MotionSensor):
+    """
+    Virtual motion sensor driven by camera frame analytics
+    Behaves like a MotionSensor (arming, polling, simulator controls); its
+    detection flag is set by MotionAnalytics instead of a physical detector.
+    """
+
+    SENSOR_TYPE = "CAMERA_MOTION"
+
+    def __init__(
+        self,
+        sensor_id: int,
+        location: str,
+        zone_id: Optional[int] = None,
+        camera_id: Optional[int] = None,
+        clock: Callable[[], float] = REAL_CLOCK,
+    ):
+        """
+        Initialize Camera Motion Sensor
+
+        Args:
+            sensor_id: Unique sensor identifier
+            location: Location of the camera
+            zone_id: Safety zone this sensor belongs to
+            camera_id: Camera whose frames drive this sensor (None if unbound)
+            clock: Time source stamping detections (intruded_at)
+        """
+        super().__init__(sensor_id, location, zone_id, clock=clock)
+        self.sensor_type = self.SENSOR_TYPE
+        self.camera_id = camera_id
+        self.motion_score = 0.0  # latest frame-difference score
+
+    def update_motion(self, score: float, detected: bool):
+        """
+        Publish the latest analytics result
+
+        Args:
+            score: Fraction of changed pixels in the last frame pair
+            detected: Whether the score is above the camera's threshold
+        """
+        self.motion_score = score
+        if detected != self.is_motion_detected():
+            if detected:
+                self.simulate_motion()
+            else:
+                self.simulate_clear()
+
+    def get_status(self) -> dict:
+        status = super().get_status()
+        status["camera_id"] = self.camera_id
+        status["motion_score"] = round(self.motion_score, 4)
+        return status
@@ -1,11 +1,15 @@
+from typing import Callable
+
+from ..clock import REAL_CLOCK
 from .device_sensor_tester import DeviceSensorTester
 from .interface_sensor import InterfaceSensor
 
 
 class DeviceWinDoorSensor(DeviceSensorTester, InterfaceSensor):
 
-    def __init__(self):
+    def __init__(self, clock: Callable[[], float] = REAL_CLOCK):
         super().__init__()
+        self.clock = clock  # stamps intruded_at
 
         # Assign unique ID
         DeviceSensorTester.newIdSequence_WinDoorSensor += 1
@@ -14,6 +18,7 @@ class DeviceWinDoorSensor(DeviceSensorTester, InterfaceSensor):
         # Initialize state
         self.opened = False
         self.armed = False
+        self.intruded_at = None  # clock() of the last intrude()
 
         # Add to linked list
         self.next = DeviceSensorTester.head_WinDoorSensor
@@ -32,11 +37,13 @@ class DeviceWinDoorSensor(DeviceSensorTester, InterfaceSensor):
 
     def intrude(self):
         """Simulate opening the window/door."""
+        self.intruded_at = self.clock()
         self.opened = True
 
     def release(self):
         """Simulate closing the window/door."""
         self.opened = False
+        self.intruded_at = None  # the next trip is a new intrusion
 
     def get_id(self):
         """Alias for getID."""
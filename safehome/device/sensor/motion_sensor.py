@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Callable, Optional
 
+from ..clock import REAL_CLOCK
 from .device_motion_detector import DeviceMotionDetector
 from .sensor import Sensor
 
@@ -10,7 +11,13 @@ class MotionSensor(Sensor):
     Wraps DeviceMotionDetector hardware and provides high-level interface
     """
 
-    def __init__(self, sensor_id: int, location: str, zone_id: Optional[int] = None):
+    def __init__(
+        self,
+        sensor_id: int,
+        location: str,
+        zone_id: Optional[int] = None,
+        clock: Callable[[], float] = REAL_CLOCK,
+    ):
         """
         Initialize Motion Sensor
 
@@ -18,11 +25,12 @@ class MotionSensor(Sensor):
             sensor_id: Unique sensor identifier
             location: Physical location (e.g., "Living Room", "Hallway")
             zone_id: Safety zone this sensor belongs to
+            clock: Time source stamping hardware trips (intruded_at)
         """
         super().__init__(sensor_id, "MOTION", location, zone_id)
 
         # Create hardware device instance
-        self.hardware = DeviceMotionDetector()
+        self.hardware = DeviceMotionDetector(clock=clock)
 
     def read(self) -> bool:
         """
@@ -38,13 +46,21 @@ class MotionSensor(Sensor):
 
     def arm(self):
         """Arm the sensor (enable motion detection)"""
+        before = self._snapshot()
         self.is_active = True
         self.hardware.arm()
+        self._notify_change(before)
 
     def disarm(self):
         """Disarm the sensor (disable motion detection)"""
+        before = self._snapshot()
         self.is_active = False
         self.hardware.disarm()
+        self._notify_change(before)
+
+    def _physical_state(self) -> Optional[bool]:
+        """Whether motion is currently detected"""
+        return getattr(self.hardware, "detected", None)
 
     def test_armed_state(self) -> bool:
         """
@@ -67,9 +83,13 @@ class MotionSensor(Sensor):
     def simulate_motion(self):
         """Simulate motion detection (for testing)"""
         if hasattr(self.hardware, "intrude"):
+            before = self._snapshot()
             self.hardware.intrude()
+            self._notify_change(before)
 
     def simulate_clear(self):
         """Simulate motion clearing (for testing)"""
         if hasattr(self.hardware, "release"):
+            before = self._snapshot()
             self.hardware.release()
+            self._notify_change(before)
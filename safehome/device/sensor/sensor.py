@@ -30,6 +30,7 @@ class Sensor(ABC):
         self.zone_id = zone_id
         self.is_active = False  # Whether sensor is armed/active
         self.hardware = None  # Hardware device instance
+        self.on_change = None  # Optional callback(sensor) on state changes
 
     @abstractmethod
     def read(self) -> bool:
@@ -61,6 +62,19 @@ class Sensor(ABC):
         """
         pass
 
+    def _physical_state(self) -> Optional[bool]:
+        """Physical state (open/detected) independent of arming, if known"""
+        return None
+
+    def _snapshot(self) -> tuple:
+        """Capture state for change detection"""
+        return (self.is_active, self._physical_state(), self.zone_id)
+
+    def _notify_change(self, before: tuple):
+        """Report a state change to the registered listener, if state differs"""
+        if self.on_change is not None and self._snapshot() != before:
+            self.on_change(self)
+
     def get_id(self) -> int:
         """Get sensor ID"""
         return self.sensor_id
@@ -79,7 +93,9 @@ class Sensor(ABC):
 
     def set_zone_id(self, zone_id: Optional[int]):
         """Set zone ID"""
+        before = self._snapshot()
         self.zone_id = zone_id
+        self._notify_change(before)
 
     def get_status(self) -> dict:
         """
@@ -95,6 +111,8 @@ class Sensor(ABC):
             "zone_id": self.zone_id,
             "is_active": self.is_active,
             "is_triggered": self.read() if self.is_active else False,
+            # Open/detected regardless of arming (None if unknown)
+            "physical_state": self._physical_state(),
         }
 
     def __repr__(self):
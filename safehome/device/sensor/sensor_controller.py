@@ -1,5 +1,8 @@
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
+from ..clock import REAL_CLOCK
+from .camera_motion_sensor import CameraMotionSensor
 from .motion_sensor import MotionSensor
 from .sensor import Sensor
 from .windoor_sensor import WindowDoorSensor
@@ -12,18 +15,45 @@ class SensorController:
     Based on SRS requirements for sensor management
     """
 
-    def __init__(self, storage_manager=None, logger=None):
+    def __init__(
+        self,
+        storage_manager=None,
+        logger=None,
+        event_bus=None,
+        metrics=None,
+        clock: Callable[[], float] = REAL_CLOCK,
+    ):
         """
         Initialize Sensor Controller
 
         Args:
             storage_manager: StorageManager for persistence
             logger: LogManager for logging events
+            event_bus: Optional EventBus receiving "sensor" change events
+            metrics: Optional MetricsRegistry receiving poll timings
+            clock: Time source the sensor hardware stamps trips with
         """
         self.sensors: Dict[int, Sensor] = {}  # {sensor_id: Sensor instance}
         self.storage = storage_manager
         self.logger = logger
+        self.event_bus = event_bus
+        self.metrics = metrics
+        self.clock = clock
         self._next_sensor_id = 1  # Auto-increment sensor ID
+        # Bumped on every sensor add/remove/state change
+        self.state_version = 0
+
+    def _register(self, sensor: Sensor):
+        """Store a sensor and start tracking its state changes"""
+        sensor.on_change = self._on_sensor_change
+        self.sensors[sensor.sensor_id] = sensor
+        self._on_sensor_change(sensor)
+
+    def _on_sensor_change(self, sensor: Sensor):
+        """Record a sensor state change and publish it"""
+        self.state_version += 1
+        if self.event_bus is not None:
+            self.event_bus.publish("sensor", sensor.get_status())
 
     def add_sensor(
         self, sensor_type: str, location: str, zone_id: Optional[int] = None
@@ -47,16 +77,16 @@ class SensorController:
 
         # Create appropriate sensor type
         if sensor_type.upper() == "WINDOOR":
-            sensor = WindowDoorSensor(sensor_id, location, zone_id)
+            sensor = WindowDoorSensor(sensor_id, location, zone_id, clock=self.clock)
         elif sensor_type.upper() == "MOTION":
-            sensor = MotionSensor(sensor_id, location, zone_id)
+            sensor = MotionSensor(sensor_id, location, zone_id, clock=self.clock)
         else:
             raise ValueError(
                 f"Invalid sensor type: {sensor_type}. Must be 'WINDOOR' or 'MOTION'"
             )
 
         # Store sensor
-        self.sensors[sensor_id] = sensor
+        self._register(sensor)
 
         # Persist to database
         if self.storage:
@@ -71,6 +101,56 @@ class SensorController:
 
         return sensor
 
+    def add_camera_motion_sensor(
+        self, camera_id: int, location: str, zone_id: Optional[int] = None
+    ) -> CameraMotionSensor:
+        """
+        Publish a virtual motion sensor for a camera's motion analytics
+        Reuses an unbound stored camera sensor at the same location so the
+        sensor ID (and its event history) survives restarts.
+
+        Args:
+            camera_id: Camera whose frames drive the sensor
+            location: Camera location
+            zone_id: Optional safety zone ID
+
+        Returns:
+            The camera's virtual sensor
+        """
+        unbound = None
+        for sensor in self.sensors.values():
+            if not isinstance(sensor, CameraMotionSensor):
+                continue
+            if sensor.camera_id == camera_id:
+                return sensor
+            if unbound is None and sensor.camera_id is None:
+                if sensor.location == location:
+                    unbound = sensor
+        if unbound is not None:
+            unbound.camera_id = camera_id
+            if unbound.zone_id != zone_id:
+                unbound.set_zone_id(zone_id)
+                if self.storage:
+                    self.storage.save_sensor(
+                        unbound.sensor_id, unbound.sensor_type, location, zone_id
+                    )
+            return unbound
+
+        sensor_id = self._next_sensor_id
+        self._next_sensor_id += 1
+        sensor = CameraMotionSensor(
+            sensor_id, location, zone_id, camera_id=camera_id, clock=self.clock
+        )
+        self._register(sensor)
+        if self.storage:
+            self.storage.save_sensor(sensor_id, sensor.sensor_type, location, zone_id)
+        if self.logger:
+            self.logger.add_log(
+                f"Sensor {sensor_id} (camera {camera_id} motion) added at {location}",
+                source="SensorController",
+            )
+        return sensor
+
     def remove_sensor(self, sensor_id: int) -> bool:
         """
         Remove a sensor from the system
@@ -91,6 +171,10 @@ class SensorController:
 
         # Remove from memory
         del self.sensors[sensor_id]
+        sensor.on_change = None
+        self.state_version += 1
+        if self.event_bus is not None:
+            self.event_bus.publish("sensor", {"id": sensor_id, "removed": True})
 
         # Remove from database
         if self.storage:
@@ -232,6 +316,7 @@ class SensorController:
         Returns:
             List of (sensor_id, sensor) tuples for sensors that are triggered
         """
+        start = time.perf_counter() if self.metrics is not None else None
         detections = []
 
         for sensor_id, sensor in self.sensors.items():
@@ -239,6 +324,13 @@ class SensorController:
             if sensor.is_active and sensor.read():
                 detections.append((sensor_id, sensor))
 
+        if start is not None:
+            self.metrics.histogram(
+                "safehome_poll_duration_seconds", "poll_sensors duration"
+            ).observe(time.perf_counter() - start)
+            self.metrics.counter(
+                "safehome_poll_detections_total", "Intrusions detected by polling"
+            ).inc(len(detections))
         return detections
 
     def check_all_windoor_closed(self) -> Tuple[bool, List[Sensor]]:
@@ -302,13 +394,20 @@ class SensorController:
 
             # Create sensor
             if sensor_type == "WINDOOR":
-                sensor = WindowDoorSensor(sensor_id, location, zone_id)
+                sensor = WindowDoorSensor(
+                    sensor_id, location, zone_id, clock=self.clock
+                )
             elif sensor_type == "MOTION":
-                sensor = MotionSensor(sensor_id, location, zone_id)
+                sensor = MotionSensor(sensor_id, location, zone_id, clock=self.clock)
+            elif sensor_type == CameraMotionSensor.SENSOR_TYPE:
+                # Bound to its camera again when motion analytics starts
+                sensor = CameraMotionSensor(
+                    sensor_id, location, zone_id, clock=self.clock
+                )
             else:
                 continue
 
-            self.sensors[sensor_id] = sensor
+            self._register(sensor)
 
         if self.logger:
             self.logger.add_log(
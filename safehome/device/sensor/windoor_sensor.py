@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Callable, Optional
 
+from ..clock import REAL_CLOCK
 from .device_windoor_sensor import DeviceWinDoorSensor
 from .sensor import Sensor
 
@@ -10,7 +11,13 @@ class WindowDoorSensor(Sensor):
     Wraps DeviceWinDoorSensor hardware and provides high-level interface
     """
 
-    def __init__(self, sensor_id: int, location: str, zone_id: Optional[int] = None):
+    def __init__(
+        self,
+        sensor_id: int,
+        location: str,
+        zone_id: Optional[int] = None,
+        clock: Callable[[], float] = REAL_CLOCK,
+    ):
         """
         Initialize Window/Door Sensor
 
@@ -18,11 +25,12 @@ class WindowDoorSensor(Sensor):
             sensor_id: Unique sensor identifier
             location: Physical location (e.g., "Front Door", "Living Room Window")
             zone_id: Safety zone this sensor belongs to
+            clock: Time source stamping hardware trips (intruded_at)
         """
         super().__init__(sensor_id, "WINDOOR", location, zone_id)
 
         # Create hardware device instance
-        self.hardware = DeviceWinDoorSensor()
+        self.hardware = DeviceWinDoorSensor(clock=clock)
 
     def read(self) -> bool:
         """
@@ -38,13 +46,21 @@ class WindowDoorSensor(Sensor):
 
     def arm(self):
         """Arm the sensor (enable detection)"""
+        before = self._snapshot()
         self.is_active = True
         self.hardware.arm()
+        self._notify_change(before)
 
     def disarm(self):
         """Disarm the sensor (disable detection)"""
+        before = self._snapshot()
         self.is_active = False
         self.hardware.disarm()
+        self._notify_change(before)
+
+    def _physical_state(self) -> Optional[bool]:
+        """Whether the window/door is open"""
+        return getattr(self.hardware, "opened", None)
 
     def test_armed_state(self) -> bool:
         """
@@ -67,9 +83,13 @@ class WindowDoorSensor(Sensor):
     def simulate_open(self):
         """Simulate window/door opening (for testing)"""
         if hasattr(self.hardware, "intrude"):
+            before = self._snapshot()
             self.hardware.intrude()
+            self._notify_change(before)
 
     def simulate_close(self):
         """Simulate window/door closing (for testing)"""
         if hasattr(self.hardware, "release"):
+            before = self._snapshot()
             self.hardware.release()
+            self._notify_change(before)
@@ -0,0 +1,126 @@
+"""
+Camera Render Worker
+Renders dashboard camera frames off the Tk thread
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
+
+from PIL import Image
+
+FRAME_SIZE = (400, 300)
+
+
+def render_camera_frame(
+    camera_controller, camera_id: int, password: Optional[str], size=FRAME_SIZE
+) -> Optional[Image.Image]:
+    """Fetch a camera view through the controller and resize it for display"""
+    img = camera_controller.get_camera_view(camera_id, password=password)
+    if img is None:
+        return None
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+@dataclass
+class CameraFrame:
+    """Latest rendered frame for one camera"""
+
+    version: int
+    image: Optional[Image.Image]  # None when the view was denied/unavailable
+    password: Optional[str]  # password the frame was rendered with
+    _content: Optional[bytes] = field(default=None, repr=False)
+
+
+class CameraRenderWorker:
+    """
+    Worker pool producing ready-sized camera frames
+    Each camera has a single latest-frame slot whose version only changes
+    when the rendered content does. The Tk thread calls request() every
+    tick and take_frame() to pick up frames it has not shown yet.
+    """
+
+    def __init__(self, camera_controller, size=FRAME_SIZE, max_workers: int = 2):
+        """
+        Initialize Camera Render Worker
+
+        Args:
+            camera_controller: CameraController to render from
+            size: (width, height) of produced frames
+            max_workers: Render threads shared by all cameras
+        """
+        self.camera_controller = camera_controller
+        self.size = size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="camera-render"
+        )
+        self._lock = threading.Lock()
+        self._slots: Dict[int, CameraFrame] = {}
+        self._taken: Dict[int, int] = {}  # {camera_id: version last taken}
+        self._pending: Set[int] = set()
+        self._closed = False
+
+    def request(self, camera_id: int, password: Optional[str] = None) -> bool:
+        """
+        Queue a render unless one is already in flight for the camera
+
+        Returns:
+            True if a render was queued
+        """
+        with self._lock:
+            if self._closed or camera_id in self._pending:
+                return False
+            self._pending.add(camera_id)
+        self._executor.submit(self._render, camera_id, password)
+        return True
+
+    def take_frame(self, camera_id: int) -> Optional[CameraFrame]:
+        """Return the latest frame if it has not been taken yet, else None"""
+        with self._lock:
+            frame = self._slots.get(camera_id)
+            if frame is None or self._taken.get(camera_id) == frame.version:
+                return None
+            self._taken[camera_id] = frame.version
+            return frame
+
+    def forget(self, camera_id: int):
+        """Mark the camera's frame as not shown (e.g. label was overwritten)"""
+        with self._lock:
+            self._taken.pop(camera_id, None)
+
+    def get_pending(self) -> Tuple[int, ...]:
+        """Get IDs of cameras with a render in flight"""
+        with self._lock:
+            return tuple(self._pending)
+
+    def shutdown(self):
+        """Stop accepting work and drop queued renders"""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _render(self, camera_id: int, password: Optional[str]):
+        try:
+            image = render_camera_frame(
+                self.camera_controller, camera_id, password, self.size
+            )
+        except Exception as e:
+            print(f"Error rendering camera {camera_id}: {e}")
+            image = None
+        content = image.tobytes() if image is not None else None
+        with self._lock:
+            self._pending.discard(camera_id)
+            previous = self._slots.get(camera_id)
+            # Denials are always handed off, so the dashboard drops the
+            # password instead of retrying it on every tick
+            denied = content is None and password is not None
+            if (
+                previous is not None
+                and previous._content == content
+                and (content is not None or previous.password == password)
+                and not denied
+            ):
+                return  # unchanged; keep the version so Tk skips the label
+            version = previous.version + 1 if previous else 1
+            self._slots[camera_id] = CameraFrame(version, image, password, content)
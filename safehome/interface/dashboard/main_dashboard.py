@@ -6,10 +6,13 @@ Unified monitoring and control interface
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 
-from PIL import Image, ImageTk
+from PIL import ImageTk
 
 from safehome.configuration.safehome_mode import SafeHomeMode
 
+from ..table_model import ReconcilingTable
+from .camera_renderer import CameraFrame, CameraRenderWorker, render_camera_frame
+
 
 class MainDashboard(tk.Toplevel):
     """
@@ -32,6 +35,8 @@ class MainDashboard(tk.Toplevel):
             set()
         )  # camera_ids we've already prompted for during auto-refresh
         self.camera_access_failed = set()  # camera_ids with recent failed access
+        # Renders camera frames off the Tk thread; _update_cameras only hands off
+        self.camera_renderer = CameraRenderWorker(self.system.camera_controller)
 
         # Register for zone updates
         self.system.config.register_zone_update_callback(self._update_zones)
@@ -574,18 +579,13 @@ class MainDashboard(tk.Toplevel):
         self.after(500, self._update_loop)
 
     def _update_cameras(self):
-        """카메라 이미지 갱신"""
+        """카메라 이미지 갱신 (rendering runs on the camera render worker)"""
+        renderer = getattr(self, "camera_renderer", None)
         for cam_id, label in self.camera_labels.items():
             try:
                 camera = self.system.camera_controller.get_camera(cam_id)
                 if camera and not camera.is_enabled:
-                    label.config(
-                        image="",
-                        text="Disabled",
-                        compound="center",
-                        fg="white",
-                        font=("Arial", 12, "bold"),
-                    )
+                    self._show_camera_message(cam_id, label, "Disabled", "white")
                     continue
 
                 # Handle password requirement
@@ -599,54 +599,58 @@ class MainDashboard(tk.Toplevel):
                                 self.camera_password_prompted.add(cam_id)
                                 password = self.camera_password_cache.get(cam_id)
                         if not password:
-                            label.config(
-                                image="",
-                                text="Password Required",
-                                compound="center",
-                                fg="orange",
-                                font=("Arial", 12, "bold"),
+                            self._show_camera_message(
+                                cam_id, label, "Password Required", "orange"
                             )
                             continue
                     else:
                         # Guest: do not prompt, just indicate protected
-                        label.config(
-                            image="",
-                            text="Password Protected",
-                            compound="center",
-                            fg="orange",
-                            font=("Arial", 12, "bold"),
+                        self._show_camera_message(
+                            cam_id, label, "Password Protected", "orange"
                         )
                         continue
 
-                img = self.system.camera_controller.get_camera_view(
-                    cam_id, password=password
-                )
-                if img:
+                if renderer is None:
+                    # No worker (dashboard not fully built): render inline
+                    frame = CameraFrame(
+                        0,
+                        render_camera_frame(
+                            self.system.camera_controller, cam_id, password
+                        ),
+                        password,
+                    )
+                else:
+                    frame = renderer.take_frame(cam_id)
+                    denied = (
+                        frame is not None
+                        and frame.image is None
+                        and password is not None
+                        and frame.password == password
+                    )
+                    # Re-rendering with a password that was just denied would
+                    # count a second failed attempt toward the camera lockout
+                    if not denied:
+                        renderer.request(cam_id, password)
+                    if frame is None:
+                        continue  # nothing new rendered; leave the label alone
+
+                if frame.image is not None:
                     self.camera_access_failed.discard(cam_id)
-                    img_resized = img.resize((400, 300), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img_resized)
+                    photo = ImageTk.PhotoImage(frame.image)
                     label.config(image=photo, text="")
                     label.image = photo
-                else:
-                    # If password protected and failed, clear cached password to force re-entry
-                    if camera and camera.has_password():
+                elif camera and camera.has_password():
+                    # Clear the cached password to force re-entry, unless it
+                    # was already replaced after this frame was requested
+                    if self.camera_password_cache.get(cam_id) in (
+                        None,
+                        frame.password,
+                    ):
                         self.camera_password_cache.pop(cam_id, None)
                         self.camera_access_failed.add(cam_id)
-                        label.config(
-                            image="",
-                            text="Access Denied",
-                            compound="center",
-                            fg="red",
-                            font=("Arial", 12, "bold"),
-                        )
-                    else:
-                        label.config(
-                            image="",
-                            text="No Signal",
-                            compound="center",
-                            fg="red",
-                            font=("Arial", 12, "bold"),
-                        )
+                        self._show_camera_message(cam_id, label, "Access Denied", "red")
+                else:
+                    self._show_camera_message(cam_id, label, "No Signal", "red")
             except Exception as e:
                 label.config(
                     image="",
@@ -655,19 +659,36 @@ class MainDashboard(tk.Toplevel):
                     fg="red",
                 )
 
-    def _update_sensors(self):
-        """센서 리스트 갱신"""
-        self.sensor_tree.delete(*self.sensor_tree.get_children())
-
-        for sensor in self.system.sensor_controller.get_all_sensors():
-            status = "● Armed" if sensor.is_active else "○ Disarmed"
-            zone_name = f"Zone {sensor.zone_id}" if sensor.zone_id else "-"
+    def _show_camera_message(self, cam_id: int, label, text: str, fg: str):
+        """Replace a camera image with a status message"""
+        label.config(
+            image="",
+            text=text,
+            compound="center",
+            fg=fg,
+            font=("Arial", 12, "bold"),
+        )
+        renderer = getattr(self, "camera_renderer", None)
+        if renderer is not None:
+            # Redraw the next frame even if its content has not changed
+            renderer.forget(cam_id)
 
-            self.sensor_tree.insert(
-                "",
-                "end",
-                values=(sensor.sensor_type, sensor.location, zone_name, status),
-            )
+    def _update_sensors(self):
+        """센서 리스트 갱신 (only changed rows are touched)"""
+        self.sensor_table = ReconcilingTable.for_sensors(
+            self.sensor_tree, self._sensor_row, getattr(self, "sensor_table", None)
+        )
+        self.sensor_table.sync_sensors(self.system.sensor_controller)
+
+    @staticmethod
+    def _sensor_row(sensor) -> tuple:
+        """Tree values for one sensor"""
+        return (
+            sensor.sensor_type,
+            sensor.location,
+            f"Zone {sensor.zone_id}" if sensor.zone_id else "-",
+            "● Armed" if sensor.is_active else "○ Disarmed",
+        )
 
     def _update_zones(self):
         """Zone 목록 갱신"""
@@ -1146,6 +1167,13 @@ class MainDashboard(tk.Toplevel):
             self.login_window.password_entry.delete(0, tk.END)
             self.login_window.password_entry.focus()
 
+    def destroy(self):
+        """Stop the camera render worker along with the window"""
+        renderer = getattr(self, "camera_renderer", None)
+        if renderer is not None:
+            renderer.shutdown()
+        super().destroy()
+
     def _on_close(self):
         """윈도우 종료"""
         if messagebox.askokcancel("Quit", "Shutdown SafeHome System?"):
@@ -322,7 +322,7 @@ class ZoneManagerWindow(tk.Toplevel):
         for sensor in self.system.sensor_controller.sensors.values():
             if sensor.zone_id == zone_id:
                 sensor_type = (
-                    "Motion" if sensor.sensor_type == "MOTION" else "Door/Window"
+                    "Motion" if sensor.sensor_type.endswith("MOTION") else "Door/Window"
                 )
                 status = "Active" if sensor.get_status() else "Inactive"
 
@@ -383,7 +383,7 @@ class ZoneManagerWindow(tk.Toplevel):
                 if s.zone_id == self.selected_zone_id
             ]
             for sensor in sensors_in_zone:
-                sensor.zone_id = None
+                sensor.set_zone_id(None)
                 # Persist this change if your system requires it, e.g., by calling a save method
                 # self.system.sensor_controller.save_sensor(sensor) # Assuming such a method exists
 
@@ -609,7 +609,9 @@ class AssignSensorDialog(tk.Toplevel):
         self.sensor_ids = []
         for sensor_id, sensor in self.system.sensor_controller.sensors.items():
             self.sensor_ids.append(sensor_id)
-            sensor_type = "Motion" if sensor.sensor_type == "MOTION" else "Door/Window"
+            sensor_type = (
+                "Motion" if sensor.sensor_type.endswith("MOTION") else "Door/Window"
+            )
             zone_info = (
                 f"(Zone: {self.system.config.get_safety_zone(sensor.zone_id).name})"
                 if sensor.zone_id
@@ -655,13 +657,13 @@ class AssignSensorDialog(tk.Toplevel):
         # First, unassign all sensors currently in this zone
         for sensor in self.system.sensor_controller.sensors.values():
             if sensor.zone_id == self.zone.zone_id:
-                sensor.zone_id = None
+                sensor.set_zone_id(None)
 
         # Assign selected sensors to this zone
         for index in selected_indices:
             sensor_id = self.sensor_ids[index]
             sensor = self.system.sensor_controller.sensors[sensor_id]
-            sensor.zone_id = self.zone.zone_id
+            sensor.set_zone_id(self.zone.zone_id)
 
         # Save configuration
         self.system.config.save_configuration()
@@ -0,0 +1,149 @@
+"""
+Reconciling Treeview table model
+Keeps a ttk.Treeview in sync with keyed rows by touching only what changed
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class ReconcilingTable:
+    """
+    Diff-based Treeview updater
+    Rows are identified by a key (e.g. sensor_id, used as the item iid).
+    sync() inserts new rows, removes vanished rows, rewrites only rows whose
+    values changed and does nothing when the source version is unchanged.
+    """
+
+    def __init__(self, tree):
+        """
+        Initialize Reconciling Table
+
+        Args:
+            tree: ttk.Treeview (or compatible) to manage
+        """
+        self.tree = tree
+        self._rows: Dict[Hashable, Tuple[Any, ...]] = {}
+        self._order: List[Hashable] = []
+        self._version: Optional[int] = None
+        self._adopted = False
+
+    @classmethod
+    def for_sensors(
+        cls,
+        tree,
+        row: Callable[[Any], Tuple[Any, ...]],
+        reuse: Optional["ReconcilingTable"] = None,
+    ) -> "SensorTable":
+        """
+        Table model for a sensor Treeview
+
+        Args:
+            tree: ttk.Treeview listing sensors
+            row: Callable(sensor) returning the tree values of one sensor
+            reuse: Existing model, returned as is if it still manages tree
+                (a new one is made when the view was rebuilt)
+
+        Returns:
+            SensorTable keyed by sensor_id
+        """
+        if isinstance(reuse, SensorTable) and reuse.tree is tree:
+            return reuse
+        return SensorTable(tree, row)
+
+    def sync(
+        self,
+        rows: Iterable[Tuple[Hashable, Tuple[Any, ...]]],
+        version: Optional[int] = None,
+    ) -> bool:
+        """
+        Reconcile the tree with the given rows
+
+        Args:
+            rows: (key, values) pairs in display order
+            version: Source state version; if equal to the last synced
+                version the tree is left untouched (None always syncs)
+
+        Returns:
+            True if the rows were reconciled, False if skipped
+        """
+        if version is not None and version == self._version:
+            return False
+
+        if not self._adopted:
+            # Drop rows inserted before this model took over the tree
+            existing = self.tree.get_children()
+            if existing:
+                self.tree.delete(*existing)
+            self._adopted = True
+
+        new_rows = {}
+        new_order = []
+        for key, values in rows:
+            new_rows[key] = tuple(values)
+            new_order.append(key)
+
+        removed = [key for key in self._order if key not in new_rows]
+        if removed:
+            self.tree.delete(*(self._iid(key) for key in removed))
+
+        survivors = [key for key in self._order if key in new_rows]
+        reorder = survivors != [key for key in new_order if key in self._rows]
+
+        for index, key in enumerate(new_order):
+            values = new_rows[key]
+            old = self._rows.get(key)
+            if old is None:
+                self.tree.insert("", index, iid=self._iid(key), values=values)
+                continue
+            if old != values:
+                self.tree.item(self._iid(key), values=values)
+            if reorder:
+                self.tree.move(self._iid(key), "", index)
+
+        self._rows = new_rows
+        self._order = new_order
+        self._version = version
+        return True
+
+    def invalidate(self):
+        """Force the next sync() to reconcile even if the version is unchanged"""
+        self._version = None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @staticmethod
+    def _iid(key: Hashable) -> str:
+        return str(key)
+
+
+class SensorTable(ReconcilingTable):
+    """
+    ReconcilingTable over a SensorController's sensors
+    Rows are keyed by sensor_id in ID order; the controller's state_version
+    skips syncs when no sensor changed.
+    """
+
+    def __init__(self, tree, row: Callable[[Any], Tuple[Any, ...]]):
+        """
+        Initialize Sensor Table
+
+        Args:
+            tree: ttk.Treeview listing sensors
+            row: Callable(sensor) returning the tree values of one sensor
+        """
+        super().__init__(tree)
+        self.row = row
+
+    def sync_sensors(self, controller) -> bool:
+        """
+        Reconcile the tree with the controller's sensors
+
+        Returns:
+            True if the rows were reconciled, False if skipped
+        """
+        sensors = sorted(controller.get_all_sensors(), key=lambda s: s.sensor_id)
+        return self.sync(
+            ((sensor.sensor_id, self.row(sensor)) for sensor in sensors),
+            version=controller.state_version,
+        )
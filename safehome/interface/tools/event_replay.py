@@ -0,0 +1,360 @@
+"""
+SafeHome Event Recording and Replay
+Records sensor state transitions, arm/disarm (mode) changes and login
+attempts of a running System as a JSONL stream with monotonic offsets,
+and replays such a stream into a fresh System on virtual time.
+
+The replay System must run on a ManualClock: the replayer then drives
+polling itself and advances the clock between events,
+so entry delays and alarm durations take no wall-clock time at
+speed=None (as fast as possible) and 1/N of it at speed=N.
+
+Usage:
+    python -m safehome.interface.tools.event_replay session.jsonl \\
+        [--speed max|1|10] [--output stats.json]
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+from ...device.clock import REAL_CLOCK, Clock
+
+FORMAT_VERSION = 1
+
+
+class EventRecorder:
+    """
+    Write a System's sensor, mode and login events to a JSONL file
+    The first line is a header with the timing settings; a snapshot of
+    every sensor and the current mode follows at t=0, then one line per
+    event with t = seconds since start(). stop() writes an "end" marker
+    so a replay covers the quiet tail of the session too.
+    """
+
+    TOPICS = ("sensor", "mode", "login")
+
+    def __init__(self, system, path: str, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize Event Recorder
+
+        Args:
+            system: System to record
+            path: JSONL file to write (overwritten)
+            clock: Monotonic time source in seconds
+        """
+        self.system = system
+        self.path = path
+        self.clock = clock
+        self.count = 0
+        self._file = None
+        self._start = 0.0
+        self._subscription = None
+        self._lock = threading.Lock()
+
+    def start(self) -> "EventRecorder":
+        """Open the file, write header and snapshot, and start recording"""
+        settings = self.system.config.settings
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._start = self.clock()
+        self.count = 0
+        self._write(
+            {
+                "kind": "header",
+                "version": FORMAT_VERSION,
+                "started_at": time.time(),
+                "poll_interval": self.system.poll_interval,
+                "entry_delay": settings.entry_delay,
+                "alarm_duration": settings.alarm_duration,
+            }
+        )
+        with self._lock:
+            for sensor in list(self.system.sensor_controller.sensors.values()):
+                self._write_event("sensor", sensor.get_status(), 0.0)
+            self._write_event("mode", {"mode": self.system.config.get_mode().name}, 0.0)
+        self._subscription = self.system.subscribe(
+            callback=self._on_event, topics=self.TOPICS
+        )
+        return self
+
+    def stop(self):
+        """Stop recording and close the file (no-op if not started)"""
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        with self._lock:
+            if self._file is not None:
+                self._write({"kind": "end", "t": self._elapsed()})
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _on_event(self, event):
+        with self._lock:
+            if self._file is not None:
+                self._write_event(event.topic, event.data, self._elapsed())
+
+    def _elapsed(self) -> float:
+        return round(self.clock() - self._start, 6)
+
+    def _write_event(self, topic: str, data: dict, t: float):
+        """Encode one event (lock held)"""
+        if topic == "sensor" and data.get("removed"):
+            record = {"id": data["id"], "removed": True}
+        elif topic == "sensor":
+            record = {
+                "id": data["id"],
+                "type": data["type"],
+                "location": data["location"],
+                "zone_id": data["zone_id"],
+                "active": data["is_active"],
+                "state": data["physical_state"],
+            }
+        elif topic == "mode":
+            record = {"mode": data["mode"]}
+        else:
+            record = {
+                "user_id": data["user_id"],
+                "interface": data["interface"],
+                "result": data["result"],
+            }
+        self._write({"kind": topic, "t": t, **record})
+        self.count += 1
+
+    def _write(self, record: dict):
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+
+class EventReplayer:
+    """
+    Replay a recorded event stream into a System on virtual time
+    Sensors are recreated on first sight (recorded IDs are mapped to the
+    new ones); only transitions that change state are applied. Logins are
+    replayed with the target system's own credentials for recorded
+    successes and a wrong password otherwise, so lockouts reproduce.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[dict],
+        speed: Optional[float] = None,
+        wall_clock: Clock = REAL_CLOCK,
+    ):
+        """
+        Initialize Event Replayer
+
+        Args:
+            events: Decoded records (header first, as written by EventRecorder)
+            speed: Virtual seconds per wall-clock second (None: no waiting)
+            wall_clock: Real time source that paces replays at a given speed
+                and measures their wall time
+        """
+        records = list(events)
+        if not records or records[0].get("kind") != "header":
+            raise ValueError("Event stream has no header")
+        if records[0].get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported event stream version: {records[0].get('version')}"
+            )
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive (or None for max)")
+        self.header = records[0]
+        self.events: List[dict] = records[1:]
+        self.speed = speed
+        self.wall_clock = wall_clock
+        self._sensor_map = {}
+
+    @classmethod
+    def load(cls, path: str, speed: Optional[float] = None) -> "EventReplayer":
+        """Read a JSONL file written by EventRecorder"""
+        with open(path, "r", encoding="utf-8") as f:
+            events = [json.loads(line) for line in f if line.strip()]
+        return cls(events, speed=speed)
+
+    def replay(self, system) -> dict:
+        """
+        Feed the stream into a System
+        The system takes the recorded poll interval, entry delay and alarm
+        duration, and is turned on without its polling thread.
+
+        Args:
+            system: System built with clock=ManualClock()
+
+        Returns:
+            Stats: events, polls, detections, alarms, virtual/wall seconds
+            and speedup
+        """
+        from safehome.device.clock import ManualClock
+
+        clock = system.clock
+        if not isinstance(clock, ManualClock):
+            raise ValueError("Replay needs a System running on a ManualClock")
+
+        header = self.header
+        system.poll_interval = header["poll_interval"]
+        settings = system.config.settings
+        settings.entry_delay = header["entry_delay"]
+        settings.alarm_duration = header["alarm_duration"]
+        system.alarm.set_duration(header["alarm_duration"])
+        if not system.is_running:
+            system.turn_on(polling=False)
+
+        alarms = []
+
+        def on_alarm(event):
+            if event.data["active"]:
+                alarms.append(event)
+
+        subscription = system.subscribe(callback=on_alarm, topics=["alarm"])
+        self._sensor_map = {}
+        stats = {"events": 0, "polls": 0, "detections": 0}
+        origin = clock.now()
+        wall_clock = self.wall_clock
+        wall_start = wall_clock.now()
+        next_poll = origin + system.poll_interval
+
+        def advance_to(target: float):
+            if self.speed is not None:
+                wait = wall_start + (target - origin) / self.speed
+                remaining = wait - wall_clock.now()
+                if remaining > 0:
+                    wall_clock.sleep(remaining)
+            if target > clock.now():
+                clock.advance(target - clock.now())
+
+        try:
+            for event in self.events:
+                at = origin + event["t"]
+                # Polls due before the event run at their own virtual times
+                while next_poll <= at:
+                    advance_to(next_poll)
+                    stats["detections"] += system.poll_once()
+                    stats["polls"] += 1
+                    next_poll += system.poll_interval
+                advance_to(at)
+                if event["kind"] != "end":
+                    self._apply(system, event)
+                    stats["events"] += 1
+        finally:
+            subscription.close()
+
+        wall = wall_clock.now() - wall_start
+        virtual = clock.now() - origin
+        stats.update(
+            {
+                "alarms": len(alarms),
+                "virtual_s": round(virtual, 3),
+                "wall_s": round(wall, 3),
+                "speedup": round(virtual / wall, 1) if wall > 0 else None,
+            }
+        )
+        return stats
+
+    # ===== Event application =====
+    def _apply(self, system, event: dict):
+        kind = event["kind"]
+        if kind == "sensor":
+            self._apply_sensor(system, event)
+        elif kind == "mode":
+            from safehome.configuration.safehome_mode import SafeHomeMode
+
+            system.config.set_mode(SafeHomeMode[event["mode"]])
+        elif kind == "login":
+            system.login(
+                event["user_id"],
+                self._password_for(system, event),
+                event["interface"],
+            )
+
+    def _apply_sensor(self, system, event: dict):
+        controller = system.sensor_controller
+        sensor_id = self._sensor_map.get(event["id"])
+        if event.get("removed"):
+            if sensor_id is not None:
+                controller.remove_sensor(sensor_id)
+                del self._sensor_map[event["id"]]
+            return
+        sensor = controller.get_sensor(sensor_id) if sensor_id is not None else None
+        if sensor is None:
+            zone_id = event["zone_id"]
+            if zone_id is not None and system.config.get_safety_zone(zone_id) is None:
+                zone_id = None
+            sensor = controller.add_sensor(event["type"], event["location"], zone_id)
+            self._sensor_map[event["id"]] = sensor.sensor_id
+
+        if event["active"] and not sensor.is_active:
+            sensor.arm()
+        elif not event["active"] and sensor.is_active:
+            sensor.disarm()
+        state = event["state"]
+        if state is None or state == sensor._physical_state():
+            return
+        if sensor.sensor_type == "WINDOOR":
+            sensor.simulate_open() if state else sensor.simulate_close()
+        else:
+            sensor.simulate_motion() if state else sensor.simulate_clear()
+
+    @staticmethod
+    def _password_for(system, event: dict) -> str:
+        """Valid credentials for recorded successes, a wrong one otherwise"""
+        settings = system.config.settings
+        if event["interface"] == "WEB":
+            password = f"{settings.web_password_1}:{settings.web_password_2}"
+        elif event["user_id"] == "guest":
+            password = settings.guest_password or "0000"
+        else:
+            password = settings.master_password
+        return password if event["result"] == "success" else f"!{password}"
+
+
+def main(argv=None) -> int:
+    import argparse
+    import contextlib
+    import io
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Replay a SafeHome event stream")
+    parser.add_argument("stream", help="JSONL file written by EventRecorder")
+    parser.add_argument(
+        "--speed", default="max", help="virtual seconds per second, or 'max'"
+    )
+    parser.add_argument("--db", help="database file (default: temporary)")
+    parser.add_argument("--output", help="write the JSON stats to this file")
+    args = parser.parse_args(argv)
+    speed = None if args.speed == "max" else float(args.speed)
+    replayer = EventReplayer.load(args.stream, speed=speed)
+
+    os.environ.setdefault("SAFEHOME_HEADLESS", "1")
+    from safehome.core.system import System
+    from safehome.device.clock import ManualClock
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Alarm and monitoring messages would drown the stats
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = System(
+                db_path=args.db or os.path.join(tmp, "safehome.db"),
+                lazy=True,
+                clock=ManualClock(),
+            )
+            try:
+                stats = replayer.replay(system)
+            finally:
+                system.shutdown()
+    text = json.dumps(stats, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
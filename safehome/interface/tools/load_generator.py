@@ -0,0 +1,408 @@
+"""
+SafeHome Load Generator
+Headless large-home simulation: provisions zones, sensors and cameras
+through the public System APIs and drives random intrude/release traffic
+against the running system while sampling its resource use.
+
+Usage:
+    python -m safehome.interface.tools.load_generator --zones 20 \\
+        --sensors 2000 --cameras 16 --duration 60 [--output report.json]
+"""
+
+import heapq
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+def _set_tripped(sensor, tripped: bool):
+    """
+    Trip or release a sensor through its Sensor wrapper, so the change
+    bumps state_version, is published and reaches any recorder
+    """
+    if sensor.sensor_type == "WINDOOR":
+        sensor.simulate_open() if tripped else sensor.simulate_close()
+    else:
+        sensor.simulate_motion() if tripped else sensor.simulate_clear()
+
+
+@dataclass(frozen=True)
+class TrafficProfile:
+    """
+    Intrusion traffic of one sensor type
+    Each sensor trips as a Poisson process with `rate` intrusions per
+    second and stays tripped for an exponentially distributed time with
+    mean `mean_hold` seconds.
+    """
+
+    rate: float
+    mean_hold: float = 1.0
+
+
+DEFAULT_PROFILES = {
+    "WINDOOR": TrafficProfile(rate=0.002, mean_hold=5.0),
+    "MOTION": TrafficProfile(rate=0.01, mean_hold=1.0),
+}
+
+
+@dataclass
+class LoadSample:
+    """System state at one point of a load run"""
+
+    elapsed: float
+    intrusions: int  # intrude() calls issued so far
+    detections: int  # intrusions seen by poll_sensors so far
+    log_entries: int  # add_log calls so far
+    detections_per_second: float
+    logs_per_second: float
+    open_sensors: int
+    rss_mb: Optional[float]
+    threads: int
+
+    def to_dict(self) -> dict:
+        return {
+            "elapsed_s": round(self.elapsed, 3),
+            "intrusions": self.intrusions,
+            "detections": self.detections,
+            "log_entries": self.log_entries,
+            "detections_per_second": round(self.detections_per_second, 2),
+            "logs_per_second": round(self.logs_per_second, 2),
+            "open_sensors": self.open_sensors,
+            "rss_mb": None if self.rss_mb is None else round(self.rss_mb, 1),
+            "threads": self.threads,
+        }
+
+
+@dataclass
+class LoadReport:
+    """Outcome of LoadGenerator.run()"""
+
+    duration: float
+    zones: int
+    sensors: int
+    cameras: int
+    samples: List[LoadSample] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {}
+        first, last = self.samples[0], self.samples[-1]
+        elapsed = max(last.elapsed, 1e-9)
+        rss = [s.rss_mb for s in self.samples if s.rss_mb is not None]
+        return {
+            "intrusions": last.intrusions,
+            "detections": last.detections,
+            "log_entries": last.log_entries,
+            "detections_per_second": round(last.detections / elapsed, 2),
+            "logs_per_second": round(last.log_entries / elapsed, 2),
+            "rss_growth_mb": round(rss[-1] - rss[0], 1) if rss else None,
+            "peak_threads": max(s.threads for s in self.samples),
+            "thread_growth": last.threads - first.threads,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "duration_s": self.duration,
+            "zones": self.zones,
+            "sensors": self.sensors,
+            "cameras": self.cameras,
+            "summary": self.summary(),
+            "samples": [sample.to_dict() for sample in self.samples],
+        }
+
+
+def _rss_mb() -> Optional[float]:
+    """Current resident set size in MB (None where it cannot be read)"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+
+        # Peak, not current, outside Linux (kB on Linux, bytes on macOS)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return None
+
+
+class LoadGenerator:
+    """
+    Drives synthetic intrusion traffic against a System
+    Sensors of each type trip independently (see TrafficProfile); the
+    traffic thread keeps one pending arrival per type plus one release per
+    tripped sensor in a heap, so the cost does not grow with the number of
+    idle sensors.
+    """
+
+    def __init__(
+        self,
+        system,
+        profiles: Optional[Dict[str, TrafficProfile]] = None,
+        seed: Optional[int] = None,
+        sample_interval: float = 1.0,
+    ):
+        """
+        Initialize Load Generator
+
+        Args:
+            system: System to load (turned on by run() if needed)
+            profiles: Traffic per sensor type (default: DEFAULT_PROFILES)
+            seed: Random seed for reproducible traffic
+            sample_interval: Seconds between resource samples
+        """
+        self.system = system
+        self.profiles = dict(DEFAULT_PROFILES if profiles is None else profiles)
+        self.random = random.Random(seed)
+        self.sample_interval = sample_interval
+        self.zone_ids: List[int] = []
+        self.sensor_ids: List[int] = []
+        self.camera_ids: List[int] = []
+        self.intrusions = 0
+        self._open: set = set()
+        self._stop = threading.Event()
+
+    def provision(
+        self,
+        zones: int,
+        sensors: int,
+        cameras: int,
+        motion_ratio: float = 0.3,
+    ) -> dict:
+        """
+        Create zones, sensors and cameras spread evenly over the zones
+
+        Args:
+            zones: Safety zones to add
+            sensors: Sensors to add (motion_ratio of them MOTION, rest WINDOOR)
+            cameras: Cameras to add
+            motion_ratio: Share of motion sensors
+
+        Returns:
+            {"zones", "sensors", "cameras"} counts created
+        """
+        config = self.system.config
+        # One transaction instead of a journal sync per row
+        with config.db_manager.batch():
+            for n in range(zones):
+                zone = config.add_safety_zone(f"Load Zone {n + 1}")
+                if zone is not None:
+                    self.zone_ids.append(zone.zone_id)
+            motion_every = round(1 / motion_ratio) if motion_ratio > 0 else 0
+            for n in range(sensors):
+                kind = "MOTION" if motion_every and n % motion_every == 0 else "WINDOOR"
+                sensor = self.system.sensor_controller.add_sensor(
+                    kind, f"Load {kind.title()} {n + 1}", zone_id=self._zone_for(n)
+                )
+                self.sensor_ids.append(sensor.sensor_id)
+            for n in range(cameras):
+                camera = self.system.camera_controller.add_camera(
+                    f"Load Camera {n + 1}",
+                    f"Load Location {n + 1}",
+                    zone_id=self._zone_for(n),
+                )
+                self.camera_ids.append(camera.camera_id)
+        return {
+            "zones": len(self.zone_ids),
+            "sensors": len(self.sensor_ids),
+            "cameras": len(self.camera_ids),
+        }
+
+    def _zone_for(self, n: int) -> Optional[int]:
+        if not self.zone_ids:
+            return None
+        return self.zone_ids[n % len(self.zone_ids)]
+
+    def arm(self):
+        """Arm every provisioned zone (sensors without a zone directly)"""
+        for zone_id in self.zone_ids:
+            self.system.arm_zone(zone_id)
+        if not self.zone_ids:
+            self.system.sensor_controller.arm_sensors(self.sensor_ids)
+
+    def run(self, duration: float) -> LoadReport:
+        """
+        Generate traffic for `duration` seconds and sample the system
+
+        Returns:
+            LoadReport with one sample per sample_interval
+        """
+        if not self.system.is_running:
+            self.system.turn_on()
+        report = LoadReport(
+            duration=duration,
+            zones=len(self.zone_ids),
+            sensors=len(self.sensor_ids),
+            cameras=len(self.camera_ids),
+        )
+        self._stop.clear()
+        traffic = threading.Thread(
+            target=self._drive, args=(duration,), name="load-traffic", daemon=True
+        )
+        started = time.monotonic()
+        traffic.start()
+        previous = self._sample(0.0, None)
+        report.samples.append(previous)
+        while not self._stop.wait(self.sample_interval):
+            elapsed = time.monotonic() - started
+            previous = self._sample(elapsed, previous)
+            report.samples.append(previous)
+            if elapsed >= duration:
+                break
+        self._stop.set()
+        traffic.join(timeout=5)
+        self._release_all()
+        return report
+
+    def stop(self):
+        """End a run early"""
+        self._stop.set()
+
+    def _drive(self, duration: float):
+        """Traffic thread: fire arrivals and releases in time order"""
+        by_type: Dict[str, List] = {}
+        for sensor_id in self.sensor_ids:
+            sensor = self.system.sensor_controller.get_sensor(sensor_id)
+            if sensor is not None and sensor.sensor_type in self.profiles:
+                by_type.setdefault(sensor.sensor_type, []).append(sensor)
+
+        start = time.monotonic()
+        events: List[tuple] = []  # (time, seq, kind, payload)
+        seq = 0
+        for kind, sensors in by_type.items():
+            total_rate = self.profiles[kind].rate * len(sensors)
+            if total_rate > 0:
+                when = start + self.random.expovariate(total_rate)
+                heapq.heappush(events, (when, seq, "arrival", kind))
+                seq += 1
+
+        while events and not self._stop.is_set():
+            when, _, action, payload = heapq.heappop(events)
+            if when - start > duration:
+                break
+            if self._stop.wait(max(0.0, when - time.monotonic())):
+                break
+            if action == "release":
+                _set_tripped(payload, False)
+                self._open.discard(payload.sensor_id)
+                continue
+            profile = self.profiles[payload]
+            sensors = by_type[payload]
+            # Superposed Poisson arrivals: pick the sensor uniformly
+            sensor = sensors[self.random.randrange(len(sensors))]
+            if sensor.sensor_id not in self._open:
+                _set_tripped(sensor, True)
+                self._open.add(sensor.sensor_id)
+                self.intrusions += 1
+                hold = self.random.expovariate(1 / max(profile.mean_hold, 1e-6))
+                heapq.heappush(events, (when + hold, seq, "release", sensor))
+                seq += 1
+            next_arrival = when + self.random.expovariate(profile.rate * len(sensors))
+            heapq.heappush(events, (next_arrival, seq, "arrival", payload))
+            seq += 1
+
+    def _release_all(self):
+        for sensor_id in list(self._open):
+            sensor = self.system.sensor_controller.get_sensor(sensor_id)
+            if sensor is not None:
+                _set_tripped(sensor, False)
+        self._open.clear()
+
+    def _sample(self, elapsed: float, previous: Optional[LoadSample]) -> LoadSample:
+        detections, log_entries = self._counters()
+        if previous is None or elapsed <= previous.elapsed:
+            detection_rate = log_rate = 0.0
+        else:
+            window = elapsed - previous.elapsed
+            detection_rate = (detections - previous.detections) / window
+            log_rate = (log_entries - previous.log_entries) / window
+        return LoadSample(
+            elapsed=elapsed,
+            intrusions=self.intrusions,
+            detections=detections,
+            log_entries=log_entries,
+            detections_per_second=detection_rate,
+            logs_per_second=log_rate,
+            open_sensors=len(self._open),
+            rss_mb=_rss_mb(),
+            threads=threading.active_count(),
+        )
+
+    def _counters(self):
+        """(detections, log entries) from the system's metrics registry"""
+        metrics = self.system.get_metrics()
+        detections = int(metrics.get("safehome_poll_detections_total", 0))
+        log_entries = int(
+            sum(
+                value
+                for name, value in metrics.items()
+                if name.startswith("safehome_log_entries_total")
+            )
+        )
+        return detections, log_entries
+
+
+def main(argv=None) -> int:
+    import argparse
+    import contextlib
+    import io
+    import json
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="SafeHome large-home load generator")
+    parser.add_argument("--zones", type=int, default=10)
+    parser.add_argument("--sensors", type=int, default=1000)
+    parser.add_argument("--cameras", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--windoor-rate", type=float, default=0.002, help="per s")
+    parser.add_argument("--motion-rate", type=float, default=0.01, help="per s")
+    parser.add_argument("--entry-delay", type=float, help="override (seconds)")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--db", help="database file (default: temporary)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SAFEHOME_HEADLESS", "1")
+    from safehome.core.system import System
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Alarm and monitoring messages would drown the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = System(
+                db_path=args.db or os.path.join(tmp, "safehome.db"), lazy=True
+            )
+            if args.entry_delay is not None:
+                system.config.settings.entry_delay = args.entry_delay
+            system.poll_interval = args.poll_interval
+            generator = LoadGenerator(
+                system,
+                profiles={
+                    "WINDOOR": TrafficProfile(args.windoor_rate, 5.0),
+                    "MOTION": TrafficProfile(args.motion_rate, 1.0),
+                },
+                seed=args.seed,
+                sample_interval=args.sample_interval,
+            )
+            try:
+                generator.provision(args.zones, args.sensors, args.cameras)
+                generator.arm()
+                report = generator.run(args.duration)
+            finally:
+                system.shutdown()
+    text = json.dumps(report.to_dict(), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,8 @@ from PIL import Image, ImageTk
 from safehome.device.sensor.motion_sensor import MotionSensor
 from safehome.device.sensor.windoor_sensor import WindowDoorSensor
 
+from ..table_model import ReconcilingTable
+
 
 class SafeHomeSensorTest(tk.Toplevel):
     """
@@ -265,37 +267,11 @@ class SafeHomeSensorTest(tk.Toplevel):
     def _update_status(self):
         """Periodically update the sensor status tree from the live system controller."""
         try:
-            # Clear existing items
-            for item in self.sensor_tree.get_children():
-                self.sensor_tree.delete(item)
-
-            # Get live sensors from the controller
-            all_sensors = self.system.sensor_controller.get_all_sensors()
-
-            for sensor in sorted(all_sensors, key=lambda s: s.sensor_id):
-                sensor_type = sensor.sensor_type
-                armed_state = "🟢 Armed" if sensor.is_active else "🔴 Disarmed"
-
-                if isinstance(sensor, WindowDoorSensor):
-                    physical_state = "🚪 Open" if sensor.is_open() else "🚪 Closed"
-                elif isinstance(sensor, MotionSensor):
-                    physical_state = (
-                        "👁️ Detected" if sensor.is_motion_detected() else "⚪ Clear"
-                    )
-                else:
-                    physical_state = "N/A"
-
-                self.sensor_tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        sensor.sensor_id,
-                        sensor_type,
-                        sensor.location,
-                        armed_state,
-                        physical_state,
-                    ),
-                )
+            self.sensor_table = ReconcilingTable.for_sensors(
+                self.sensor_tree, self._sensor_row, getattr(self, "sensor_table", None)
+            )
+            # Only rows whose values changed are rewritten
+            self.sensor_table.sync_sensors(self.system.sensor_controller)
         except Exception as e:
             # Handle case where window is closed while loop is running
             if not self.winfo_exists():
@@ -304,6 +280,28 @@ class SafeHomeSensorTest(tk.Toplevel):
 
         self.after(500, self._update_status)
 
+    @staticmethod
+    def _sensor_row(sensor) -> tuple:
+        """Tree values for one sensor"""
+        armed_state = "🟢 Armed" if sensor.is_active else "🔴 Disarmed"
+
+        if isinstance(sensor, WindowDoorSensor):
+            physical_state = "🚪 Open" if sensor.is_open() else "🚪 Closed"
+        elif isinstance(sensor, MotionSensor):
+            physical_state = (
+                "👁️ Detected" if sensor.is_motion_detected() else "⚪ Clear"
+            )
+        else:
+            physical_state = "N/A"
+
+        return (
+            sensor.sensor_id,
+            sensor.sensor_type,
+            sensor.location,
+            armed_state,
+            physical_state,
+        )
+
     def _get_sensor_from_id_input(self):
         """Helper to get a sensor object from the ID text input."""
         id_str = self.id_var.get().strip()
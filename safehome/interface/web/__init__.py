@@ -0,0 +1,10 @@
+"""
+SafeHome Web Interface
+Headless HTTP/JSON API for the SafeHome core system
+"""
+
+from .api import create_app
+from .response_cache import ResponseCache
+from .server import make_api_server, serve
+
+__all__ = ["create_app", "make_api_server", "serve", "ResponseCache"]
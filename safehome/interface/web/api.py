@@ -0,0 +1,313 @@
+"""
+SafeHome Web API
+HTTP/JSON front end exposing the core System for headless deployments
+"""
+
+import json
+import threading
+
+from flask import Flask, Response, request
+from werkzeug.exceptions import HTTPException
+
+from ...configuration.safehome_mode import SafeHomeMode
+from .response_cache import ResponseCache
+
+ARMABLE_MODES = ("HOME", "AWAY", "OVERNIGHT", "EXTENDED")
+MAX_LOGS_PER_PAGE = 500
+MJPEG_BOUNDARY = "frame"
+# Endpoints served without WEB credentials (login/logout themselves)
+PUBLIC_ENDPOINTS = ("create_session", "delete_session")
+
+
+def format_sse(event) -> str:
+    """Encode an Event as a Server-Sent Events message"""
+    data = json.dumps(event.data, default=str)
+    return f"id: {event.seq}\nevent: {event.topic}\ndata: {data}\n\n"
+
+
+def format_mjpeg_part(frame: bytes) -> bytes:
+    """Wrap one JPEG frame as a multipart/x-mixed-replace part"""
+    header = (
+        f"--{MJPEG_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+        f"Content-Length: {len(frame)}\r\n\r\n"
+    )
+    return header.encode() + frame + b"\r\n"
+
+
+def create_app(
+    system,
+    cache_ttl: float = 0.5,
+    sse_heartbeat: float = 15.0,
+    stream_timeout: float = 5.0,
+) -> Flask:
+    """
+    Build the Flask application for a running System
+
+    Read endpoints are served from a short-lived ResponseCache; any
+    state-changing request or published system event clears it. Every
+    endpoint except /api/session requires the WEB interface credentials via
+    HTTP Basic auth (password "pass1:pass2") or a Bearer token from
+    POST /api/session. Valid Basic credentials are checked without
+    spending login rate-limit tokens or writing login audit rows; wrong
+    ones count as failed logins. /api/events streams
+    system events as SSE and /api/cameras/<id>/stream serves each camera as
+    MJPEG.
+
+    Args:
+        system: Core System instance to expose
+        cache_ttl: Seconds a read response may be reused (0 disables caching)
+        sse_heartbeat: Seconds between keep-alive comments on idle streams
+        stream_timeout: Seconds without a new camera frame before an MJPEG
+            stream is ended
+
+    Returns:
+        Configured Flask application
+    """
+    app = Flask(__name__)
+    app.config["SAFEHOME_SYSTEM"] = system
+    cache = ResponseCache(ttl=cache_ttl)
+    app.config["SAFEHOME_CACHE"] = cache
+    # Serializes access to System from the threaded server
+    state_lock = threading.RLock()
+
+    # Any state change published by the system makes cached reads stale
+    event_bus = getattr(system, "event_bus", None)
+    if event_bus is not None:
+        event_bus.subscribe(callback=lambda event: cache.clear())
+
+    def json_response(payload, status: int = 200) -> Response:
+        return app.response_class(
+            json.dumps(payload), status=status, mimetype="application/json"
+        )
+
+    def cached_json(compute) -> Response:
+        """Serve a read endpoint from cache, keyed by path and query string"""
+        key = (request.path, request.query_string)
+
+        def render():
+            with state_lock:
+                return json.dumps(compute())
+
+        body = cache.get_or_compute(key, render)
+        return app.response_class(body, mimetype="application/json")
+
+    def bearer_token():
+        header = request.headers.get("Authorization", "")
+        scheme, _, token = header.partition(" ")
+        return token.strip() if scheme.lower() == "bearer" else None
+
+    def require_web_login():
+        """Return an error response unless valid WEB credentials were sent"""
+        token = bearer_token()
+        if token is not None:
+            if system.validate_session(token, "WEB") is not None:
+                return None
+            response = json_response({"error": "invalid or expired session"}, 401)
+            response.headers["WWW-Authenticate"] = 'Bearer realm="SafeHome"'
+            return response
+        auth = request.authorization
+        if auth and auth.username is not None and auth.password is not None:
+            with state_lock:
+                if system.check_credentials(auth.username, auth.password, "WEB"):
+                    return None
+        response = json_response({"error": "authentication required"}, status=401)
+        response.headers["WWW-Authenticate"] = 'Basic realm="SafeHome"'
+        return response
+
+    @app.before_request
+    def authenticate():
+        # Unknown routes (no endpoint) fall through to the 404 handler
+        if request.endpoint is None or request.endpoint in PUBLIC_ENDPOINTS:
+            return None
+        return require_web_login()
+
+    @app.errorhandler(HTTPException)
+    def handle_http_error(error):
+        return json_response({"error": error.description}, status=error.code)
+
+    # ===== Read endpoints =====
+
+    @app.get("/api/status")
+    def get_status():
+        return cached_json(system.get_system_status)
+
+    @app.get("/api/zones")
+    def get_zones():
+        return cached_json(
+            lambda: [zone.to_dict() for zone in system.config.get_all_zones()]
+        )
+
+    @app.get("/api/sensors")
+    def get_sensors():
+        return cached_json(system.sensor_controller.get_all_sensor_statuses)
+
+    @app.get("/api/sensors/<int:sensor_id>")
+    def get_sensor(sensor_id: int):
+        if system.sensor_controller.get_sensor(sensor_id) is None:
+            return json_response({"error": f"sensor {sensor_id} not found"}, 404)
+        return cached_json(
+            lambda: system.sensor_controller.get_sensor_status(sensor_id)
+        )
+
+    @app.get("/api/cameras")
+    def get_cameras():
+        return cached_json(system.camera_controller.get_all_camera_statuses)
+
+    @app.get("/api/cameras/<int:camera_id>/stream")
+    def stream_camera(camera_id: int):
+        # Header only: query strings end up in access logs and browser history
+        password = request.headers.get("X-Camera-Password")
+        with state_lock:
+            if system.camera_controller.get_camera(camera_id) is None:
+                return json_response({"error": f"camera {camera_id} not found"}, 404)
+            viewer = system.camera_controller.open_stream(camera_id, password)
+        if viewer is None:
+            return json_response({"error": "camera access denied"}, 403)
+
+        def generate():
+            try:
+                while True:
+                    frame = viewer.next_frame(timeout=stream_timeout)
+                    if frame is None:
+                        break
+                    yield format_mjpeg_part(frame)
+            finally:
+                viewer.close()
+
+        return app.response_class(
+            generate(),
+            mimetype=f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/api/logs")
+    def get_logs():
+        page = request.args.get("page", 1, type=int)
+        per_page = request.args.get("per_page", 50, type=int)
+        if page < 1 or per_page < 1:
+            return json_response({"error": "page and per_page must be >= 1"}, 400)
+        per_page = min(per_page, MAX_LOGS_PER_PAGE)
+        event_type = request.args.get("event_type") or None
+
+        def load_page():
+            # Fetch one extra row to learn whether another page exists
+            rows = system.config.storage.get_logs(
+                limit=per_page + 1,
+                offset=(page - 1) * per_page,
+                event_type=event_type,
+            )
+            return {
+                "page": page,
+                "per_page": per_page,
+                "has_more": len(rows) > per_page,
+                "logs": rows[:per_page],
+            }
+
+        return cached_json(load_page)
+
+    @app.get("/metrics")
+    def get_metrics():
+        metrics = getattr(system, "metrics", None)
+        body = metrics.to_prometheus() if metrics is not None else ""
+        return app.response_class(
+            body, mimetype="text/plain", content_type="text/plain; version=0.0.4"
+        )
+
+    @app.get("/api/events")
+    def stream_events():
+        if event_bus is None:
+            return json_response({"error": "event stream unavailable"}, 404)
+        topics = request.args.get("topics")
+        topics = {t.strip() for t in topics.split(",") if t.strip()} if topics else None
+        last_id = request.headers.get("Last-Event-ID") or request.args.get(
+            "last_event_id"
+        )
+        replay_after = int(last_id) if last_id and last_id.isdigit() else None
+        subscription = event_bus.subscribe(topics=topics, replay_after=replay_after)
+
+        def generate():
+            try:
+                yield "retry: 2000\n\n"
+                while not subscription.closed:
+                    event = subscription.get(timeout=sse_heartbeat)
+                    if event is None:
+                        # Keep-alive also detects disconnected clients
+                        yield ": keepalive\n\n"
+                        continue
+                    yield format_sse(event)
+            finally:
+                subscription.close()
+
+        return app.response_class(
+            generate(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    # ===== Sessions =====
+
+    @app.post("/api/session")
+    def create_session():
+        auth = request.authorization
+        token = None
+        if auth and auth.username is not None and auth.password is not None:
+            with state_lock:
+                token = system.create_session(auth.username, auth.password, "WEB")
+        if token is None:
+            response = json_response({"error": "authentication required"}, 401)
+            response.headers["WWW-Authenticate"] = 'Basic realm="SafeHome"'
+            return response
+        ttl = system.config.login_manager.sessions.ttl
+        return json_response({"token": token, "expires_in": ttl}, status=201)
+
+    @app.delete("/api/session")
+    def delete_session():
+        token = bearer_token()
+        if not token or not system.logout(token):
+            return json_response({"error": "invalid or expired session"}, 401)
+        return app.response_class(status=204)
+
+    # ===== Control endpoints =====
+
+    @app.post("/api/arm")
+    def arm():
+        body = request.get_json(silent=True) or {}
+        mode_name = str(body.get("mode", "")).upper()
+        if mode_name not in ARMABLE_MODES:
+            return json_response(
+                {"error": f"mode must be one of {', '.join(ARMABLE_MODES)}"}, 400
+            )
+        with state_lock:
+            armed = system.arm_system(SafeHomeMode[mode_name])
+            cache.clear()
+            status = system.get_system_status()
+        if not armed:
+            return json_response(
+                {"error": "cannot arm: windows/doors are open", "status": status}, 409
+            )
+        return json_response(status)
+
+    @app.post("/api/disarm")
+    def disarm():
+        with state_lock:
+            system.disarm_system()
+            cache.clear()
+            status = system.get_system_status()
+        return json_response(status)
+
+    @app.post("/api/zones/<int:zone_id>/<action>")
+    def change_zone(zone_id: int, action: str):
+        if action not in ("arm", "disarm"):
+            return json_response({"error": f"unknown zone action '{action}'"}, 404)
+        with state_lock:
+            if system.config.get_safety_zone(zone_id) is None:
+                return json_response({"error": f"zone {zone_id} not found"}, 404)
+            if action == "arm":
+                system.arm_zone(zone_id)
+            else:
+                system.disarm_zone(zone_id)
+            cache.clear()
+            zone = system.config.get_safety_zone(zone_id)
+        return json_response(zone.to_dict())
+
+    return app
@@ -0,0 +1,83 @@
+"""
+SafeHome headless service
+Runs the core System behind the HTTP/JSON API on a threaded WSGI server
+"""
+
+from typing import Optional
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler, make_server
+
+from .api import create_app
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8350
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler that skips per-request access logging"""
+
+    def log_request(self, code="-", size="-"):
+        pass
+
+
+def make_api_server(
+    system,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    cache_ttl: float = 0.5,
+    quiet: bool = False,
+) -> BaseWSGIServer:
+    """
+    Create (but do not start) a threaded WSGI server for the API
+
+    Args:
+        system: Core System instance to expose
+        host: Interface to bind (defaults to localhost only)
+        port: TCP port (0 picks a free port)
+        cache_ttl: Read-response cache lifetime in seconds
+        quiet: Disable per-request access logging
+
+    Returns:
+        Server; call serve_forever() / shutdown()
+    """
+    app = create_app(system, cache_ttl=cache_ttl)
+    handler = QuietRequestHandler if quiet else None
+    return make_server(host, port, app, threaded=True, request_handler=handler)
+
+
+def serve(
+    db_path: str = "data/safehome.db",
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    cache_ttl: float = 0.5,
+    system=None,
+):
+    """
+    Run SafeHome headless until interrupted
+
+    Args:
+        db_path: Path to SQLite database (ignored if system is given)
+        host: Interface to bind
+        port: TCP port
+        cache_ttl: Read-response cache lifetime in seconds
+        system: Optional pre-built System
+    """
+    from ...core.system import System
+
+    owns_system = system is None
+    if owns_system:
+        system = System(db_path=db_path, lazy=True)
+        system.turn_on()
+
+    server: Optional[BaseWSGIServer] = None
+    try:
+        server = make_api_server(system, host=host, port=port, cache_ttl=cache_ttl)
+        print(f"[Web] SafeHome API listening on http://{host}:{server.server_port}")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[Web] Shutting down...")
+    finally:
+        if server is not None:
+            server.server_close()
+        if owns_system:
+            system.shutdown()
@@ -5,7 +5,17 @@ Pytest configuration to ensure project root is on sys.path for imports like `imp
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 ROOT_STR = str(ROOT_DIR)
 if ROOT_STR not in sys.path:
     sys.path.insert(0, ROOT_STR)
+
+
+@pytest.fixture(autouse=True)
+def isolated_event_log(tmp_path, monkeypatch):
+    """Write LogManager's event log file into the test's tmp dir, not data/"""
+    from safehome.configuration.log_manager import LogManager
+
+    monkeypatch.setattr(LogManager, "LOG_FILE", str(tmp_path / "safehome_events.log"))
@@ -33,6 +33,7 @@ def test_it_guest_login_and_session_record(system):
     cm = system.config
     cm.settings.guest_password = "0000"
     assert system.login("guest", "0000", "CONTROL_PANEL")
+    cm.login_manager.flush_audit()
     row = fetch_one(
         cm.db_manager.connection,
         "SELECT username, login_successful FROM login_sessions ORDER BY session_id DESC LIMIT 1",
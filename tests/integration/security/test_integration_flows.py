@@ -35,6 +35,7 @@ def test_it_login_process_records_session(system):
     """IT-Login-Sys (SDS seq p47): System.login logs successful session in DB."""
     cm = system.config
     assert system.login("admin", cm.settings.master_password, "CONTROL_PANEL")
+    cm.login_manager.flush_audit()
     rows = fetch_rows(
         cm.db_manager.connection,
         "SELECT interface_type, username, login_successful FROM login_sessions",
@@ -50,6 +51,7 @@ def test_it_login_lockout_and_persistence(system):
     assert not system.login("admin", "bad", "CONTROL_PANEL")
     assert not system.login("admin", "bad", "CONTROL_PANEL")
     assert cm.login_manager.is_locked.get("CONTROL_PANEL", False)
+    cm.login_manager.flush_audit()
     rows = fetch_rows(
         cm.db_manager.connection,
         "SELECT failed_attempts, login_successful FROM login_sessions ORDER BY session_id DESC LIMIT 1",
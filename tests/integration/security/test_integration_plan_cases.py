@@ -33,6 +33,7 @@ def test_it_login_web(system):
     assert system.login(
         "user", f"{cm.settings.web_password_1}:{cm.settings.web_password_2}", "WEB"
     )
+    cm.login_manager.flush_audit()
     row = fetch_one(
         cm.db_manager.connection,
         "SELECT interface_type, login_successful FROM login_sessions ORDER BY session_id DESC LIMIT 1",
@@ -773,6 +773,31 @@ def test_dashboard_password_cam_guest_view(monkeypatch, system):
     assert lbl.config_calls[-1]["text"] == "Password Protected"
 
 
+def test_dashboard_denied_camera_password_counts_once(monkeypatch, system):
+    import time
+
+    from safehome.interface.dashboard.camera_renderer import CameraRenderWorker
+
+    cam = system.camera_controller.add_camera("Cbad", "Loc", password="pw")
+    dash = _mk_dash(monkeypatch, system)
+    dash.camera_password_cache = {cam.camera_id: "wrong"}
+    dash.camera_password_prompted = {cam.camera_id}
+    dash.camera_renderer = CameraRenderWorker(system.camera_controller)
+    lbl = _DummyLabel()
+    dash.camera_labels = {cam.camera_id: lbl}
+    try:
+        for _ in range(3):
+            dash._update_cameras()
+            deadline = time.time() + 2
+            while dash.camera_renderer.get_pending() and time.time() < deadline:
+                time.sleep(0.005)
+    finally:
+        dash.camera_renderer.shutdown()
+    assert cam.failed_attempts == 1
+    assert cam.camera_id not in dash.camera_password_cache
+    assert lbl.config_calls[-1]["text"] == "Password Required"
+
+
 def test_dashboard_toggle_camera_cancel_pwd(monkeypatch, system):
     calls = _stub_messagebox(monkeypatch)
     cam = system.camera_controller.add_camera("Ctoggle", "Loc", password="pw")
@@ -0,0 +1,289 @@
+import base64
+import threading
+import urllib.request
+
+import pytest
+
+from safehome.configuration.safehome_mode import SafeHomeMode
+from safehome.configuration.storage_manager import StorageManager
+from safehome.core.system import System
+from safehome.interface.web import ResponseCache, create_app, make_api_server
+
+WEB_AUTH = {
+    "Authorization": "Basic " + base64.b64encode(b"admin:webpass1:webpass2").decode()
+}
+
+
+@pytest.fixture(autouse=True)
+def headless_env(monkeypatch):
+    monkeypatch.setenv("SAFEHOME_HEADLESS", "1")
+
+
+@pytest.fixture
+def system(tmp_path, monkeypatch):
+    monkeypatch.setattr(StorageManager, "CONFIG_FILE", str(tmp_path / "config.json"))
+    sys = System(db_path=str(tmp_path / "safehome.db"), lazy=True)
+    zone_id = sys.config.get_all_zones()[0].zone_id
+    sys.sensor_controller.add_sensor("WINDOOR", "Front Door", zone_id=zone_id)
+    sys.sensor_controller.add_sensor("MOTION", "Hall", zone_id=zone_id)
+    sys.config.storage.save_mode_sensor_mapping("AWAY", [1, 2])
+    yield sys
+    sys.shutdown()
+
+
+@pytest.fixture
+def client(system):
+    return create_app(system, cache_ttl=60).test_client()
+
+
+@pytest.fixture
+def auth(system):
+    """Bearer header for a WEB session (reads without re-checking passwords)"""
+    token = system.create_session("admin", "webpass1:webpass2", "WEB")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_it_web_read_endpoints(client, system, auth):
+    """IT-Web-Read: status, sensors, zones and cameras are served as JSON."""
+    status = client.get("/api/status", headers=auth).get_json()
+    assert status["current_mode"] == "DISARMED"
+    assert status["num_sensors"] == 2
+
+    sensors = client.get("/api/sensors", headers=auth).get_json()
+    assert [s["location"] for s in sensors] == ["Front Door", "Hall"]
+    assert client.get("/api/sensors/1", headers=auth).get_json()["type"] == "WINDOOR"
+    assert client.get("/api/sensors/99", headers=auth).status_code == 404
+
+    zones = client.get("/api/zones", headers=auth).get_json()
+    assert {z["name"] for z in zones} == {"Living Room", "Bedroom"}
+    assert client.get("/api/cameras", headers=auth).get_json() == []
+
+
+def test_it_web_control_requires_web_credentials(client):
+    """IT-Web-Auth: control endpoints reject missing or wrong credentials."""
+    assert client.post("/api/disarm").status_code == 401
+    bad = {"Authorization": "Basic " + base64.b64encode(b"admin:x:y").decode()}
+    assert client.post("/api/disarm", headers=bad).status_code == 401
+    assert client.post("/api/disarm", headers=WEB_AUTH).status_code == 200
+
+
+def test_it_web_reads_require_web_credentials(client, auth):
+    """IT-Web-Auth-Read: reads, logs, metrics and events reject anonymous clients."""
+    for path in (
+        "/api/status",
+        "/api/zones",
+        "/api/sensors",
+        "/api/cameras",
+        "/api/logs",
+        "/metrics",
+        "/api/events",
+    ):
+        assert client.get(path).status_code == 401, path
+    assert client.get("/api/status", headers=WEB_AUTH).status_code == 200
+    assert client.get("/api/logs", headers=auth).status_code == 200
+
+
+def test_it_web_basic_auth_polling_not_throttled(client, system):
+    """IT-Web-Auth-Poll: valid Basic auth is not rate limited or audited per request."""
+    login = system.config.login_manager
+    for _ in range(login.USER_BURST * 2):
+        assert client.get("/api/status", headers=WEB_AUTH).status_code == 200
+    login.flush_audit(timeout=5)
+    rows = system.config.db_manager.execute_query(
+        "SELECT COUNT(*) FROM login_sessions", fetch_one=True
+    )
+    assert rows[0] == 0
+    # Wrong credentials still count as failed logins
+    bad = {"Authorization": "Basic " + base64.b64encode(b"admin:x:y").decode()}
+    assert client.get("/api/status", headers=bad).status_code == 401
+    assert login.get_failed_attempts("WEB") == 1
+
+
+def test_it_web_session_token(client, system):
+    """IT-Web-Session: a session token replaces credentials until logout."""
+    assert client.post("/api/session").status_code == 401
+    response = client.post("/api/session", headers=WEB_AUTH)
+    assert response.status_code == 201
+    token = response.get_json()["token"]
+    bearer = {"Authorization": f"Bearer {token}"}
+
+    assert client.post("/api/disarm", headers=bearer).status_code == 200
+    assert client.delete("/api/session", headers=bearer).status_code == 204
+    assert client.post("/api/disarm", headers=bearer).status_code == 401
+
+    row = system.config.db_manager.execute_query(
+        "SELECT logout_timestamp FROM login_sessions WHERE login_successful = 1 "
+        "AND logout_timestamp IS NOT NULL",
+        fetch_one=True,
+    )
+    assert row is not None
+
+
+def test_it_web_arm_disarm_invalidates_cache(client, system, auth):
+    """IT-Web-Arm: arming changes state and clears cached reads."""
+    assert (
+        client.get("/api/status", headers=auth).get_json()["current_mode"] == "DISARMED"
+    )
+
+    response = client.post("/api/arm", json={"mode": "away"}, headers=WEB_AUTH)
+    assert response.status_code == 200
+    assert response.get_json()["current_mode"] == "AWAY"
+    assert client.get("/api/status", headers=auth).get_json()["current_mode"] == "AWAY"
+
+    assert client.post("/api/disarm", headers=WEB_AUTH).status_code == 200
+    assert (
+        client.get("/api/status", headers=auth).get_json()["current_mode"] == "DISARMED"
+    )
+
+    bad_mode = client.post("/api/arm", json={"mode": "PANIC"}, headers=WEB_AUTH)
+    assert bad_mode.status_code == 400
+
+
+def test_it_web_arm_refused_with_open_door(client, system):
+    """IT-Web-Arm-Open: arming with an open door returns 409."""
+    system.sensor_controller.get_sensor(1).simulate_open()
+    response = client.post("/api/arm", json={"mode": "AWAY"}, headers=WEB_AUTH)
+    assert response.status_code == 409
+
+
+def test_it_web_zone_arm_persists(client, system):
+    """IT-Web-Zone: zone arm/disarm persists and unknown zones return 404."""
+    response = client.post("/api/zones/1/arm", headers=WEB_AUTH)
+    assert response.status_code == 200
+    assert response.get_json()["is_armed"] is True
+    assert system.config.get_safety_zone(1).is_armed
+    assert system.sensor_controller.get_sensor(1).is_active
+
+    assert client.post("/api/zones/1/disarm", headers=WEB_AUTH).status_code == 200
+    assert not system.config.get_safety_zone(1).is_armed
+    assert client.post("/api/zones/42/arm", headers=WEB_AUTH).status_code == 404
+
+
+def test_it_web_logs_paging(client, system, auth):
+    """IT-Web-Logs: logs are paged newest first with a has_more flag."""
+    for n in range(5):
+        system.config.logger.add_log(f"paging {n}", level="ALARM", source="IT")
+
+    first = client.get("/api/logs?event_type=ALARM&per_page=2", headers=auth).get_json()
+    assert [log["event_message"] for log in first["logs"]] == ["paging 4", "paging 3"]
+    assert first["has_more"] is True
+    last = client.get(
+        "/api/logs?event_type=ALARM&per_page=2&page=3", headers=auth
+    ).get_json()
+    assert [log["event_message"] for log in last["logs"]] == ["paging 0"]
+    assert last["has_more"] is False
+    assert client.get("/api/logs?page=0", headers=auth).status_code == 400
+
+
+def test_it_web_response_cache_ttl():
+    """IT-Web-Cache: entries expire after ttl and evict when full."""
+    now = [0.0]
+    cache = ResponseCache(ttl=1.0, max_entries=2, clock=lambda: now[0])
+    calls = []
+    assert cache.get_or_compute("a", lambda: calls.append(1) or "A") == "A"
+    assert cache.get_or_compute("a", lambda: calls.append(1) or "A") == "A"
+    assert len(calls) == 1
+    now[0] = 2.0
+    assert cache.get("a") is None
+    cache.put("b", 1)
+    cache.put("c", 2)
+    cache.put("d", 3)
+    assert cache.get_stats()["size"] == 2
+
+
+def test_it_web_event_stream(system, auth):
+    """IT-Web-SSE: state changes stream as SSE and invalidate cached reads."""
+    client = create_app(system, cache_ttl=60, sse_heartbeat=0.05).test_client()
+    assert (
+        client.get("/api/status", headers=auth).get_json()["current_mode"] == "DISARMED"
+    )
+
+    response = client.get(
+        "/api/events?topics=mode,sensor", headers=auth, buffered=False
+    )
+    assert response.mimetype == "text/event-stream"
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b"retry:")
+
+    system.config.set_mode(SafeHomeMode.AWAY)
+    message = next(chunks).decode()
+    assert "event: mode" in message
+    assert '"mode": "AWAY"' in message
+    assert next(chunks) == b": keepalive\n\n"
+    assert client.get("/api/status", headers=auth).get_json()["current_mode"] == "AWAY"
+
+    seq = int(message.split("\n")[0][len("id: ") :])
+    response.close()
+    replay = client.get(
+        "/api/events",
+        headers={**auth, "Last-Event-ID": str(seq - 1)},
+        buffered=False,
+    )
+    replayed = iter(replay.response)
+    next(replayed)
+    assert f"id: {seq}" in next(replayed).decode()
+    replay.close()
+
+
+def test_it_web_camera_mjpeg_stream(client, system, auth):
+    """IT-Web-MJPEG: camera streams are multipart JPEG and password-checked."""
+    system.camera_controller.add_camera("Porch", "Front")
+    system.camera_controller.add_camera("Safe", "Vault", password="pw")
+    assert client.get("/api/cameras/9/stream", headers=auth).status_code == 404
+    assert client.get("/api/cameras/2/stream", headers=auth).status_code == 403
+
+    response = client.get("/api/cameras/1/stream", headers=auth, buffered=False)
+    assert response.mimetype == "multipart/x-mixed-replace"
+    part = next(iter(response.response))
+    assert part.startswith(b"--frame\r\nContent-Type: image/jpeg")
+    assert b"\xff\xd8" in part
+    response.close()
+
+    protected = client.get(
+        "/api/cameras/2/stream",
+        headers={**auth, "X-Camera-Password": "pw"},
+        buffered=False,
+    )
+    assert protected.status_code == 200
+    protected.close()
+    # Passwords in the query string would leak into logs and history
+    query = client.get("/api/cameras/2/stream?password=pw", headers=auth)
+    assert query.status_code == 403
+
+
+def test_it_web_threaded_server(system, auth):
+    """IT-Web-Server: threaded WSGI server answers concurrent requests."""
+    server = make_api_server(system, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/api/status"
+    results = []
+
+    def fetch():
+        req = urllib.request.Request(url, headers=auth)
+        with urllib.request.urlopen(req, timeout=5) as response:
+            results.append(response.status)
+
+    try:
+        clients = [threading.Thread(target=fetch) for _ in range(8)]
+        for t in clients:
+            t.start()
+        for t in clients:
+            t.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert results == [200] * 8
+
+
+def test_it_web_prometheus_metrics(client, system, auth):
+    """IT-Web-Metrics: /metrics serves the registry in Prometheus text format."""
+    client.get("/api/status", headers=auth)
+    system.sensor_controller.poll_sensors()
+    response = client.get("/metrics", headers=auth)
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    body = response.get_data(as_text=True)
+    assert "# TYPE safehome_db_query_seconds histogram" in body
+    assert "safehome_poll_duration_seconds_count 1" in body
+    assert "safehome_sensors 2" in body
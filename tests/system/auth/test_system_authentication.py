@@ -58,7 +58,7 @@ def test_st_password_change_alert(system, monkeypatch):
         return True
 
     monkeypatch.setattr(
-        system.config, "send_email_alert", lambda *args, **kwargs: fake_alert()
+        system.config, "queue_email_alert", lambda *args, **kwargs: fake_alert()
     )
     assert system.change_password("1234", "4321", interface_type="CONTROL_PANEL")
     assert called.get("sent")
@@ -74,6 +74,7 @@ def test_st_session_logging(system):
     # one success, one failure
     system.login("admin", system.config.settings.master_password, "CONTROL_PANEL")
     system.login("admin", "bad", "CONTROL_PANEL")
+    system.config.login_manager.flush_audit()
 
     rows = system.config.db_manager.execute_query(
         "SELECT username, login_successful FROM login_sessions", fetch_all=True
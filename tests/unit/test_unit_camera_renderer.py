@@ -0,0 +1,83 @@
+import time
+
+from PIL import Image
+
+from safehome.interface.dashboard.camera_renderer import CameraRenderWorker
+
+
+class FakeController:
+    """Camera controller stub whose frames only change when told to."""
+
+    def __init__(self):
+        self.color = "blue"
+        self.calls = 0
+
+    def get_camera_view(self, camera_id, password=None):
+        self.calls += 1
+        if password == "bad":
+            return None
+        return Image.new("RGB", (50, 50), self.color)
+
+
+def _wait_idle(worker, timeout=2.0):
+    deadline = time.time() + timeout
+    while worker.get_pending() and time.time() < deadline:
+        time.sleep(0.005)
+
+
+def test_render_worker_versions_only_change_with_content():
+    """UT-Cam-Render: unchanged frames keep their version so Tk skips them."""
+    controller = FakeController()
+    worker = CameraRenderWorker(controller, size=(40, 30))
+    try:
+        assert worker.take_frame(1) is None
+        worker.request(1)
+        _wait_idle(worker)
+        frame = worker.take_frame(1)
+        assert frame.version == 1 and frame.image.size == (40, 30)
+
+        worker.request(1)
+        _wait_idle(worker)
+        assert worker.take_frame(1) is None  # same pixels, nothing to hand off
+
+        worker.forget(1)
+        assert worker.take_frame(1).version == 1
+
+        controller.color = "red"
+        worker.request(1)
+        _wait_idle(worker)
+        assert worker.take_frame(1).version == 2
+
+        worker.request(1, password="bad")
+        _wait_idle(worker)
+        denied = worker.take_frame(1)
+        assert denied.image is None and denied.password == "bad"
+
+        # A repeated denial is handed off again rather than deduplicated
+        worker.request(1, password="bad")
+        _wait_idle(worker)
+        assert worker.take_frame(1).version == denied.version + 1
+    finally:
+        worker.shutdown()
+
+
+def test_render_worker_coalesces_in_flight_requests():
+    """UT-Cam-Render-Coalesce: one render per camera is in flight at a time."""
+    controller = FakeController()
+    slow = controller.get_camera_view
+
+    def slow_view(camera_id, password=None):
+        time.sleep(0.05)
+        return slow(camera_id, password)
+
+    controller.get_camera_view = slow_view
+    worker = CameraRenderWorker(controller, max_workers=2)
+    try:
+        assert worker.request(1)
+        assert not worker.request(1)
+        assert worker.request(2)
+        _wait_idle(worker)
+        assert controller.calls == 2
+    finally:
+        worker.shutdown()
+    assert not worker.request(1)
@@ -1,12 +1,18 @@
+import email
 import smtplib
+import socketserver
+import threading
+import time
 
 import pytest
 
 from safehome.configuration.configuration_manager import ConfigurationManager
+from safehome.configuration.notification_dispatcher import NotificationDispatcher
 from safehome.configuration.safehome_mode import SafeHomeMode
 from safehome.configuration.safety_zone import SafetyZone
 from safehome.configuration.storage_manager import StorageManager
 from safehome.configuration.system_settings import SystemSettings
+from safehome.device.clock import ManualClock
 
 
 @pytest.fixture(autouse=True)
@@ -194,3 +200,114 @@ def test_safety_zone_object_behaviors():
     assert zone.is_armed
     zone.disarm()
     assert not zone.is_armed
+
+
+class _SMTPStandIn(socketserver.ThreadingTCPServer):
+    """Minimal local SMTP server recording connections and messages."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=0):
+        self.connections = 0
+        self.messages = []
+        super().__init__(("127.0.0.1", port), _SMTPHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.connections += 1
+        self.wfile.write(b"220 localhost SMTP ready\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line.decode().strip().split(" ")[0].upper()
+            if verb == "EHLO":
+                self.wfile.write(b"250-localhost\r\n250 8BITMIME\r\n")
+            elif verb == "DATA":
+                self.wfile.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                data = []
+                for data_line in iter(self.rfile.readline, b".\r\n"):
+                    data.append(data_line)
+                self.server.messages.append(email.message_from_bytes(b"".join(data)))
+                self.wfile.write(b"250 OK\r\n")
+            elif verb == "QUIT":
+                self.wfile.write(b"221 Bye\r\n")
+                return
+            else:  # HELO, MAIL, RCPT, RSET, NOOP
+                self.wfile.write(b"250 OK\r\n")
+
+
+def _point_smtp_at(settings, port):
+    settings.smtp_host, settings.smtp_port = "127.0.0.1", port
+    settings.smtp_user, settings.smtp_password = "safehome@test", ""
+    settings.alert_email = "owner@test"
+
+
+def test_notification_dispatcher_digest_reuses_connection(config_mgr):
+    """UT-Conf-Notify-Digest: queued alerts go out as one digest per connection."""
+    server = _SMTPStandIn()
+    _point_smtp_at(config_mgr.settings, server.server_address[1])
+    dispatcher = NotificationDispatcher(
+        config_mgr.settings, config_mgr.storage, config_mgr.logger, digest_window=30
+    )
+    try:
+        for i in range(3):
+            assert dispatcher.notify(f"Alert {i}", f"Sensor {i} tripped")
+        # notify() only queues; the digest window holds delivery back
+        assert len(config_mgr.storage.get_notifications(status="PENDING")) == 3
+
+        assert dispatcher.flush(timeout=5)
+        assert len(server.messages) == 1
+        assert server.messages[0]["Subject"] == "SafeHome: 3 alerts"
+        assert "Sensor 2 tripped" in server.messages[0].get_payload()
+
+        dispatcher.notify("Alert 3", "Single alert")
+        assert dispatcher.flush(timeout=5)
+        assert server.messages[1]["Subject"] == "Alert 3"
+        assert server.connections == 1  # second send reused the connection
+        assert len(config_mgr.storage.get_notifications(status="SENT")) == 4
+    finally:
+        dispatcher.stop()
+        server.close()
+
+
+def test_notification_dispatcher_retries_after_restart(config_mgr):
+    """UT-Conf-Notify-Retry: failed alerts persist and are sent after a restart."""
+    server = _SMTPStandIn()
+    port = server.server_address[1]
+    server.close()  # nothing listening: delivery fails
+    _point_smtp_at(config_mgr.settings, port)
+    dispatcher = NotificationDispatcher(
+        config_mgr.settings, config_mgr.storage, digest_window=0
+    )
+    dispatcher.notify("Intrusion", "Front door opened")
+    assert dispatcher.flush(timeout=5)
+    dispatcher.stop()
+    (row,) = config_mgr.storage.get_notifications()
+    assert row["status"] == "PENDING"
+    assert row["attempts"] == 1 and row["last_error"]
+    assert row["next_attempt_at"] > time.time()  # backed off
+
+    server = _SMTPStandIn(port)
+
+    clock = ManualClock()
+    clock.advance(NotificationDispatcher.RETRY_DELAYS[0] + 1)  # backoff elapsed
+    restarted = NotificationDispatcher(
+        config_mgr.settings, config_mgr.storage, digest_window=0, clock=clock
+    )
+    try:
+        restarted.start()
+        assert restarted.flush(timeout=5)
+        assert [m["Subject"] for m in server.messages] == ["Intrusion"]
+        (row,) = config_mgr.storage.get_notifications()
+        assert row["status"] == "SENT"
+    finally:
+        restarted.stop()
+        server.close()
@@ -1,11 +1,17 @@
+import http.server
+import json
+import threading
 import time
 import types
 
 import pytest
 
 from safehome.configuration.storage_manager import StorageManager
+from safehome.core.monitoring import WebhookChannel
 from safehome.core.system import System
-from safehome.device.alarm.alarm import Alarm
+from safehome.device.alarm.alarm import Alarm, AlarmStage
+from safehome.device.alarm.scheduler import ManualScheduler
+from safehome.device.clock import AcceleratedClock, ManualClock
 from safehome.device.sensor.windoor_sensor import WindowDoorSensor
 
 
@@ -116,3 +122,366 @@ def test_start_entry_delay_countdown_triggers_after_delay(system):
     assert sys.alarm.is_active()
     sys.alarm.stop()
     sys.turn_off()
+
+
+class _MonitoringStandIn(http.server.ThreadingHTTPServer):
+    """Local HTTP monitoring endpoint; `delays` / `statuses` script each POST."""
+
+    daemon_threads = True
+
+    def __init__(self, delays=(), statuses=()):
+        self.delays, self.statuses = list(delays), list(statuses)
+        self.received = []
+        super().__init__(("127.0.0.1", 0), _MonitoringHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/alarm"
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _MonitoringHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        delay = server.delays.pop(0) if server.delays else 0
+        status = server.statuses.pop(0) if server.statuses else 200
+        time.sleep(delay)
+        server.received.append(json.loads(body))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_monitoring_channels_dispatch_concurrently(system):
+    """UT-System-Monitoring-Pipeline: slow channel does not delay others; hedging."""
+    slow = _MonitoringStandIn(delays=[1.0])  # first call hangs, hedge answers
+    fast = _MonitoringStandIn()
+    try:
+        system.monitoring.remove_channel("phone")
+        system.add_monitoring_channel(WebhookChannel(slow.url, hedge_after=0.1))
+        fast_channel = WebhookChannel(fast.url)
+        fast_channel.name = "gateway"
+        system.add_monitoring_channel(fast_channel)
+        sensor = WindowDoorSensor(3, "Porch")
+
+        detected_at = time.monotonic() - 0.5  # entry delay already elapsed
+        incident = system.call_monitoring_service(sensor, detected_at=detected_at)
+        assert incident.wait(timeout=5)
+        assert incident.acknowledged()
+        hooked, gateway = incident.results["webhook"], incident.results["gateway"]
+        assert hooked.ok and hooked.attempts == 2
+        assert hooked.dispatch_latency < 0.9  # hedged attempt won
+        assert gateway.ok and gateway.attempts == 1
+        assert gateway.latency >= 0.5  # measured from the sensor trigger
+        assert fast.received[0]["location"] == "Porch"
+        stats = system.get_monitoring_latency()
+        assert stats["gateway"]["count"] == 1
+        assert stats["gateway"]["p99_ms"] >= 500
+    finally:
+        slow.close()
+        fast.close()
+
+
+def test_monitoring_channel_retries_then_times_out(system):
+    """UT-System-Monitoring-Retry: 5xx is retried; unanswered channel times out."""
+    flaky = _MonitoringStandIn(statuses=[503])
+    dead = _MonitoringStandIn(delays=[2.0, 2.0])
+    try:
+        system.monitoring.channels = [
+            WebhookChannel(flaky.url, hedge_after=None, max_attempts=2)
+        ]
+        retried = system.monitoring.dispatch(
+            system.monitoring.create_alert("Hall", "Intrusion")
+        )
+        assert retried.wait(timeout=5)
+        assert retried.results["webhook"].ok
+        assert retried.results["webhook"].attempts == 2
+
+        system.monitoring.channels = [
+            WebhookChannel(dead.url, timeout=0.3, hedge_after=None, max_attempts=1)
+        ]
+        started = time.monotonic()
+        failed = system.monitoring.dispatch(
+            system.monitoring.create_alert("Hall", "Intrusion")
+        )
+        assert failed.wait(timeout=5)
+        assert time.monotonic() - started < 1.5
+        assert not failed.acknowledged()
+        assert "timed out" in failed.results["webhook"].error
+        logs = system.config.logger.get_recent_logs(5)
+        assert any("unreachable via webhook" in log.message for log in logs)
+    finally:
+        flaky.close()
+        dead.close()
+
+
+def test_alarm_stale_shutoff_does_not_silence_new_alarm():
+    """UT-Alarm-Generation: stop + re-ring ignores the old auto-shutoff timer."""
+    scheduler = ManualScheduler()
+    alarm = Alarm(duration=10, scheduler=scheduler)
+    first = alarm.ring()
+    scheduler.advance(5)
+    alarm.stop()
+    second = alarm.ring()
+    assert second == first + 1
+    assert alarm.ring() is None  # already ringing
+    scheduler.advance(6)  # first alarm's shutoff time has passed
+    assert alarm.is_active()
+    scheduler.advance(4)
+    assert not alarm.is_active()
+    assert scheduler.pending() == 0
+
+
+def test_alarm_escalation_stages():
+    """UT-Alarm-Escalation: chirp -> siren -> monitoring call on a fake clock."""
+    scheduler = ManualScheduler()
+    alarm = Alarm(
+        duration=60,
+        stages=[
+            AlarmStage("SIREN", 10),
+            AlarmStage("CHIRP"),
+            AlarmStage("MONITORING", 30, call_monitoring=True),
+        ],
+        scheduler=scheduler,
+    )
+    entered = []
+    alarm.on_stage = lambda stage, gen, ctx: entered.append((stage.name, gen, ctx))
+
+    generation = alarm.ring(context="Door")
+    assert alarm.get_state() == "CHIRP"
+    scheduler.advance(9.9)
+    assert alarm.get_state() == "CHIRP"
+    scheduler.advance(0.1)
+    assert alarm.get_state() == "SIREN"
+    scheduler.advance(20)
+    assert entered == [
+        ("CHIRP", generation, "Door"),
+        ("SIREN", generation, "Door"),
+        ("MONITORING", generation, "Door"),
+    ]
+    scheduler.advance(30)
+    assert alarm.get_state() == "IDLE"
+
+    # Stopping before an escalation cancels it
+    entered.clear()
+    alarm.ring()
+    alarm.stop()
+    scheduler.advance(100)
+    assert [name for name, _, _ in entered] == ["CHIRP"]
+    with pytest.raises(ValueError):
+        alarm.set_stages([AlarmStage("SIREN", 5)])
+
+
+def test_alarm_concurrent_ring_stop_transitions():
+    """UT-Alarm-ThreadSafe: concurrent ring/stop keeps transitions balanced."""
+    scheduler = ManualScheduler()
+    alarm = Alarm(duration=10, scheduler=scheduler)
+    transitions = []
+    alarm.on_state_change = transitions.append
+
+    def hammer():
+        for _ in range(200):
+            alarm.ring()
+            alarm.stop()
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not alarm.is_active()
+    assert transitions.count(True) == transitions.count(False) == alarm.generation
+    scheduler.advance(10)  # every shutoff timer was cancelled
+    assert transitions.count(False) == alarm.generation
+
+
+def test_system_alarm_stage_calls_monitoring(system):
+    """UT-System-Alarm-Stage: delayed monitoring stage reports the intrusion."""
+    scheduler = ManualScheduler()
+    system.alarm.scheduler = scheduler
+    system.alarm.set_stages(
+        [AlarmStage("CHIRP"), AlarmStage("SIREN", 30, call_monitoring=True)]
+    )
+    sensor = WindowDoorSensor(4, "Garage")
+    system._trigger_alarm(sensor)
+    assert system.wait_for_alarm_actions(timeout=5)
+    messages = [log.message for log in system.config.logger.get_recent_logs(5)]
+    assert not any("Calling monitoring service" in m for m in messages)
+
+    scheduler.advance(30)
+    # Logging and the monitoring call run off the scheduler thread
+    assert system.wait_for_alarm_actions(timeout=5)
+    messages = [log.message for log in system.config.logger.get_recent_logs(5)]
+    assert any("Calling monitoring service" in m for m in messages)
+    assert any("Alarm escalated to SIREN" in m for m in messages)
+    system.alarm.stop()
+
+
+def test_system_shutdown_cancels_pending_timers(system):
+    """UT-System-Shutdown-Timers: entry delays and alarm stages die with the system."""
+    scheduler = ManualScheduler()
+    system.scheduler = scheduler
+    system.alarm.scheduler = scheduler
+    system.alarm.set_stages([AlarmStage("CHIRP"), AlarmStage("SIREN", 30)])
+    system.config.settings.entry_delay = 10
+    system.turn_on(polling=False)
+    sensor = system.sensor_controller.add_sensor("WINDOOR", "Garage")
+    system._start_entry_delay_countdown(sensor)
+    system._trigger_alarm(WindowDoorSensor(5, "Porch"))
+    assert scheduler.pending() == 3  # entry delay, SIREN stage, shutoff
+    system.shutdown()
+    assert scheduler.pending() == 0
+    assert not system.alarm.is_active()
+
+
+def test_intrusion_trace_spans_critical_path(system):
+    """UT-System-Trace: one incident id carries every hop, sensor to monitoring."""
+    sensor = system.sensor_controller.add_sensor("WINDOOR", "Back Door")
+    sensor.arm()
+    system.config.settings.entry_delay = 0
+    system.poll_interval = 0.01
+    system.turn_on()
+    sensor.hardware.intrude()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        traces = system.tracer.get_traces()
+        if traces and traces[0].outcome == "alarm":
+            break
+        time.sleep(0.01)
+    sensor.hardware.release()
+    system.alarm.stop()
+
+    trace = traces[0]
+    assert trace.sensor_id == sensor.sensor_id and trace.outcome == "alarm"
+    stages = [span.stage for span in trace.spans]
+    assert stages == [
+        "intrude",
+        "detected",
+        "handled",
+        "log_persisted",
+        "entry_delay_elapsed",
+        "alarm_ring",
+        "monitoring_called",
+    ]
+    times = [span.at for span in trace.spans]
+    assert times == sorted(times)
+    breakdown = system.get_intrusion_latency()
+    assert breakdown["total"]["count"] >= 1
+    exported = json.loads(system.tracer.export_json())
+    assert exported["traces"][0]["incident_id"] == trace.incident_id
+    assert exported["traces"][0]["spans"][0]["offset_ms"] == 0
+
+
+def test_intrusion_trace_ignores_stale_trip_stamps(system):
+    """UT-System-Trace-Stale: a trip stamp is used by one detection only."""
+    sensor = system.sensor_controller.add_sensor("WINDOOR", "Side Door")
+    tracer = system.tracer
+    sensor.hardware.intrude()
+    tripped = sensor.hardware.intruded_at
+    first = tracer.start(sensor, detected_at=tripped + 1)
+    assert first.get_span("intrude").at == tripped
+    # Same stamp, later detection (e.g. re-armed while still open)
+    second = tracer.start(sensor, detected_at=tripped + 5)
+    assert second.get_span("intrude") is None
+    sensor.hardware.release()
+    assert sensor.hardware.intruded_at is None
+
+
+def test_intrusion_trace_cancelled_when_disarmed(system):
+    """UT-System-Trace-Cancel: disarming during the entry delay ends the trace."""
+    sensor = system.sensor_controller.add_sensor("MOTION", "Hall")
+    sensor.hardware.intruded_at = time.monotonic() + 60  # stale future stamp
+    system.config.settings.entry_delay = 0.05
+    system._handle_intrusion(sensor)
+    time.sleep(0.3)
+    trace = system.tracer.get_traces()[-1]
+    assert trace.outcome == "cancelled"
+    assert [span.stage for span in trace.spans] == [
+        "detected",
+        "handled",
+        "log_persisted",
+        "entry_delay_elapsed",
+    ]
+    assert "monitoring_called" not in system.tracer.stage_breakdown([trace])
+    assert "1 traces" in system.tracer.report([trace])
+
+
+def test_manual_clock_blocks_other_threads_until_advanced():
+    """UT-Clock-Manual: driver sleeps advance time; other threads wait for it."""
+    clock = ManualClock(start=100.0)
+    scheduler = ManualScheduler(clock=clock)
+    fired = []
+    scheduler.call_later(5, fired.append, "timer")
+    woke = threading.Event()
+    sleeper = threading.Thread(target=lambda: (clock.sleep(10), woke.set()))
+    sleeper.start()
+    assert not woke.wait(0.1)
+    clock.sleep(5)  # driver thread: advances and fires the timer
+    assert clock.now() == 105.0 and fired == ["timer"]
+    assert not woke.wait(0.1)
+    clock.advance(5)
+    assert woke.wait(1.0)
+    sleeper.join()
+
+    fast = AcceleratedClock(factor=1000)
+    started = time.monotonic()
+    fast.sleep(100)
+    assert time.monotonic() - started < 1.0
+    assert fast.now() >= 100
+
+
+def test_system_on_manual_clock_runs_virtual_time(tmp_path, monkeypatch):
+    """UT-System-Clock: reset, polling, entry delay and lockouts use the clock."""
+    monkeypatch.setattr(StorageManager, "CONFIG_FILE", str(tmp_path / "config.json"))
+    clock = ManualClock()
+    sys = System(db_path=str(tmp_path / "safehome.db"), lazy=True, clock=clock)
+    try:
+        assert sys.alarm.scheduler.clock is clock
+        started = time.monotonic()
+        sys.reset()
+        assert time.monotonic() - started < 1.0
+        assert clock.now() == 1.0
+
+        sys.config.settings.entry_delay = 300
+        sensor = sys.sensor_controller.add_sensor("WINDOOR", "Door")
+        sensor.arm()
+        sensor.simulate_open()
+        assert sensor.hardware.intruded_at == 1.0  # stamped on the System clock
+        clock.advance(sys.poll_interval)  # wakes the polling thread
+        deadline = time.monotonic() + 2.0
+        while not sys.tracer.get_traces() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sys._stop_sensor_polling()
+        trace = sys.tracer.get_traces()[0]
+        detected = trace.get_span("detected").at
+        assert detected in (1.0, 2.0)
+        assert trace.get_span("intrude").at == 1.0
+        clock.advance(detected + 299 - clock.now())
+        assert not sys.alarm.is_active()
+        clock.advance(1)
+        assert sys.alarm.is_active()
+        assert trace.get_span("entry_delay_elapsed").at == detected + 300
+        sys.alarm.stop()
+
+        for _ in range(sys.config.settings.max_login_attempts):
+            sys.login("admin", "wrong")
+        assert sys.config.login_manager.is_interface_locked("CONTROL_PANEL")
+        clock.advance(sys.config.settings.system_lock_time)
+        assert not sys.config.login_manager.is_interface_locked("CONTROL_PANEL")
+
+        camera = sys.camera_controller.add_camera("Cam", "Hall", password="1234")
+        for _ in range(camera.max_attempts):
+            camera.verify_password("0000")
+        assert camera.is_locked()
+        clock.advance(camera.lockout_seconds)
+        assert not camera.is_locked()
+    finally:
+        sys.shutdown()
@@ -0,0 +1,88 @@
+import pytest
+
+from safehome.configuration.safehome_mode import SafeHomeMode
+from safehome.configuration.storage_manager import StorageManager
+from safehome.core.event_bus import EventBus
+from safehome.core.system import System
+from safehome.device.clock import ManualClock
+
+
+@pytest.fixture
+def system(tmp_path, monkeypatch):
+    monkeypatch.setenv("SAFEHOME_HEADLESS", "1")
+    monkeypatch.setattr(StorageManager, "CONFIG_FILE", str(tmp_path / "config.json"))
+    sys = System(db_path=str(tmp_path / "safehome.db"))
+    yield sys
+    sys.shutdown()
+
+
+def test_event_bus_topic_filter_and_callback():
+    """UT-Events-Filter: subscribers only receive the topics they asked for."""
+    bus = EventBus()
+    received = []
+    bus.subscribe(callback=received.append, topics=["mode"])
+    queue = bus.subscribe(topics=["sensor"])
+
+    bus.publish("mode", {"mode": "AWAY"})
+    bus.publish("sensor", {"id": 1})
+
+    assert [e.data for e in received] == [{"mode": "AWAY"}]
+    assert [e.topic for e in queue.drain()] == ["sensor"]
+    queue.close()
+    assert bus.subscriber_count() == 1
+
+
+def test_event_bus_bounded_queue_drops_oldest():
+    """UT-Events-Bounded: a slow consumer loses the oldest events, not the bus."""
+    bus = EventBus()
+    sub = bus.subscribe(max_queue=2)
+    for n in range(5):
+        bus.publish("log", n)
+    assert [e.data for e in sub.drain()] == [3, 4]
+    assert sub.dropped == 3
+    assert sub.get(timeout=0.01) is None
+
+
+def test_event_bus_replay_after_last_seen():
+    """UT-Events-Replay: reconnecting subscribers resume after their last seq."""
+    bus = EventBus(history_size=10)
+    for n in range(4):
+        bus.publish("sensor" if n % 2 else "log", n)
+    sub = bus.subscribe(topics=["sensor"], replay_after=2)
+    assert [e.data for e in sub.drain()] == [3]
+    assert bus.get_last_seq() == 4
+
+
+def test_system_publishes_state_changes(system):
+    """UT-Events-System: sensor, mode, alarm and log changes reach subscribers."""
+    sub = system.subscribe()
+    sensor = system.sensor_controller.add_sensor("WINDOOR", "Front Door")
+    version = system.sensor_controller.state_version
+
+    sensor.simulate_open()
+    sensor.simulate_open()  # no change, no event
+    system.config.set_mode(SafeHomeMode.AWAY)
+    system.alarm.ring()
+    system.alarm.stop()
+
+    events = [(e.topic, e.data) for e in sub.drain()]
+    topics = [topic for topic, _ in events]
+    assert system.sensor_controller.state_version == version + 1
+    sensor_events = [data for topic, data in events if topic == "sensor"]
+    assert sensor_events[-1]["physical_state"] is True
+    assert ("mode", {"mode": "AWAY"}) in events
+    assert [data for topic, data in events if topic == "alarm"] == [
+        {"active": True},
+        {"active": False},
+    ]
+    assert "log" in topics
+
+
+def test_event_bus_stamps_events_with_its_clock():
+    """UT-EventBus-Clock: timestamps follow the bus clock's wall time."""
+    clock = ManualClock()
+    bus = EventBus(clock=clock)
+    first = bus.publish("sensor", {})
+    clock.advance(3600)
+    second = bus.publish("sensor", {})
+    assert second.timestamp - first.timestamp == 3600
@@ -0,0 +1,97 @@
+import json
+import time
+
+import pytest
+
+from safehome.configuration.safehome_mode import SafeHomeMode
+from safehome.configuration.storage_manager import StorageManager
+from safehome.core.system import System
+from safehome.device.clock import ManualClock
+from safehome.interface.tools.event_replay import EventRecorder, EventReplayer
+
+
+@pytest.fixture(autouse=True)
+def headless_env(monkeypatch):
+    monkeypatch.setenv("SAFEHOME_HEADLESS", "1")
+
+
+@pytest.fixture
+def make_system(tmp_path, monkeypatch):
+    monkeypatch.setattr(StorageManager, "CONFIG_FILE", str(tmp_path / "config.json"))
+    systems = []
+
+    def factory(name, **kwargs):
+        sys = System(db_path=str(tmp_path / f"{name}.db"), lazy=True, **kwargs)
+        systems.append(sys)
+        return sys
+
+    yield factory
+    for sys in systems:
+        sys.shutdown()
+
+
+def _record_session(system, path):
+    """Arm, log in, trip a door long enough for an entry delay of 300 s"""
+    door = system.sensor_controller.add_sensor("WINDOOR", "Front Door")
+    motion = system.sensor_controller.add_sensor("MOTION", "Hall")
+    clock = iter([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 400.0])
+    with EventRecorder(system, str(path), clock=lambda: next(clock)) as recorder:
+        system.login("admin", "9999")  # t=1
+        system.login("admin", system.config.settings.master_password)  # t=2
+        system.config.set_mode(SafeHomeMode.AWAY)  # t=3
+        door.arm()  # t=4
+        motion.arm()  # t=5
+        door.simulate_open()  # t=6
+        motion.simulate_motion()  # t=7
+        motion.simulate_clear()  # t=8
+    return recorder
+
+
+def test_recorder_writes_header_snapshot_and_events(make_system, tmp_path):
+    """UT-Replay-Record: header, t=0 snapshot, then offset-stamped events."""
+    system = make_system("recorded")
+    path = tmp_path / "session.jsonl"
+    recorder = _record_session(system, path)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[0]["kind"] == "header"
+    assert records[0]["entry_delay"] == system.config.settings.entry_delay
+    assert [r["kind"] for r in records[1:4]] == ["sensor", "sensor", "mode"]
+    assert all(r["t"] == 0.0 for r in records[1:4])
+    logins = [r for r in records if r["kind"] == "login"]
+    assert [(r["t"], r["result"]) for r in logins] == [
+        (1.0, "failure"),
+        (2.0, "success"),
+    ]
+    assert all("password" not in r for r in logins)
+    assert records[-1] == {"kind": "end", "t": 400.0}
+    assert recorder.count == len(records) - 2
+
+
+def test_replay_compresses_entry_delay_on_virtual_time(make_system, tmp_path):
+    """UT-Replay-Run: a 400 s session replays in well under a second."""
+    path = tmp_path / "session.jsonl"
+    _record_session(make_system("recorded"), path)
+
+    replay_system = make_system("replayed", clock=ManualClock())
+    started = time.perf_counter()
+    stats = EventReplayer.load(str(path)).replay(replay_system)
+    wall = time.perf_counter() - started
+
+    assert stats["virtual_s"] == pytest.approx(400.0)
+    assert wall < 5.0
+    assert stats["alarms"] == 1  # door stayed open past the 300 s entry delay
+    assert stats["detections"] > 0
+    assert replay_system.alarm.is_active()
+    assert replay_system.config.get_mode() == SafeHomeMode.AWAY
+    sensors = replay_system.sensor_controller.sensors.values()
+    assert {s.location for s in sensors} == {"Front Door", "Hall"}
+    assert replay_system.config.login_manager.get_failed_attempts("CONTROL_PANEL") == 0
+    replay_system.alarm.stop()
+
+
+def test_replay_requires_manual_clock(make_system, tmp_path):
+    """UT-Replay-Clock: real-time systems are rejected."""
+    path = tmp_path / "session.jsonl"
+    _record_session(make_system("recorded"), path)
+    with pytest.raises(ValueError):
+        EventReplayer.load(str(path)).replay(make_system("realtime"))
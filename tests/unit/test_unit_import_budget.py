@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+# Cumulative budget for `import safehome.core.system` (microseconds)
+IMPORT_BUDGET_US = 200_000
+
+GUI_AND_HEAVY_MODULES = ("tkinter", "PIL", "smtplib", "safehome.interface")
+
+
+def _importtime(module: str) -> dict:
+    """Run `python -X importtime -c "import <module>"` and parse cumulative times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def test_core_system_import_skips_gui_and_pillow():
+    """UT-Import-Isolation: headless System import loads no Tk/Pillow/GUI modules."""
+    timings = _importtime("safehome.core.system")
+    loaded = [
+        name
+        for name in timings
+        if any(
+            name == heavy or name.startswith(heavy + ".")
+            for heavy in GUI_AND_HEAVY_MODULES
+        )
+    ]
+    assert loaded == []
+
+
+def test_core_system_import_within_budget():
+    """UT-Import-Budget: `import safehome.core.system` stays within its budget."""
+    timings = _importtime("safehome.core.system")
+    assert timings["safehome.core.system"] < IMPORT_BUDGET_US
+
+
+def test_pillow_loaded_on_first_render():
+    """UT-Import-Pillow: camera construction defers decoding to the first frame."""
+    from safehome.device.camera.device_camera import DeviceCamera
+
+    cam = DeviceCamera()
+    try:
+        cam.set_id(1)
+        assert cam.imgSource is None
+        assert cam.get_view() is not None
+        assert cam.imgSource is not None
+    finally:
+        cam.stop()
@@ -0,0 +1,91 @@
+import random
+import threading
+
+import pytest
+
+from safehome.configuration.storage_manager import StorageManager
+from safehome.core.metrics import MetricsRegistry
+from safehome.core.system import System
+
+
+@pytest.fixture(autouse=True)
+def headless_env(monkeypatch):
+    """Avoid GUI popups in device layers."""
+    monkeypatch.setenv("SAFEHOME_HEADLESS", "1")
+
+
+@pytest.fixture
+def system(tmp_path, monkeypatch):
+    """Isolated System instance with temporary DB."""
+    monkeypatch.setattr(StorageManager, "CONFIG_FILE", str(tmp_path / "config.json"))
+    sys = System(db_path=str(tmp_path / "safehome.db"))
+    yield sys
+    sys.shutdown()
+
+
+def test_histogram_percentiles_within_bucket_error():
+    """UT-Metrics-Histogram: HDR-style percentiles stay within ~3% of exact."""
+    histogram = MetricsRegistry().histogram("latency_seconds")
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(-7, 1.5) for _ in range(50_000))
+    for value in values:
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == len(values)
+    assert snapshot["max"] == values[-1]
+    for pct in (50, 90, 99):
+        exact = values[int(pct / 100 * len(values)) - 1]
+        assert snapshot[f"p{pct}"] == pytest.approx(exact, rel=0.04, abs=1e-6)
+
+
+def test_counters_are_exact_across_threads():
+    """UT-Metrics-Counter: sharded counters lose no increments, incl. dead threads."""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits", route="a")
+    assert registry.counter("hits_total", route="a") is counter
+
+    def work():
+        for _ in range(5_000):
+            counter.inc()
+            registry.histogram("work_seconds").observe(0.001)
+
+    for _ in range(3):  # later rounds fold the finished threads' shards
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert counter.value == 3 * 8 * 5_000
+    assert registry.histogram("work_seconds").count == 3 * 8 * 5_000
+    with pytest.raises(ValueError):
+        registry.gauge("hits_total")
+
+
+def test_system_metrics_cover_subsystems(system):
+    """UT-Metrics-System: polling, logs, SQL, camera and login are instrumented."""
+    cam = system.camera_controller.add_camera("Front", "Porch")
+    system.camera_controller.get_camera_view(cam.camera_id)
+    system.sensor_controller.poll_sensors()
+    settings = system.config.settings
+    system.login("admin", settings.master_password, "CONTROL_PANEL")
+    for _ in range(settings.max_login_attempts):
+        system.login("admin", "bad", "CONTROL_PANEL")
+
+    metrics = system.get_metrics()
+    assert metrics["safehome_poll_duration_seconds"]["count"] == 1
+    assert metrics["safehome_poll_detections_total"] == 0
+    assert metrics["safehome_camera_render_seconds"]["count"] == 1
+    assert metrics['safehome_log_entries_total{level="INFO"}'] > 0
+    assert metrics["safehome_log_write_seconds"]["p99"] > 0
+    assert metrics['safehome_db_query_seconds{statement="INSERT event_logs"}']["count"]
+    attempts = 'safehome_login_attempts_total{interface="CONTROL_PANEL",result="%s"}'
+    assert metrics[attempts % "success"] == 1
+    assert metrics[attempts % "failure"] == settings.max_login_attempts
+    assert metrics['safehome_login_lockouts_total{interface="CONTROL_PANEL"}'] == 1
+    assert metrics["safehome_cameras"] == 1
+    assert metrics["safehome_threads"] >= 1
+
+    text = system.metrics.to_prometheus()
+    assert "# TYPE safehome_poll_duration_seconds histogram" in text
+    assert 'safehome_poll_duration_seconds_bucket{le="+Inf"} 1' in text
+    assert 'safehome_login_lockouts_total{interface="CONTROL_PANEL"} 1' in text
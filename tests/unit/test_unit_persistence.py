@@ -123,3 +123,44 @@ def test_storage_manager_check_db_and_json_errors(tmp_path):
     StorageManager.CONFIG_FILE = str(bad_json)
     with pytest.raises(json.JSONDecodeError):
         storage.load_settings_from_json()
+
+
+def test_db_profiler_disabled_by_default(db):
+    """UT-DB-Profile-Off: no profiler unless enabled; dump says so."""
+    assert db.profiler is None
+    db.add_event_log("INFO", "no profile")
+    assert "disabled" in db.dump_profile()
+
+
+def test_db_profiler_groups_statements_and_rows(db):
+    """UT-DB-Profile-Group: literals collapse; rows counted per statement."""
+    profiler = db.enable_profiling()
+    for i in range(3):
+        db.add_event_log("INFO", f"entry {i}", source="UT")
+    db.execute_query("SELECT * FROM event_logs WHERE log_id = 1", fetch_one=True)
+    db.execute_query("SELECT * FROM event_logs WHERE log_id = 2", fetch_one=True)
+    db.get_event_logs(limit=10)
+    stats = {s["statement"]: s for s in profiler.get_stats()}
+    assert stats["SELECT * FROM event_logs WHERE log_id = ?"]["count"] == 2
+    assert stats["SELECT * FROM event_logs WHERE log_id = ?"]["rows"] == 2
+    inserts = [s for name, s in stats.items() if name.startswith("INSERT")]
+    assert inserts[0]["count"] == 3 and inserts[0]["rows"] == 3
+    assert all(s["p99_ms"] <= s["max_ms"] for s in stats.values())
+    report = db.dump_profile(sort_by="count", limit=5)
+    assert "executions" in report and "event_logs" in report
+    assert db.disable_profiling() is profiler
+    assert db.profiler is None
+
+
+def test_db_profiler_slow_query_log(db, tmp_path):
+    """UT-DB-Profile-Slow: slow statements logged by shape, never params."""
+    slow_log = tmp_path / "slow.log"
+    profiler = db.enable_profiling(slow_threshold=0.0, slow_log_path=str(slow_log))
+    db.update_system_settings(master_password="secret-4321")
+    assert profiler.slow_queries
+    text = slow_log.read_text(encoding="utf-8")
+    assert "UPDATE system_settings" in text
+    assert "secret-4321" not in text
+    assert "slow statement" in profiler.report()
+    profiler.reset()
+    assert profiler.get_stats() == [] and not profiler.slow_queries
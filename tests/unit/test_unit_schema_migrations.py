@@ -0,0 +1,101 @@
+import sqlite3
+
+import pytest
+
+from safehome.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    mgr = DatabaseManager(db_path=str(tmp_path / "safehome.db"))
+    mgr.connect()
+    yield mgr
+    mgr.disconnect()
+
+
+def _latest_version():
+    return DatabaseManager.get_available_migrations()[-1][0]
+
+
+def test_fresh_database_applies_all_migrations(db):
+    """UT-DB-Migrate-Fresh: every numbered migration applied once and recorded."""
+    assert db.get_schema_version() == 0
+    applied = db.migrate()
+    assert applied == [m[0] for m in DatabaseManager.get_available_migrations()]
+    assert db.get_schema_version() == _latest_version()
+    rows = db.execute_query("SELECT version FROM schema_version", fetch_all=True)
+    assert len(rows) == len(applied)
+    assert db.get_system_settings()["master_password"] == "1234"
+
+
+def test_current_database_skips_scripts(db, monkeypatch):
+    """UT-DB-Migrate-FastPath: initialize_schema on a current DB reads no SQL."""
+    db.initialize_schema()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("migration re-applied")
+
+    monkeypatch.setattr(db, "_apply_migration", fail)
+    db.initialize_schema()
+    assert db.migrate() == []
+
+
+def test_legacy_unversioned_database_is_adopted(db):
+    """UT-DB-Migrate-Legacy: DB created by the old schema script upgrades cleanly."""
+    initial = DatabaseManager.get_available_migrations()[0][2]
+    db.connection.executescript(initial.read_text())
+    db.update_system_settings(master_password="4321")
+    assert db.get_schema_version() == 0
+
+    db.initialize_schema()
+    assert db.get_schema_version() == _latest_version()
+    assert db.get_system_settings()["master_password"] == "4321"
+
+
+def test_failed_migration_rolls_back(tmp_path, db, monkeypatch):
+    """UT-DB-Migrate-Rollback: a broken migration leaves no partial changes."""
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / "0001_base.sql").write_text(
+        "CREATE TABLE widgets (id INTEGER PRIMARY KEY);"
+    )
+    (migrations_dir / "0002_broken.sql").write_text(
+        "CREATE TABLE gadgets (id INTEGER PRIMARY KEY);\nNOT VALID SQL;"
+    )
+    (migrations_dir / "notes.txt").write_text("ignored")
+    monkeypatch.setattr(DatabaseManager, "MIGRATIONS_DIR", migrations_dir)
+
+    with pytest.raises(sqlite3.Error):
+        db.migrate()
+
+    assert db.get_schema_version() == 1
+    tables = {
+        r["name"]
+        for r in db.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'table'", fetch_all=True
+        )
+    }
+    assert "widgets" in tables
+    assert "gadgets" not in tables
+
+
+def test_migrate_to_target_version(tmp_path, db, monkeypatch):
+    """UT-DB-Migrate-Target: migrations stop at target_version."""
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    for version in (1, 2, 10):
+        (migrations_dir / f"{version:04d}_step{version}.sql").write_text(
+            f"CREATE TABLE t{version} (id INTEGER);"
+        )
+    monkeypatch.setattr(DatabaseManager, "MIGRATIONS_DIR", migrations_dir)
+
+    assert db.migrate(target_version=2) == [1, 2]
+    assert db.migrate() == [10]
+    assert db.get_schema_version() == 10
+
+
+def test_missing_migrations_dir_raises(tmp_path, db, monkeypatch):
+    """UT-DB-Migrate-Missing: absent migrations directory is reported."""
+    monkeypatch.setattr(DatabaseManager, "MIGRATIONS_DIR", tmp_path / "nope")
+    with pytest.raises(FileNotFoundError):
+        db.initialize_schema()
@@ -1,9 +1,11 @@
+import threading
 import time
 
 import pytest
 
 from safehome.configuration.login_manager import LoginManager
 from safehome.configuration.safehome_mode import SafeHomeMode
+from safehome.configuration.session_audit import SessionAuditWriter
 from safehome.configuration.storage_manager import StorageManager
 from safehome.configuration.system_settings import SystemSettings
 from safehome.core.system import System
@@ -113,6 +115,142 @@ def test_login_manager_locked_and_unknown_interface():
     assert lm.validate_credentials("u", "p", "UNKNOWN") is False
 
 
+def _hammer(attempt, count=10000, threads=20):
+    """Run attempt(i) count times spread over many threads; return results"""
+    results = [None] * count
+
+    def worker(offset):
+        for i in range(offset, count, threads):
+            results[i] = attempt(i)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return results
+
+
+def test_login_rate_limit_is_exact_under_concurrency():
+    """UT-Login-RateLimit: 10k concurrent attempts spend exactly the burst."""
+    now = [100.0]
+    lm = LoginManager(SystemSettings(), clock=lambda: now[0])
+    threads_before = threading.active_count()
+
+    results = _hammer(
+        lambda i: lm.validate_credentials(f"user{i % 50}", "webpass1:webpass2", "WEB")
+    )
+    assert results.count(True) == LoginManager.INTERFACE_BURST
+    assert threading.active_count() == threads_before
+
+    # One user cannot drain the interface budget on their own
+    now[0] += 60
+    accepted = [
+        lm.validate_credentials("mallory", "webpass1:webpass2", "WEB")
+        for _ in range(LoginManager.USER_BURST + 5)
+    ]
+    assert accepted.count(True) == LoginManager.USER_BURST
+    assert lm.validate_credentials("alice", "webpass1:webpass2", "WEB")
+    now[0] += 1 / LoginManager.USER_RATE
+    assert lm.validate_credentials("mallory", "webpass1:webpass2", "WEB")
+
+
+def test_login_lockout_expires_without_timer_threads():
+    """UT-Login-LockExpiry: concurrent failures lock once; expiry is a timestamp."""
+    now = [0.0]
+    lm = LoginManager(
+        SystemSettings(max_login_attempts=3, system_lock_time=300),
+        clock=lambda: now[0],
+    )
+    lm.user_limiter.capacity = lm.interface_limiter.capacity = 10**6
+    threads_before = threading.active_count()
+
+    results = _hammer(lambda i: lm.validate_credentials("admin", "bad"))
+    assert not any(results)
+    assert lm.get_failed_attempts("CONTROL_PANEL") == 3
+    assert lm.is_interface_locked("CONTROL_PANEL")
+    assert threading.active_count() == threads_before
+    assert lm.get_lock_remaining("CONTROL_PANEL") == 300
+
+    now[0] = 299.9
+    assert not lm.validate_credentials("admin", "1234")
+    now[0] = 300.0
+    assert not lm.is_interface_locked("CONTROL_PANEL")
+    assert lm.validate_credentials("admin", "1234")
+
+
+def test_login_audit_rows_are_batched(system):
+    """UT-Login-AuditBatch: async audit rows are written in batches on flush."""
+    lm = system.config.login_manager
+    lm.user_limiter.capacity = lm.interface_limiter.capacity = 10**6
+    _hammer(lambda i: lm.validate_credentials("u", "webpass1:webpass2", "WEB"), 1000)
+    assert lm.flush_audit(timeout=5)
+
+    rows = system.config.db_manager.execute_query(
+        "SELECT login_timestamp FROM login_sessions WHERE interface_type = 'WEB'",
+        fetch_all=True,
+    )
+    assert len(rows) == 1000 and all(row["login_timestamp"] for row in rows)
+    assert lm._audit_writer.batches_written < 100
+
+
+def test_session_audit_writer_full_queue_writes_inline():
+    """UT-Login-AuditQueue: a full queue falls back to a caller-side write."""
+    written, release = [], threading.Event()
+
+    def slow_write(rows):
+        if threading.current_thread().name == "session-audit":
+            release.wait(5)
+        written.extend(rows)
+
+    writer = SessionAuditWriter(slow_write, max_queue=2, flush_interval=0)
+    for n in range(6):
+        writer.submit((n,))
+        if n == 0:
+            time.sleep(0.05)  # writer thread is now blocked on row 0
+    release.set()
+    writer.close()
+    assert sorted(written) == [(n,) for n in range(6)]
+    assert writer.inline_writes >= 1
+
+
+def test_login_sessions_slide_expire_and_persist_logout(system):
+    """UT-Login-Session: sliding TTL, LRU bound and logout_timestamp rows."""
+    now = [0.0]
+    lm = LoginManager(
+        system.config.settings,
+        storage_manager=system.config.storage,
+        clock=lambda: now[0],
+    )
+    lm.sessions.max_sessions = 2
+    password = "webpass1:webpass2"
+    assert lm.create_session("u", "bad:pass") is None
+
+    first = lm.create_session("a", password)
+    now[0] = lm.SESSION_TTL - 1
+    assert lm.validate_session(first, "WEB").user_id == "a"  # slides expiry
+    assert lm.validate_session(first, "CONTROL_PANEL") is None
+    now[0] = lm.SESSION_TTL + 10
+    assert lm.validate_session(first) is not None
+
+    second = lm.create_session("b", password)
+    third = lm.create_session("c", password)  # evicts the LRU session
+    assert lm.validate_session(first) is None and len(lm.sessions) == 2
+
+    now[0] += lm.SESSION_TTL  # both expire; evicted in bulk on next miss
+    assert lm.validate_session(second) is None
+    assert len(lm.sessions) == 0
+    assert not lm.end_session(third)
+
+    rows = system.config.db_manager.execute_query(
+        "SELECT username, logout_timestamp FROM login_sessions "
+        "WHERE login_successful = 1 ORDER BY session_id",
+        fetch_all=True,
+    )
+    assert [row["username"] for row in rows] == ["a", "b", "c"]
+    assert all(row["logout_timestamp"] for row in rows)
+
+
 def test_login_manager_log_session(monkeypatch):
     """UT-Login-LogSession: DB insert path executes."""
     calls = {}
@@ -132,7 +270,7 @@ def test_login_manager_log_session(monkeypatch):
             self.db = FakeDB()
 
     storage = FakeStorage()
-    lm = LoginManager(SystemSettings(), storage_manager=storage)
+    lm = LoginManager(SystemSettings(), storage_manager=storage, audit_guarantee="sync")
     lm._log_session("CONTROL_PANEL", "admin", True)
     assert storage.db.queries
 
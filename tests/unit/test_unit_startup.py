@@ -0,0 +1,210 @@
+import pytest
+
+from safehome.configuration.log_manager import LogManager
+from safehome.configuration.storage_manager import StorageManager
+from safehome.core.startup_profiler import StartupProfiler
+from safehome.core.system import System
+from safehome.database.db_manager import DatabaseManager
+
+
+@pytest.fixture(autouse=True)
+def headless_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("SAFEHOME_HEADLESS", "1")
+    monkeypatch.setattr(StorageManager, "CONFIG_FILE", str(tmp_path / "config.json"))
+
+
+@pytest.fixture
+def warm_db(tmp_path):
+    """A database that already holds cameras, sensors and logs."""
+    db_path = str(tmp_path / "safehome.db")
+    system = System(db_path=db_path)
+    system.sensor_controller.add_sensor("WINDOOR", "Front Door")
+    system.camera_controller.add_camera("Cam", "Hall")
+    system.config.logger.add_log("history entry", source="UT")
+    system.shutdown()
+    return db_path
+
+
+def test_startup_profiler_phases_and_report():
+    """UT-Startup-Profiler: phases timed in start order, nested names indented."""
+    ticks = iter([0.0, 1.0, 1.5, 2.0, 2.25, 3.0])
+    profiler = StartupProfiler(clock=lambda: next(ticks))
+    with profiler.phase("config"):
+        with profiler.phase("config.schema"):
+            pass
+    profiler.finish()
+
+    timings = profiler.get_timings()
+    assert list(timings) == ["config", "config.schema"]
+    assert timings["config"] == pytest.approx(1250.0)
+    assert timings["config.schema"] == pytest.approx(500.0)
+    assert profiler.get_total_ms() == pytest.approx(3000.0)
+    report = profiler.report()
+    assert "    config.schema" in report
+    assert "total" in report
+
+
+def test_system_records_startup_phases(warm_db):
+    """UT-Startup-System: System() exposes per-phase timings."""
+    system = System(db_path=warm_db)
+    try:
+        timings = system.startup_profiler.get_timings()
+        for name in ("config", "config.schema", "load_sensors", "load_cameras"):
+            assert name in timings
+        assert "load_cameras" in system.get_startup_report()
+    finally:
+        system.shutdown()
+
+
+def test_lazy_system_defers_camera_hardware(warm_db):
+    """UT-Startup-Lazy-Camera: hardware thread starts on first camera use."""
+    system = System(db_path=warm_db, lazy=True)
+    try:
+        camera = system.camera_controller.get_camera(1)
+        assert camera._hardware is None
+        assert camera.get_status()["zoom_level"] == 2
+        assert camera.get_view() is not None
+        assert camera._hardware is not None
+    finally:
+        system.shutdown()
+
+
+def test_lazy_system_defers_zones_and_modes(tmp_path):
+    """UT-Startup-Lazy-Zones: default zones and modes load on first access."""
+    system = System(db_path=str(tmp_path / "fresh.db"), lazy=True)
+    try:
+        assert system.config.storage.load_all_safety_zones() == []
+        names = [z.name for z in system.config.get_all_zones()]
+        assert names == ["Living Room", "Bedroom"]
+        assert "AWAY" in system.config.modes
+    finally:
+        system.shutdown()
+
+
+def test_lazy_log_preload_keeps_history_order(warm_db):
+    """UT-Startup-Lazy-Logs: history loads once, before this session's logs."""
+    db = DatabaseManager(warm_db)
+    db.connect()
+    try:
+        logger = LogManager(StorageManager(db), lazy=True)
+        logger.add_log("session entry", source="UT")
+        messages = [log.message for log in logger.get_all_logs()]
+        assert messages[-1] == "session entry"
+        assert messages.count("session entry") == 1
+        assert "history entry" in messages
+    finally:
+        db.disconnect()
+
+
+def test_lazy_startup_defers_work(warm_db):
+    """UT-Startup-Deferred: lazy System() skips camera hardware, zones and modes."""
+    system = System(db_path=warm_db, lazy=True)
+    try:
+        timings = system.startup_profiler.get_timings()
+        assert "config.zones" not in timings
+        assert "config.modes" not in timings
+        cameras = system.camera_controller.get_all_cameras()
+        assert cameras and all(camera._hardware is None for camera in cameras)
+    finally:
+        system.shutdown()
+
+
+def test_lazy_turn_on_leaves_unmapped_cameras_idle(warm_db):
+    """UT-Startup-Lazy-Clips: clip capture does not start unmapped cameras."""
+    system = System(db_path=warm_db, lazy=True)
+    try:
+        system.turn_on(polling=False)
+        system.clip_recorder.capture_once()
+        camera = system.camera_controller.get_camera(1)
+        assert camera.zone_id is None and camera._hardware is None
+    finally:
+        system.shutdown()
+
+
+def test_lazy_camera_hardware_starts_once(monkeypatch):
+    """UT-Startup-Lazy-Race: concurrent first use creates one DeviceCamera."""
+    import threading
+
+    from safehome.device.camera import safehome_camera
+
+    created = []
+    gate = threading.Barrier(8)
+
+    class CountingDevice:
+        def __init__(self, clock=None):
+            created.append(self)
+
+        def set_id(self, camera_id):
+            pass
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(safehome_camera, "DeviceCamera", CountingDevice)
+    camera = safehome_camera.SafeHomeCamera(1, "Cam", "Hall", lazy=True)
+    seen = []
+
+    def use():
+        gate.wait()
+        seen.append(camera.hardware)
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert all(hardware is created[0] for hardware in seen)
+
+
+def test_db_batch_defers_commit_and_rolls_back(tmp_path):
+    """UT-DB-Batch: commit() is deferred inside batch(); errors roll back."""
+    db = DatabaseManager(str(tmp_path / "batch.db"))
+    db.connect()
+    db.initialize_schema()
+    try:
+        with db.batch():
+            db.add_event_log("INFO", "kept")
+            with db.batch():
+                db.add_event_log("INFO", "nested")
+            assert db.connection.in_transaction
+        assert not db.connection.in_transaction
+
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.add_event_log("INFO", "discarded")
+                raise RuntimeError("boom")
+        messages = [r["event_message"] for r in db.get_event_logs(limit=10)]
+        assert "kept" in messages and "nested" in messages
+        assert "discarded" not in messages
+    finally:
+        db.disconnect()
+
+
+def test_db_batch_isolates_other_threads(tmp_path):
+    """UT-DB-Batch-Threads: other threads' writes neither join nor die with a batch."""
+    import threading
+
+    db = DatabaseManager(str(tmp_path / "batch.db"))
+    db.connect()
+    db.initialize_schema()
+    entered = threading.Event()
+    writer = threading.Thread(
+        target=lambda: (entered.wait(), db.add_event_log("INFO", "other thread"))
+    )
+    writer.start()
+    try:
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.add_event_log("INFO", "discarded")
+                entered.set()
+                writer.join(timeout=0.2)
+                # The other thread waits for the batch instead of joining it
+                assert writer.is_alive()
+                raise RuntimeError("boom")
+        writer.join(timeout=5)
+        messages = [r["event_message"] for r in db.get_event_logs(limit=10)]
+        assert "other thread" in messages
+        assert "discarded" not in messages
+    finally:
+        db.disconnect()
@@ -1,3 +1,5 @@
+import io
+import threading
 import time
 
 import pytest
@@ -5,10 +7,20 @@ from PIL import Image
 
 from safehome.configuration.configuration_manager import ConfigurationManager
 from safehome.configuration.storage_manager import StorageManager
+from safehome.device.camera import camera_render
 from safehome.device.camera.camera_controller import CameraController
+from safehome.device.camera.clip_recorder import ClipRecorder
 from safehome.device.camera.device_camera import DeviceCamera
+from safehome.device.camera.frame_buffer import FrameRingBuffer
 from safehome.device.camera.interface_camera import InterfaceCamera
+from safehome.device.camera.motion_analytics import (
+    MotionAnalytics,
+    motion_score,
+    prepare_frame,
+)
 from safehome.device.camera.safehome_camera import SafeHomeCamera
+from safehome.device.clock import ManualClock
+from safehome.device.sensor.sensor_controller import SensorController
 
 
 @pytest.fixture(autouse=True)
@@ -247,3 +259,211 @@ def test_device_camera_crop_failure(monkeypatch):
     view = cam.get_view()
     assert view is not None
     cam.stop()
+
+
+def test_camera_stream_shares_one_encoder(camera_controller):
+    """UT-Cam-Stream: viewers share one producer that stops when they leave."""
+    cam = camera_controller.add_camera("Lab", "Lab")
+    renders = []
+    real_get_view = cam.get_view
+    cam.get_view = lambda: renders.append(1) or real_get_view()
+
+    viewers = [camera_controller.open_stream(cam.camera_id) for _ in range(3)]
+    frames = [v.next_frame(timeout=2) for v in viewers]
+    assert frames[0][:2] == b"\xff\xd8"  # JPEG SOI marker
+    assert frames[0] == frames[1] == frames[2]
+
+    stream = camera_controller.get_stream(cam.camera_id)
+    assert stream.get_viewer_count() == 3
+    assert stream.frames_encoded == len(renders)
+    for viewer in viewers:
+        viewer.close()
+    deadline = time.time() + 2
+    while stream.is_running() and time.time() < deadline:
+        time.sleep(0.01)
+    assert not stream.is_running()
+
+
+def test_camera_stream_requires_password(camera_controller):
+    """UT-Cam-Stream-Pwd: protected cameras only stream with the password."""
+    cam = camera_controller.add_camera("Safe", "Vault", password="pw")
+    assert camera_controller.open_stream(cam.camera_id) is None
+    with camera_controller.open_stream(cam.camera_id, "pw") as viewer:
+        assert viewer.next_frame(timeout=2) is not None
+
+
+def test_render_all_matches_in_process_views(camera_controller):
+    """UT-Cam-RenderAll: pooled renders match get_view and honor passwords."""
+    open_cam = camera_controller.add_camera("Open", "Hall")
+    locked = camera_controller.add_camera("Locked", "Vault", password="pw")
+    off = camera_controller.add_camera("Off", "Attic")
+    off.disable()
+
+    frames = camera_controller.render_all(image_format="RAW", max_workers=1)
+    assert set(frames) == {open_cam.camera_id}
+    assert frames[open_cam.camera_id] == open_cam.get_view().tobytes()
+
+    frames = camera_controller.render_all(
+        size=(100, 75), passwords={locked.camera_id: "pw"}
+    )
+    assert set(frames) == {open_cam.camera_id, locked.camera_id}
+    assert Image.open(io.BytesIO(frames[locked.camera_id])).size == (100, 75)
+
+
+def test_frame_ring_buffer_evicts_oldest_by_bytes():
+    """UT-Cam-FrameBuffer: buffer stays within its byte bound, oldest out first."""
+    buffer = FrameRingBuffer(max_bytes=10)
+    for ts in range(4):
+        buffer.append(float(ts), b"abcd")
+    assert [ts for ts, _ in buffer.get_frames()] == [2.0, 3.0]
+    assert buffer.get_total_bytes() == 8
+    buffer.append(9.0, b"x" * 11)  # larger than the whole buffer: skipped
+    assert len(buffer) == 2
+    assert [ts for ts, _ in buffer.get_frames(start=2.5)] == [3.0]
+
+
+def test_clip_recorder_writes_intrusion_clip(camera_controller, tmp_path):
+    """UT-Cam-Clip: intrusion clips pre/post frames off-thread and indexes them."""
+    hall = camera_controller.add_camera("Hall", "Hallway", zone_id=1)
+    yard = camera_controller.add_camera("Yard", "Garden")
+    clock = ManualClock(start=1000.0)
+    recorder = ClipRecorder(
+        camera_controller,
+        storage=camera_controller.storage,
+        clip_dir=str(tmp_path / "clips"),
+        pre_seconds=2,
+        post_seconds=0.2,
+        clock=clock,
+        logger=camera_controller.logger,
+    )
+    written_on = []
+    real_write = recorder._write_clip
+    recorder._write_clip = lambda job: (
+        written_on.append(threading.current_thread()) or real_write(job)
+    )
+
+    # Only zone-mapped cameras are captured until a clip asks for another
+    assert recorder.get_watched_cameras() == [hall]
+    recorder.capture_once(997.0)  # outside the pre-event window
+    recorder.capture_once(999.0)
+    assert len(yard.frame_buffer) == 0
+    log_id = camera_controller.logger.add_log("INTRUSION DETECTED at hallway")
+    jobs = recorder.on_intrusion(None, "hallway", log_id=log_id)
+    assert [job.camera for job in jobs] == [hall]
+    # Cooldown: a second trigger does not start another clip
+    assert recorder.on_intrusion(None, "Hallway") == []
+
+    recorder.capture_once(1000.1)
+    clock.advance(0.3)
+    assert jobs[0].done.wait(timeout=5)
+
+    # A location-only camera is buffered from its first clip request on
+    assert [job.camera for job in recorder.on_intrusion(None, "garden")] == [yard]
+    assert recorder.capture_once() == 2
+    warnings = [
+        log
+        for log in camera_controller.logger.get_all_logs()
+        if log.source == "ClipRecorder" and log.level == "WARNING"
+    ]
+    assert [f"Camera {yard.camera_id} " in log.message for log in warnings] == [True]
+    recorder.stop()
+
+    assert written_on and written_on[0] is not threading.current_thread()
+    clips = camera_controller.storage.get_camera_clips(log_id=log_id)
+    assert len(clips) == 1
+    assert clips[0]["camera_id"] == hall.camera_id
+    assert clips[0]["frame_count"] == 2
+    data = (tmp_path / "clips" / clips[0]["file_path"].split("/")[-1]).read_bytes()
+    assert data.startswith(b"\xff\xd8") and len(data) == clips[0]["size_bytes"]
+
+
+def test_motion_analytics_publishes_camera_sensor(camera_controller):
+    """UT-Cam-Motion: frame differencing drives a per-camera virtual sensor."""
+    sensors = SensorController(
+        storage_manager=camera_controller.storage, logger=camera_controller.logger
+    )
+    hall = camera_controller.add_camera("Hall", "Hallway")
+    yard = camera_controller.add_camera("Yard", "Garden")
+    analytics = MotionAnalytics(
+        camera_controller, sensors, clear_frames=2, backend="pillow"
+    )
+    analytics.set_threshold(yard.camera_id, 1.1)  # never triggers
+
+    assert analytics.analyse_once() == {}  # first frames only prime the diff
+    scores = analytics.analyse_once()
+    assert scores[hall.camera_id] < analytics.get_threshold(hall.camera_id)
+
+    hall.pan_right()
+    yard.pan_right()
+    scores = analytics.analyse_once()
+    assert scores[hall.camera_id] >= analytics.default_threshold
+    hall_sensor = sensors.add_camera_motion_sensor(hall.camera_id, "Hallway")
+    yard_sensor = sensors.add_camera_motion_sensor(yard.camera_id, "Garden")
+    assert hall_sensor.is_motion_detected()
+    assert not yard_sensor.is_motion_detected()
+
+    hall_sensor.arm()
+    assert (hall_sensor.sensor_id, hall_sensor) in sensors.poll_sensors()
+    analytics.analyse_once()
+    assert hall_sensor.is_motion_detected()  # one quiet frame is not enough
+    analytics.analyse_once()
+    assert not hall_sensor.is_motion_detected()
+
+    # Stored virtual sensors are rebound to their camera after a restart
+    reloaded = SensorController(storage_manager=camera_controller.storage)
+    reloaded.load_sensors_from_storage()
+    again = reloaded.add_camera_motion_sensor(hall.camera_id, "Hallway")
+    assert again.sensor_id == hall_sensor.sensor_id
+
+
+def test_motion_analytics_resolves_camera_sensor_once(camera_controller):
+    """UT-Cam-Motion-Cache: each camera's sensor is looked up once, not per frame."""
+    sensors = SensorController(storage_manager=camera_controller.storage)
+    hall = camera_controller.add_camera("Hall", "Hallway")
+    analytics = MotionAnalytics(camera_controller, sensors, backend="pillow")
+    calls = []
+    add_sensor = sensors.add_camera_motion_sensor
+
+    def counting_add(*args, **kwargs):
+        calls.append(args)
+        return add_sensor(*args, **kwargs)
+
+    sensors.add_camera_motion_sensor = counting_add
+    for _ in range(4):
+        analytics.analyse_once()
+    assert len(calls) == 1
+    analytics.forget(hall.camera_id)
+    analytics.analyse_once()  # primes the diff again
+    analytics.analyse_once()
+    assert len(calls) == 2
+
+
+def test_motion_score_numpy_matches_pillow():
+    """UT-Cam-Motion-NumPy: vectorized NumPy score equals the Pillow score."""
+    pytest.importorskip("numpy")
+    before = Image.new("RGB", (64, 64), "black")
+    after = before.copy()
+    after.paste((200, 200, 200), (0, 0, 32, 16))
+    scores = [
+        motion_score(
+            prepare_frame(before, 4, backend), prepare_frame(after, 4, backend)
+        )
+        for backend in ("numpy", "pillow")
+    ]
+    assert scores[0] == scores[1] == 0.125
+
+
+def test_overlay_cache_matches_direct_drawing():
+    """UT-Cam-Overlay: cached overlay badges render identical views."""
+    from PIL import ImageFont
+
+    font = ImageFont.load_default()
+    source = Image.new("RGB", (400, 400), "white")
+    camera_render.clear_overlay_cache()
+    for time_, pan, tilt, zoom in [(5, 0, 0, 2), (42, -3, 2, 9), (5, 0, 0, 2)]:
+        cached = camera_render.compose_view(source, time_, pan, tilt, zoom, font)
+        direct = camera_render.compose_view(
+            source, time_, pan, tilt, zoom, font, overlay_cache=False
+        )
+        assert cached.tobytes() == direct.tobytes()
+    assert len(camera_render._overlay_cache) == 2
@@ -0,0 +1,100 @@
+from safehome.interface.table_model import ReconcilingTable
+
+
+class FakeTree:
+    """Minimal Treeview stand-in recording every mutation."""
+
+    def __init__(self, preexisting=()):
+        self.items = {iid: None for iid in preexisting}
+        self.order = list(preexisting)
+        self.ops = []
+
+    def get_children(self, item=""):
+        return tuple(self.order)
+
+    def insert(self, parent, index, iid=None, values=()):
+        self.ops.append(("insert", iid))
+        self.items[iid] = values
+        self.order.insert(len(self.order) if index == "end" else index, iid)
+        return iid
+
+    def item(self, iid, values=None):
+        self.ops.append(("item", iid))
+        self.items[iid] = values
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.ops.append(("delete", iid))
+            self.items.pop(iid)
+            self.order.remove(iid)
+
+    def move(self, iid, parent, index):
+        self.ops.append(("move", iid))
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+
+def test_table_sync_touches_only_changed_rows():
+    """UT-Table-Diff: inserts, updates and removals are applied per key."""
+    tree = FakeTree(preexisting=["legacy"])
+    table = ReconcilingTable(tree)
+    assert table.sync([(1, ("a",)), (2, ("b",)), (3, ("c",))], version=1)
+    assert tree.order == ["1", "2", "3"]
+
+    tree.ops.clear()
+    table.sync([(1, ("a",)), (2, ("B",)), (4, ("d",))], version=2)
+    assert sorted(tree.ops) == [("delete", "3"), ("insert", "4"), ("item", "2")]
+    assert tree.order == ["1", "2", "4"]
+    assert tree.items["2"] == ("B",)
+
+
+def test_table_sync_skips_unchanged_version():
+    """UT-Table-Version: an unchanged state version is a no-op."""
+    tree = FakeTree()
+    table = ReconcilingTable(tree)
+    table.sync([(1, ("a",))], version=5)
+    tree.ops.clear()
+    assert not table.sync([(1, ("changed",))], version=5)
+    assert tree.ops == []
+    table.invalidate()
+    assert table.sync([(1, ("changed",))], version=5)
+    assert tree.ops == [("item", "1")]
+
+
+def test_table_sync_reorders_rows():
+    """UT-Table-Order: rows follow the order of the source."""
+    tree = FakeTree()
+    table = ReconcilingTable(tree)
+    table.sync([(1, ("a",)), (2, ("b",)), (3, ("c",))])
+    table.sync([(3, ("c",)), (1, ("a",)), (2, ("b",))])
+    assert tree.order == ["3", "1", "2"]
+    assert len(table) == 3
+
+
+def test_sensor_zone_change_bumps_state_version():
+    """UT-Table-Zone: reassigning a sensor's zone counts as a state change."""
+    from safehome.device.sensor.sensor_controller import SensorController
+
+    controller = SensorController()
+    sensor = controller.add_sensor("WINDOOR", "Door")
+    version = controller.state_version
+    sensor.set_zone_id(2)
+    sensor.set_zone_id(2)
+    assert controller.state_version == version + 1
+
+
+def test_sensor_table_keys_rows_by_sensor_id():
+    """UT-Table-Sensors: for_sensors syncs a controller's sensors in ID order."""
+    from safehome.device.sensor.sensor_controller import SensorController
+
+    controller = SensorController()
+    controller.add_sensor("WINDOOR", "Door")
+    controller.add_sensor("MOTION", "Hall")
+    tree = FakeTree()
+    table = ReconcilingTable.for_sensors(tree, lambda s: (s.location,))
+    assert table.sync_sensors(controller)
+    assert tree.order == ["1", "2"] and tree.items["2"] == ("Hall",)
+    assert not table.sync_sensors(controller)  # state version unchanged
+
+    assert ReconcilingTable.for_sensors(tree, table.row, table) is table
+    assert ReconcilingTable.for_sensors(FakeTree(), table.row, table) is not table